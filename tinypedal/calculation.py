@@ -630,13 +630,106 @@ def svg_view_box(coords: Sequence[CoordXY], margin: int = 0) -> str:
     return f"{x1:.4f} {y1:.4f} {x2:.4f} {y2:.4f}"
 
 
-def skip_map_nodes(total: int, limit: int, detail_level: int) -> int:
-    """Skip map nodes"""
-    if detail_level <= 0:
-        skip_node = 0
-    else:
-        skip_node = total // limit + (detail_level - 1)
-    return skip_node
+def map_significance(
+    coords: Sequence[CoordXY], breaks: Sequence[int] = (), vertical: bool = False
+) -> list[float]:
+    """Map nodes significance (Ramer-Douglas-Peucker)
+
+    Significance is the largest simplification tolerance at which node is kept,
+    so that nodes simplified with RDP at any tolerance are nodes with
+    significance greater than tolerance.
+
+    Args:
+        coords: map coordinates.
+        breaks: node indexes that always kept (ex. sector index), first & last node are always kept.
+        vertical: use vertical distance (for plot) instead of perpendicular distance.
+
+    Returns:
+        Significance list, same length as coords.
+    """
+    total = len(coords)
+    significance = [0.0] * total
+    if total < 1:
+        return significance
+    anchors = sorted({0, total - 1, *(index for index in breaks if 0 < index < total - 1)})
+    for index in anchors:
+        significance[index] = FLOAT_INF
+    segments = [(start, end, FLOAT_INF) for start, end in zip(anchors, anchors[1:])]
+    while segments:
+        start, end, limit = segments.pop()
+        if end - start < 2:
+            continue
+        x1, y1 = coords[start]
+        x2, y2 = coords[end]
+        dx = x2 - x1
+        dy = y2 - y1
+        max_dist = -1.0
+        max_index = start + 1
+        if vertical:
+            slope = dy / dx if dx else 0.0
+            for index in range(start + 1, end):
+                x, y = coords[index]
+                node_dist = abs(y - y1 - (x - x1) * slope)
+                if node_dist > max_dist:
+                    max_dist = node_dist
+                    max_index = index
+        else:
+            length = hypot(dx, dy)
+            for index in range(start + 1, end):
+                x, y = coords[index]
+                if length:
+                    node_dist = abs(dy * (x - x1) - dx * (y - y1)) / length
+                else:
+                    node_dist = hypot(x - x1, y - y1)
+                if node_dist > max_dist:
+                    max_dist = node_dist
+                    max_index = index
+        # Limit to parent significance, node is removed together with parent node
+        max_dist = min(max_dist, limit)
+        significance[max_index] = max_dist
+        segments.append((start, max_index, max_dist))
+        segments.append((max_index, end, max_dist))
+    return significance
+
+
+def map_lod_levels(
+    significance: Sequence[float], tolerances: Sequence[float]
+) -> tuple[tuple[float, tuple[int, ...]], ...]:
+    """Map level of detail (LOD) levels from nodes significance
+
+    Returns:
+        ((tolerance, node indexes), ...) levels, ordered from finest to coarsest tolerance.
+    """
+    return tuple(
+        (tolerance, tuple(index for index, value in enumerate(significance) if value > tolerance))
+        for tolerance in sorted(tolerances)
+    )
+
+
+def select_map_lod(
+    levels: Sequence[tuple[float, tuple[int, ...]]] | None, map_scale: float,
+    detail_level: int, pixel_tolerance: float = 0.5,
+) -> tuple[int, ...] | None:
+    """Select coarsest map LOD level that fits display scale
+
+    Args:
+        levels: LOD levels, see map_lod_levels().
+        map_scale: display pixels per map unit.
+        detail_level: 0 for full detail, higher value allows larger deviation.
+        pixel_tolerance: maximum deviation (pixels) per detail level.
+
+    Returns:
+        Node indexes, or None for full detail.
+    """
+    if not levels or detail_level <= 0 or map_scale <= 0:
+        return None
+    max_tolerance = pixel_tolerance * detail_level / map_scale
+    selected = None
+    for tolerance, indexes in levels:
+        if tolerance > max_tolerance:
+            break
+        selected = indexes
+    return selected
 
 
 def line_intersect_coords(
@@ -44,6 +44,7 @@ CRLF = "\r\n"
 EMPTY_DICT: MappingProxyType = MappingProxyType({})
 DELTA_ZERO = (0.0, 0.0)  # pos, target
 DELTA_DEFAULT = (DELTA_ZERO,)
+DELTA_DEFAULT_COLUMNS = ((0.0,), (0.0,))  # pos column, target column
 POS_XY_ZERO = (0.0, 0.0)  # world origin position
 POS_XYZ_ZERO = (0.0, 0.0, 0.0)  # world origin position
 POS_XYZ_INF = (FLOAT_INF, FLOAT_INF, FLOAT_INF)  # infinite position
@@ -63,6 +63,8 @@ class FileExt:
     BACKUP = ".backup"
     SVM = ".svm"
     JSON = ".json"
+    BIN = ".bin"
+    DB = ".db"
     # Image
     SVG = ".svg"
     PNG = ".png"
@@ -74,6 +76,8 @@ class FileExt:
     TPPN = ".tppn"
     TPTN = ".tptn"
     STATS = ".stats"
+    SETUPS = ".setups"
+    JOURNAL = ".journal"
     LOCK = ".lock"
     TYRESTRATEGY = ".tyre-strategy"
 
@@ -26,19 +26,63 @@ import logging
 import os
 import signal
 import sys
-import time
+from copy import deepcopy
 
 from .api_control import api
 from .const_file import FileExt
 from .hotkey_control import kctrl
+from .log_handler import log_buffer
 from .module_control import mctrl, wctrl
 from .overlay_control import octrl
-from .setting import cfg
+from .setting import SAVE_RELOAD_TIMEOUT, cfg
 from .update import update_checker
+from .userfile.userdata_store import userdata_store
+from .widget._cache import font_metrics_cache, image_cache, text_cache
 
 logger = logging.getLogger(__name__)
 
 
+class PresetState:
+    """Loaded preset state
+
+    Keep a snapshot of shared (non module or widget specific) setting
+    from last loading, which is used for comparing against newly loaded preset.
+    Shared setting is snapshotted because it can be edited in place
+    (ex. global config) before reloading.
+    """
+
+    __slots__ = ("_shared",)
+
+    def __init__(self):
+        self._shared = None
+
+    def update(self):
+        """Update snapshot from currently loaded preset"""
+        self._shared = deepcopy(shared_setting())
+
+    def is_shared_unchanged(self) -> bool:
+        """Check whether shared setting unchanged since last loading"""
+        return self._shared is not None and self._shared == shared_setting()
+
+
+def shared_setting() -> tuple:
+    """Shared setting that affects all modules & widgets"""
+    names = set(mctrl.names).union(wctrl.names)
+    return (
+        {key: value for key, value in cfg.user.setting.items() if key not in names},
+        cfg.user.config,
+        cfg.user.brakes,
+        cfg.user.brands,
+        cfg.user.classes,
+        cfg.user.compounds,
+        cfg.user.heatmap,
+        cfg.user.tracks,
+    )
+
+
+preset_state = PresetState()
+
+
 def int_signal_handler(sign, frame):
     """Quit by keyboard interrupt"""
     close()
@@ -57,9 +101,12 @@ def start():
     api.connect()
     api.start()
     # 3 start modules
+    userdata_store.set_enabled(cfg.application["enable_userdata_database"])
     mctrl.start()
     # 4 start widgets
+    set_cache_limit()
     wctrl.start()
+    preset_state.update()
     # 5 start main window
     from .ui.app import AppWindow
     AppWindow()
@@ -91,11 +138,7 @@ def restart():
     # 0 must close first
     close()
     # 1 wait unfinished saving
-    if cfg.is_saving:
-        # Trigger immediate saving from queue
-        cfg.save(next_task=True)
-        while cfg.is_saving:
-            time.sleep(0.01)
+    wait_saving()
     # 2 set restart env for skipping single instance check
     os.environ["TINYPEDAL_RESTART"] = "TRUE"
     if "tinypedal.exe" in sys.executable:  # if run as exe
@@ -116,34 +159,91 @@ def reload(reload_preset: bool = False):
     """
     logger.info("RELOADING............")
     # 0 wait unfinished saving
-    if cfg.is_saving:
-        # Trigger immediate saving from queue
-        cfg.save(next_task=True)
-        while cfg.is_saving:
-            time.sleep(0.01)
-    # 1 unload modules
-    unload_modules()
-    # 2 reload user preset from file
+    wait_saving()
+    # 1 reload user preset from file, apply differential reload if switched preset
     if reload_preset:
+        last_setting = cfg.user.setting
+        last_filename = cfg.filename.setting
         cfg.load_user()
         cfg.save(0)  # save new changes in case preset was edited externally
+        if last_filename != cfg.filename.setting and preset_state.is_shared_unchanged():
+            reload_changed_modules(last_setting)
+            return
+    # 2 unload modules
+    unload_modules()
     # 3 restart api
     api.restart()
     # 4 load modules
     load_modules()
 
 
+def reload_changed_modules(last_setting: dict):
+    """Reload only modules & widgets whose setting changed (differential reload)
+
+    Only used for switching to a different preset file, reloading
+    current preset always does full reload.
+
+    Unchanged modules & widgets are kept running, and their setting
+    (same values) from last preset is reused, so that existing references
+    from running modules & widgets remain valid.
+
+    Args:
+        last_setting: user setting from last loaded preset.
+    """
+    new_setting = cfg.user.setting
+    changed = 0
+    for control in (wctrl, mctrl):  # close widgets first
+        for name in control.names:
+            if new_setting[name] == last_setting.get(name):
+                new_setting[name] = last_setting[name]
+            else:
+                control.close(name)
+                changed += 1
+    for key, value in last_setting.items():  # shared setting (unchanged)
+        if key in new_setting and key not in mctrl.names and key not in wctrl.names:
+            new_setting[key] = value
+    clear_cache()
+    mctrl.start()
+    wctrl.start()
+    logger.info("RELOADING: %s changed module(s) and widget(s) reloaded", changed)
+
+
 def load_modules():
     """Load modules, widgets"""
     octrl.enable()  # 1 overlay control
+    userdata_store.set_enabled(cfg.application["enable_userdata_database"])
     mctrl.start()  # 2 module
+    set_cache_limit()
     wctrl.start()  # 3 widget
     kctrl.enable()  # 4 hotkey
+    preset_state.update()
+
+
+def wait_saving():
+    """Wait unfinished saving within timeout"""
+    if not cfg.flush(SAVE_RELOAD_TIMEOUT):
+        logger.error("USERDATA: unfinished saving, timeout after %ss", SAVE_RELOAD_TIMEOUT)
 
 
 def unload_modules():
     """Unload modules, widgets"""
     kctrl.disable()  # 1 hotkey
     wctrl.close()  # 2 widget
+    clear_cache()
     mctrl.close()  # 3 module
+    userdata_store.close()
     octrl.disable()  # 4 overlay control
+
+
+def set_cache_limit():
+    """Set widget & log cache limit"""
+    image_cache.set_limit(cfg.application["maximum_image_cache_size"])
+    text_cache.set_limit(cfg.application["maximum_text_cache_size"])
+    log_buffer.set_maximum_lines(cfg.application["maximum_log_lines"])
+
+
+def clear_cache():
+    """Clear widget cache, cached data is invalidated after preset reload"""
+    image_cache.clear()
+    text_cache.clear()
+    font_metrics_cache.clear_stats()
@@ -20,8 +20,87 @@
 Log handler setup
 """
 
+from __future__ import annotations
+
+import atexit
 import logging
 import sys
+from collections import deque
+from itertools import islice
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
+
+DEFAULT_LOG_LINES = 5000
+
+
+class LogBuffer(logging.Handler):
+    """Log buffer handler
+
+    Keep most recent log lines (one line per log record) in a bounded
+    ring buffer, oldest line is removed first when reached maximum lines.
+
+    Each appended line is numbered by sequence, so that log viewer
+    can read only newly appended lines since last reading.
+    """
+
+    __slots__ = (
+        "_lines",
+        "_sequence",
+    )
+
+    def __init__(self, maximum_lines: int = DEFAULT_LOG_LINES):
+        super().__init__(logging.INFO)
+        self._lines: deque[str] = deque(maxlen=max(maximum_lines, 1))
+        self._sequence = 0  # total number of appended lines
+
+    @property
+    def maximum_lines(self) -> int:
+        """Maximum log lines"""
+        return self._lines.maxlen or 1
+
+    def set_maximum_lines(self, maximum_lines: int):
+        """Set maximum log lines, keep most recent lines"""
+        maximum_lines = max(int(maximum_lines), 1)
+        with self.lock:
+            if self._lines.maxlen != maximum_lines:
+                self._lines = deque(self._lines, maxlen=maximum_lines)
+
+    def emit(self, record: logging.LogRecord):
+        """Append log record to buffer (called with handler lock held)"""
+        try:
+            self._lines.append(self.format(record))
+            self._sequence += 1
+        except Exception:
+            self.handleError(record)
+
+    def read(self, since: int = 0) -> tuple[int, list[str]]:
+        """Read log lines appended after sequence number
+
+        Args:
+            since: last read sequence number, 0 to read all lines.
+
+        Returns:
+            Tuple of current sequence number, and list of new log lines.
+            If fewer lines returned than (sequence - since),
+            older lines were removed from buffer before reading.
+        """
+        with self.lock:
+            sequence = self._sequence
+            total = len(self._lines)
+            count = min(max(sequence - since, 0), total)
+            return sequence, list(islice(self._lines, total - count, total))
+
+    def getvalue(self) -> str:
+        """Get all log lines as text"""
+        with self.lock:
+            if not self._lines:
+                return ""
+            return "\n".join(self._lines) + "\n"
+
+    def clear(self):
+        """Clear log lines, sequence number is kept"""
+        with self.lock:
+            self._lines.clear()
 
 
 def new_stream_handler(_logger: logging.Logger, stream) -> logging.StreamHandler:
@@ -43,42 +122,74 @@ def new_stream_handler(_logger: logging.Logger, stream) -> logging.StreamHandler
     return _handler
 
 
-def new_file_handler(_logger: logging.Logger, filepath: str, filename: str) -> logging.FileHandler:
+def new_buffer_handler(_logger: logging.Logger, buffer: LogBuffer) -> LogBuffer:
+    """Add log buffer handler
+
+    Args:
+        _logger: logger instance.
+        buffer: log buffer handler.
+    Returns:
+        Log buffer handler.
+    """
+    format_console = logging.Formatter(
+        "%(asctime)s.%(msecs)03d %(levelname)s: %(message)s", datefmt="%H:%M:%S"
+    )
+    buffer.setFormatter(format_console)
+    _logger.addHandler(buffer)
+    return buffer
+
+
+def new_file_handler(_logger: logging.Logger, filepath: str, filename: str) -> QueueHandler:
     """Create new file handler
 
+    Log records are put in queue, and written to file from
+    a background listener thread, so that logging never blocks
+    on disk I/O. Listener is stopped (remaining records written) on exit.
+
     Args:
         _logger: logger instance.
         filepath: log file path.
         filename: log file name.
     Returns:
-        File handler.
+        Queue handler.
     """
     format_file = logging.Formatter("%(asctime)s %(levelname)s: %(message)s")
-    _handler = logging.FileHandler(f"{filepath}{filename}")
-    _handler.setFormatter(format_file)
+    _file_handler = logging.FileHandler(f"{filepath}{filename}")
+    _file_handler.setFormatter(format_file)
+    _file_handler.setLevel(logging.INFO)
+    _listener = QueueListener(SimpleQueue(), _file_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+    _handler = QueueHandler(_listener.queue)
     _handler.setLevel(logging.INFO)
     _logger.addHandler(_handler)
     return _handler
 
 
-def set_logging_level(_logger: logging.Logger, filepath: str, filename: str, log_stream=None, log_level=1) -> None:
+def set_logging_level(
+    _logger: logging.Logger, filepath: str, filename: str,
+    log_buffer: LogBuffer | None = None, log_level=1,
+) -> None:
     """Set logging level
 
     Args:
         _logger: logger instance.
         filepath: log file path.
-        log_stream: log stream object.
+        log_buffer: log buffer handler.
         log_level:
             0 = output only warning or error to console.
             1 = output all log to console.
             2 = output all log to both console & file.
     """
     _logger.setLevel(logging.INFO)
-    if log_stream is not None:
-        new_stream_handler(_logger, log_stream)
+    if log_buffer is not None:
+        new_buffer_handler(_logger, log_buffer)
     if log_level >= 1:
         new_stream_handler(_logger, sys.stdout)
         _logger.info("LOGGING: output to console")
     if log_level == 2:
         new_file_handler(_logger, filepath, filename)
         _logger.info("LOGGING: output to %s", filename)
+
+
+log_buffer = LogBuffer()
@@ -20,7 +20,6 @@
 Launcher
 """
 
-import io
 import logging
 import os
 import sys
@@ -33,11 +32,10 @@ from PySide2.QtWidgets import QApplication, QMessageBox
 from . import realtime_state, version_check
 from .const_app import APP_NAME, PLATFORM, VERSION
 from .const_file import ConfigType, ImageFile, LogFile
-from .log_handler import set_logging_level
+from .log_handler import log_buffer, set_logging_level
 from .setting import cfg
 
 logger = logging.getLogger(__package__)
-log_stream = io.StringIO()
 
 
 def save_pid_file():
@@ -122,7 +120,7 @@ def init_gui() -> QApplication:
     root.setApplicationName(APP_NAME)
     set_app_icon(root)
     set_app_font(root)
-    # Disable global pixmap cache
+    # Disable Qt global pixmap cache, overlay images are cached in widget image cache
     QPixmapCache.setCacheLimit(0)
     logger.info("Screen pixel ratio: %s", root.devicePixelRatio())
     logger.info("Platform plugin: %s", root.platformName())
@@ -188,7 +186,7 @@ def start_app(cli_args):
     """Init main window"""
     single_instance_check(bool(cli_args.single_instance))
     unset_environment()
-    set_logging_level(logger, cfg.path.config, LogFile.APP_LOG, log_stream, cli_args.log_level)
+    set_logging_level(logger, cfg.path.config, LogFile.APP_LOG, log_buffer, cli_args.log_level)
     get_version()
     # load global config
     cfg.load_global()
@@ -20,6 +20,8 @@
 Data module base
 """
 
+from __future__ import annotations
+
 import logging
 import threading
 from functools import partial
@@ -43,6 +45,7 @@ class DataModule:
         "active_interval",
         "idle_interval",
         "_event",
+        "_thread",
     )
 
     def __init__(self, config: Setting, module_name: str):
@@ -57,6 +60,7 @@ class DataModule:
 
         # Module update interval
         self._event = threading.Event()
+        self._thread: threading.Thread | None = None
         self.active_interval = max(
             self.mcfg["update_interval"],
             self.cfg.application["minimum_update_interval"]) / 1000
@@ -70,13 +74,27 @@ class DataModule:
         if self.closed:
             self.closed = False
             self._event.clear()
-            threading.Thread(target=self.__tasks, daemon=True).start()
+            self._thread = threading.Thread(target=self.__tasks, daemon=True)
+            self._thread.start()
             logger.info("ENABLED: %s", self.module_name.replace("_", " "))
 
     def stop(self):
         """Stop update thread"""
         self._event.set()
 
+    def wait_closed(self, timeout: float) -> bool:
+        """Wait update thread to exit after stop
+
+        Args:
+            timeout: maximum waiting time in seconds.
+
+        Returns:
+            True if closed.
+        """
+        if self._thread is not None:
+            self._thread.join(max(timeout, 0))
+        return self.closed
+
     def update_data(self):
         """Update module data, rewrite in child class"""
 
@@ -27,12 +27,13 @@ from .. import realtime_state
 from ..api_control import api
 from ..const_common import (
     DELTA_DEFAULT,
+    DELTA_DEFAULT_COLUMNS,
     DELTA_ZERO,
     FLOAT_INF,
     MAX_SECONDS,
     POS_XYZ_ZERO,
 )
-from ..module_info import minfo
+from ..module_info import DistanceCursor, DistanceSeries, minfo
 from ..userfile.delta_best import load_delta_best_file, save_delta_best_file
 from ..validator import is_same_session, valid_delta_raw, vehicle_position_sync
 from ._base import DataModule, round6
@@ -56,8 +57,6 @@ class Realtime(DataModule):
         output = minfo.delta
 
         last_session_id = ("",-1,-1,-1)
-        delta_array_session = DELTA_DEFAULT
-        delta_array_stint = DELTA_DEFAULT
         laptime_session_best = MAX_SECONDS
         laptime_stint_best = MAX_SECONDS
         min_delta_distance = self.mcfg["minimum_delta_distance"]
@@ -73,6 +72,11 @@ class Realtime(DataModule):
         laptime_pace_margin = max(self.mcfg["laptime_pace_margin"], 0.1)
         gen_position_sync = vehicle_position_sync()
 
+        cursor_best = DistanceCursor()
+        cursor_last = DistanceCursor()
+        cursor_session = DistanceCursor()
+        cursor_stint = DistanceCursor()
+
         while not _event_wait(update_interval):
             if realtime_state.active:
 
@@ -90,18 +94,20 @@ class Realtime(DataModule):
 
                     # Reset delta session best if not same session
                     if not is_same_session(combo_name, session_id, last_session_id):
-                        delta_array_session = DELTA_DEFAULT
                         laptime_session_best = MAX_SECONDS
+                        cursor_session.set_series(DistanceSeries())
                         last_session_id = (combo_name, *session_id)
 
-                    delta_array_best, laptime_best = load_delta_best_file(
+                    delta_columns_best, laptime_best = load_delta_best_file(
                         filepath=userpath_delta_best,
                         filename=combo_name,
-                        defaults=(DELTA_DEFAULT, MAX_SECONDS)
+                        defaults=(DELTA_DEFAULT_COLUMNS, MAX_SECONDS)
                     )
-                    output.deltaBestData = delta_array_best
+                    output.deltaBestData = DistanceSeries.from_columns(delta_columns_best)
                     delta_array_raw = [DELTA_ZERO]  # distance, laptime
                     delta_array_last = DELTA_DEFAULT  # last lap
+                    cursor_best.set_series(output.deltaBestData)
+                    cursor_last.set_series(DistanceSeries())
 
                     delta_ema_best = 0.0
                     delta_ema_last = 0.0
@@ -132,8 +138,8 @@ class Realtime(DataModule):
 
                 # Reset delta stint best if in pit and stopped
                 if in_pits and laptime_stint_best != MAX_SECONDS and api.read.vehicle.speed() < 0.1:
-                    delta_array_stint = DELTA_DEFAULT
                     laptime_stint_best = MAX_SECONDS
+                    cursor_stint.set_series(DistanceSeries())
 
                 # Lap start & finish detection
                 if lap_stime > last_lap_stime:
@@ -144,6 +150,7 @@ class Realtime(DataModule):
                             round6(laptime_last),
                         ))
                         delta_array_last = tuple(delta_array_raw)
+                        cursor_last.set_series(DistanceSeries(delta_array_last))
                         validating = api.read.timing.elapsed()
                     delta_array_raw[:] = DELTA_DEFAULT
                     pos_last = pos_recorded = pos_curr
@@ -185,20 +192,21 @@ class Realtime(DataModule):
                         # Update delta best list
                         if laptime_best > laptime_last:
                             laptime_best = laptime_last
-                            output.deltaBestData = delta_array_best = delta_array_last
+                            output.deltaBestData = cursor_last.series
+                            cursor_best.set_series(cursor_last.series)
                             save_delta_best_file(
                                 filepath=userpath_delta_best,
                                 filename=combo_name,
-                                dataset=delta_array_best,
+                                dataset=delta_array_last,
                             )
                         # Update delta session best list
                         if laptime_session_best > laptime_last:
                             laptime_session_best = laptime_last
-                            delta_array_session = delta_array_last
+                            cursor_session.set_series(cursor_last.series)
                         # Update delta stint best list
                         if laptime_stint_best > laptime_last:
                             laptime_stint_best = laptime_last
-                            delta_array_stint = delta_array_last
+                            cursor_stint.set_series(cursor_last.series)
                         validating = 0
 
                 # Calc distance
@@ -220,39 +228,19 @@ class Realtime(DataModule):
                     # Smooth delta
                     delta_ema_best = calc_ema_delta(
                         delta_ema_best,
-                        calc.delta_telemetry(
-                            delta_array_best,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
+                        cursor_best.delta(pos_synced, laptime_curr, delay_update),
                     )
                     delta_ema_last = calc_ema_delta(
                         delta_ema_last,
-                        calc.delta_telemetry(
-                            delta_array_last,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
+                        cursor_last.delta(pos_synced, laptime_curr, delay_update),
                     )
                     delta_ema_session = calc_ema_delta(
                         delta_ema_session,
-                        calc.delta_telemetry(
-                            delta_array_session,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
+                        cursor_session.delta(pos_synced, laptime_curr, delay_update),
                     )
                     delta_ema_stint = calc_ema_delta(
                         delta_ema_stint,
-                        calc.delta_telemetry(
-                            delta_array_stint,
-                            pos_synced,
-                            laptime_curr,
-                            delay_update,
-                        ),
+                        cursor_stint.delta(pos_synced, laptime_curr, delay_update),
                     )
 
                 # Estimated laptime
@@ -29,9 +29,9 @@ from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_api import API_RF2_NAME
-from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
+from ..const_common import DELTA_DEFAULT, DELTA_DEFAULT_COLUMNS, DELTA_ZERO, FLOAT_INF, POS_XYZ_ZERO
 from ..const_file import FileExt
-from ..module_info import FuelInfo, minfo
+from ..module_info import DistanceCursor, DistanceSeries, FuelInfo, minfo
 from ..userfile.fuel_delta import load_fuel_delta_file, save_fuel_delta_file
 from ..validator import generator_init, valid_delta_raw
 from ._base import DataModule, round6
@@ -150,12 +150,14 @@ def calc_consumption(
     validating = 0
     is_pit_lap = 0  # whether pit in or pit out lap
 
-    delta_array_last, used_last_valid, laptime_pace = load_fuel_delta_file(
+    delta_columns_last, used_last_valid, laptime_pace = load_fuel_delta_file(
         filepath=filepath,
         filename=filename,
         extension=extension,
-        defaults=(DELTA_DEFAULT, 0.0, 0.0)
+        defaults=(DELTA_DEFAULT_COLUMNS, 0.0, 0.0)
     )
+    cursor_last = DistanceCursor(DistanceSeries.from_columns(delta_columns_last))
+    delta_array_last = DELTA_DEFAULT  # last lap, saved only after new lap recorded
     delta_array_raw = [DELTA_ZERO]  # distance, fuel used, laptime
     delta_array_temp = DELTA_DEFAULT  # last lap temp
     delta_fuel = 0.0  # delta fuel consumption compare to last lap
@@ -274,6 +276,7 @@ def calc_consumption(
                 api.read.timing.last_laptime() > 0):  # is valid laptime
                 used_last_valid = used_last_raw
                 delta_array_last = delta_array_temp
+                cursor_last.set_series(DistanceSeries(delta_array_last))
                 delta_array_temp = DELTA_DEFAULT
                 delayed_save = True
                 validating = 0
@@ -287,8 +290,7 @@ def calc_consumption(
                 pos_estimate += calc.distance(gps_last, gps_curr)
             gps_last = gps_curr
             # Update delta
-            delta_fuel = calc.delta_telemetry(
-                delta_array_last,
+            delta_fuel = cursor_last.delta(
                 pos_estimate,
                 used_curr,
                 laptime_curr > 0.3 and not in_garage,  # 300ms delay
@@ -20,11 +20,10 @@
 Hybrid module
 """
 
-from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import DELTA_DEFAULT, DELTA_ZERO, FLOAT_INF, MAX_SECONDS
-from ..module_info import minfo
+from ..module_info import DistanceCursor, DistanceSeries, minfo
 from ._base import DataModule
 
 
@@ -70,6 +69,7 @@ class Realtime(DataModule):
                     delta_recording = False
                     delta_array_raw = [DELTA_ZERO]  # distance, battery net change
                     delta_array_last = DELTA_DEFAULT
+                    cursor_last = DistanceCursor()
                     pos_last = 0.0  # last checked vehicle position
                     net_change_last = 0.0
                     est_net_change = 0.0  # estimated battery charge net change
@@ -143,6 +143,7 @@ class Realtime(DataModule):
                         delta_reset = False
                         if len(delta_array_raw) > 1 and not is_pit_lap:
                             delta_array_last = tuple(delta_array_raw)
+                            cursor_last.set_series(DistanceSeries(delta_array_last))
                         delta_array_raw[:] = DELTA_DEFAULT
                         pos_last = pos_curr
                         delta_recording = laptime_curr < 1
@@ -164,8 +165,7 @@ class Realtime(DataModule):
 
                     # Net change delta
                     if is_valid_delta:
-                        delta_net_change = calc.delta_telemetry(
-                            delta_array_last,
+                        delta_net_change = cursor_last.delta(
                             pos_curr,
                             net_change_curr,
                             laptime_curr > 0.3,
@@ -20,6 +20,8 @@
 Mapping module
 """
 
+from __future__ import annotations
+
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
@@ -27,9 +29,13 @@ from ..const_file import FileExt
 from ..module_info import MappingInfo, minfo
 from ..userfile.track_info import load_track_info, save_track_info
 from ..userfile.track_map import load_track_map_file, save_track_map_file
+from ..userfile.userdata_cache import userdata_cache
 from ..validator import file_last_modified, generator_init
 from ._base import DataModule, round4
 
+# Map level of detail (LOD) tolerances (meters)
+MAP_LOD_TOLERANCES = (0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.2, 6.4)
+
 
 class Realtime(DataModule):
     """Mapping data"""
@@ -59,10 +65,13 @@ class Realtime(DataModule):
 
                     recorder.load_map(api.read.session.track_name())
                     if recorder.map_exist:
-                        output.coordinates = recorder.output.coords
-                        output.elevations = recorder.output.dists
-                        output.sectors = recorder.output.sectors
-                        output.lastModified = recorder.last_modified
+                        output.publish(
+                            recorder.output.coords,
+                            recorder.output.dists,
+                            recorder.output.sectors,
+                            recorder.last_modified,
+                            *create_map_lod(recorder.output.coords, recorder.output.dists, recorder.output.sectors),
+                        )
                     else:
                         recorder.reset()
                         output.reset()
@@ -86,6 +95,15 @@ class Realtime(DataModule):
                     gen_track_info.send(False)
 
 
+def create_map_lod(coords: tuple, dists: tuple, sectors: tuple | None):
+    """Create map & elevation level of detail (LOD) levels, sector nodes are always kept"""
+    coords_lod = calc.map_lod_levels(
+        calc.map_significance(coords, sectors or ()), MAP_LOD_TOLERANCES)
+    dists_lod = calc.map_lod_levels(
+        calc.map_significance(dists, vertical=True), MAP_LOD_TOLERANCES)
+    return coords_lod, dists_lod
+
+
 def set_sunlight_phase(sunrise: str, sunset: str):
     """Set sunlight phase time"""
     sec_sunrise = calc.clock_time_to_seconds(sunrise)
@@ -306,10 +324,8 @@ class MapRecorder:
             self.map_exist = True
             return
         # Load map file
-        raw_coords, raw_dists, sectors_index = load_track_map_file(
-            filepath=self._filepath,
-            filename=filename,
-        )
+        raw_coords, raw_dists, sectors_index = userdata_cache.load(
+            load_track_map_file, self._filepath, filename, FileExt.SVG, True)
         if raw_coords and raw_dists and sectors_index:
             self.output.coords = raw_coords
             self.output.dists = raw_dists
@@ -24,11 +24,10 @@ from __future__ import annotations
 
 from typing import Callable, Mapping
 
-from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_file import FileExt
-from ..module_info import NotesInfo, minfo
+from ..module_info import DistanceCursor, DistanceSeries, NotesInfo, minfo
 from ..userfile.track_notes import (
     COLUMN_DISTANCE,
     COLUMN_TAGS,
@@ -168,11 +167,12 @@ def notes_selector(output: NotesInfo, dataset: tuple[Mapping, ...]):
     pos_reference = reference_position(dataset)
     end_index = len(pos_reference) - 1  # end note line index
     pos_final = pos_reference[-1] if pos_reference else 0.0  # final reference position
+    pos_cursor = DistanceCursor(DistanceSeries.from_distance(pos_reference))
     output.reset()  # initial reset before updating
 
     while True:
         pos_curr = yield
-        curr_index = calc.binary_search_lower(pos_reference, pos_curr, 0, end_index)
+        curr_index = pos_cursor.seek_lower(pos_curr)
 
         if last_index == curr_index:
             continue
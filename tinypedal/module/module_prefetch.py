@@ -0,0 +1,108 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Prefetch module
+"""
+
+import logging
+from time import perf_counter
+
+from .. import realtime_state
+from ..api_control import api
+from ..const_file import FileExt, StatsFile
+from ..module_info import minfo
+from ..userfile.consumption_history import load_consumption_history_file
+from ..userfile.delta_best import prefetch_delta_best_file
+from ..userfile.driver_stats import load_stats_json_file
+from ..userfile.fuel_delta import prefetch_fuel_delta_file
+from ..userfile.sector_best import prefetch_sector_best_file
+from ..userfile.track_map import load_track_map_file
+from ..userfile.userdata_cache import userdata_cache
+from ._base import DataModule
+
+logger = logging.getLogger(__name__)
+
+
+class Realtime(DataModule):
+    """Userdata prefetch
+
+    Preload userdata for current track & vehicle combo while in garage,
+    so that modules do not load userdata from disk while entering track.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, config, module_name):
+        super().__init__(config, module_name)
+
+    def update_data(self):
+        """Update module data"""
+        _event_wait = self._event.wait
+        update_interval = self.idle_interval
+        last_combo_name = None
+
+        while not _event_wait(update_interval):
+            if realtime_state.active:
+                continue
+
+            track_name = api.read.session.track_name()
+            if not track_name:  # not in session
+                continue
+
+            combo_name = api.read.session.combo_name()
+            if last_combo_name != combo_name:
+                last_combo_name = combo_name
+                userdata_cache.clear()  # remove data from last combo
+
+            timer_start = perf_counter()
+            loaded = self.prefetch(track_name, combo_name)
+            if loaded:
+                logger.info(
+                    "PREFETCH: %s userdata file(s) loaded, %.0fms",
+                    loaded, (perf_counter() - timer_start) * 1000,
+                )
+
+        userdata_cache.clear()
+
+    def prefetch(self, track_name: str, combo_name: str) -> int:
+        """Prefetch userdata for enabled modules, skip if already cached
+
+        Returns:
+            Number of loaded files.
+        """
+        setting = self.cfg.user.setting
+        userpath = self.cfg.path
+        loaded = 0
+        if setting["module_delta"]["enable"]:
+            loaded += prefetch_delta_best_file(userpath.delta_best, combo_name)
+        if setting["module_sectors"]["enable"]:
+            loaded += prefetch_sector_best_file(userpath.sector_best, combo_name)
+        if setting["module_fuel"]["enable"]:
+            loaded += prefetch_fuel_delta_file(userpath.fuel_delta, combo_name, FileExt.FUEL)
+            loaded += prefetch_fuel_delta_file(userpath.energy_delta, combo_name, FileExt.ENERGY)
+        if setting["module_stint"]["enable"] and minfo.history.consumptionDataName != combo_name:
+            loaded += userdata_cache.prefetch(
+                load_consumption_history_file, userpath.fuel_delta, combo_name, FileExt.CONSUMPTION)
+        if setting["module_mapping"]["enable"]:
+            loaded += userdata_cache.prefetch(
+                load_track_map_file, userpath.track_map, track_name, FileExt.SVG, True)
+        if setting["module_stats"]["enable"]:
+            loaded += userdata_cache.prefetch(
+                load_stats_json_file, userpath.config, StatsFile.DRIVER, FileExt.STATS)
+        return loaded
@@ -115,10 +115,12 @@ class Realtime(DataModule):
                         min_top_veh, veh_limit_combined, plr_place, classes_list)
 
                 # Output data
-                output.relativeAhead = relative_ahead
-                output.relativeBehind = relative_behind
-                output.standings = standings_index_list
-                output.drawOrder = draw_order_list
+                output.publish(
+                    relative_ahead,
+                    relative_behind,
+                    standings_index_list,
+                    draw_order_list,
+                )
 
             else:
                 if reset:
@@ -213,7 +215,7 @@ def get_vehicles_info(
         player_pos = draw_order.index(plr_index)
         draw_order[player_pos], draw_order[-2] = draw_order[-2], draw_order[player_pos]
 
-    # Sort output in-place
+    # Sort output in-place, timsort is adaptive to nearly sorted order between ticks
     relative_ahead = TEMP_RELATIVE_AHEAD[:recorded_index]
     relative_ahead.sort(reverse=True)  # by reversed time gap
 
@@ -31,10 +31,9 @@ from ..const_common import FLOAT_INF, POS_XYZ_INF
 from ..module_info import minfo
 from ..userfile.brands import select_brand_name
 from ..userfile.car_setup import (
-    rename_car_setup_file,
-    save_car_setup_file,
+    backup_car_setup,
     set_car_setup_filename,
-    set_car_setup_laptime,
+    update_car_setup_laptime,
 )
 from ..userfile.driver_stats import DriverStats, load_driver_stats, save_driver_stats
 from ..validator import generator_init
@@ -236,7 +235,8 @@ def auto_backup_car_setup(filepath: str):
     temp_data = ()
     data_hash = 0
     last_data_hash = 0
-    temp_filename = ""
+    index_filename = ""
+    backup_timestamp = ""
     last_session_elapsed = -1
 
     while True:
@@ -253,17 +253,18 @@ def auto_backup_car_setup(filepath: str):
             last_reset = reset
 
             if reset:
-                if data_available and temp_filename:
-                    # Rename temporary file with additional info after back to garage
-                    rename_car_setup_file(
+                if data_available and backup_timestamp:
+                    # Update backup with stint best lap time after back to garage
+                    update_car_setup_laptime(
                         filepath=filepath,
-                        old_filename=temp_filename,
-                        new_filename=f"{temp_filename} - {set_car_setup_laptime(best_laptime)}",
+                        index_filename=index_filename,
+                        timestamp=backup_timestamp,
+                        laptime=best_laptime,
                     )
 
                 best_laptime = FLOAT_INF
                 data_available = False
-                temp_filename = ""
+                backup_timestamp = ""
 
         if not reset:
             # Stint best time
@@ -277,20 +278,23 @@ def auto_backup_car_setup(filepath: str):
                 if temp_data:
                     data_available = True
                     data_hash = hash(temp_data)
-                    # Save temporary file first
+                    # Add backup entry, identical setup file is renamed instead of saved
                     if last_data_hash != data_hash:
-                        temp_filename = set_car_setup_filename(
-                            api.alias,
-                            strftime("%Y-%m-%d %H-%M-%S", localtime()),
-                            api.read.session.track_name(),
-                            api.read.vehicle.class_name(),
-                            select_brand_name(vehicle_name=api.read.vehicle.vehicle_name()),
-                        )
-                        save_car_setup_file(
+                        track_name = api.read.session.track_name()
+                        class_name = api.read.vehicle.class_name()
+                        brand_name = select_brand_name(vehicle_name=api.read.vehicle.vehicle_name())
+                        backup_timestamp = strftime("%Y-%m-%d %H-%M-%S", localtime())
+                        index_filename = set_car_setup_filename(
+                            api.alias, track_name, class_name, brand_name)
+                        if not backup_car_setup(
                             filepath=filepath,
-                            filename=temp_filename,
+                            filename=set_car_setup_filename(
+                                api.alias, backup_timestamp, track_name, class_name, brand_name),
+                            index_filename=index_filename,
+                            timestamp=backup_timestamp,
                             dataset=temp_data,
-                        )
+                        ):
+                            backup_timestamp = ""
                     # Reset
                     temp_data = ()
                     last_data_hash = data_hash
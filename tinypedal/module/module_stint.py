@@ -23,17 +23,21 @@ Stint module
 from __future__ import annotations
 
 from collections import deque
+from itertools import islice
 
 from .. import calculation as calc
 from .. import realtime_state
 from ..api_control import api
 from ..const_common import FLOAT_INF, MAX_SECONDS
+from ..const_file import FileExt
 from ..module_info import ConsumptionDataSet, StintData, StintDataSet, minfo
 from ..userfile.consumption_history import (
+    append_consumption_history_file,
     load_consumption_history_file,
     save_consumption_history_file,
 )
 from ..userfile.heatmap import select_compound_symbol
+from ..userfile.userdata_cache import userdata_cache
 from ..validator import generator_init
 from ._base import DataModule
 
@@ -115,10 +119,8 @@ def update_consumption_history():
 def load_consumption_history(filepath: str, combo_name: str):
     """Load consumption history"""
     if minfo.history.consumptionDataName != combo_name:
-        dataset = load_consumption_history_file(
-            filepath=filepath,
-            filename=combo_name,
-        )
+        dataset = userdata_cache.load(
+            load_consumption_history_file, filepath, combo_name, FileExt.CONSUMPTION)
         minfo.history.consumptionDataSet.clear()
         minfo.history.consumptionDataSet.extend(dataset)
         # Update combo info
@@ -127,13 +129,22 @@ def load_consumption_history(filepath: str, combo_name: str):
 
 
 def save_consumption_history(filepath: str, combo_name: str):
-    """Save consumption history"""
-    if minfo.history.consumptionDataVersion != hash(combo_name):
-        save_consumption_history_file(
-            dataset=minfo.history.consumptionDataSet,
-            filepath=filepath,
-            filename=combo_name,
-        )
+    """Save consumption history, append new records since last saving to journal"""
+    new_records = minfo.history.consumptionDataVersion - hash(combo_name)
+    if new_records != 0:
+        dataset = minfo.history.consumptionDataSet
+        if 0 < new_records < len(dataset):
+            append_consumption_history_file(
+                records=tuple(islice(dataset, new_records))[::-1],  # oldest first
+                filepath=filepath,
+                filename=combo_name,
+            )
+        else:  # save full data set if records exceed history size
+            save_consumption_history_file(
+                dataset=dataset,
+                filepath=filepath,
+                filename=combo_name,
+            )
         minfo.history.consumptionDataVersion = hash(combo_name)  # reset
 
 
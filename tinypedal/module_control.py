@@ -23,7 +23,7 @@ Module and widget control
 from __future__ import annotations
 
 import logging
-from time import sleep
+from time import monotonic, perf_counter
 from types import MappingProxyType
 from typing import Any, KeysView
 
@@ -33,6 +33,8 @@ from .setting import cfg
 
 logger = logging.getLogger(__name__)
 
+CLOSE_TIMEOUT = 5  # seconds, maximum waiting time for closing all modules
+
 
 def create_module_pack(target: Any) -> dict:
     """Create module reference pack as dictionary
@@ -60,6 +62,7 @@ class ModuleControl:
     __slots__ = (
         "_imported_modules",
         "_active_modules",
+        "_closing_modules",
         "type_id",
         "active_modules",
     )
@@ -67,6 +70,7 @@ class ModuleControl:
     def __init__(self, target: Any, type_id: str):
         self._imported_modules = MappingProxyType(create_module_pack(target))
         self._active_modules: dict = {}
+        self._closing_modules: dict = {}
         self.type_id = type_id
         self.active_modules: MappingProxyType = MappingProxyType(self._active_modules)
 
@@ -89,6 +93,15 @@ class ModuleControl:
         self.close(name)
         self.start(name)
 
+    def update(self, name: str):
+        """Apply config changes to selected module
+
+        Widget config changes are applied in place if possible,
+        otherwise module is reloaded.
+        """
+        if not self.__update_selected(name):
+            self.reload(name)
+
     def toggle(self, name: str):
         """Toggle module"""
         if cfg.user.setting[name]["enable"]:
@@ -117,30 +130,81 @@ class ModuleControl:
 
     def __start_enabled(self):
         """Start all enabled module"""
+        start_time = perf_counter()
         for _name in self._imported_modules:
             self.__start_selected(_name)
+        logger.info(
+            "LOADED: %s %s(s), %.0fms",
+            len(self._active_modules),
+            self.type_id,
+            (perf_counter() - start_time) * 1000,
+        )
 
     def __start_selected(self, name: str):
         """Start selected module"""
         if cfg.user.setting[name]["enable"] and name not in self._active_modules:
+            if not self.__closing_finished(name):
+                logger.error(
+                    "FAILED TO START: %s %s, previous instance still running",
+                    self.type_id,
+                    name,
+                )
+                return
             # Create module instance and add to dict
             self._active_modules[name] = self._imported_modules[name].Realtime(cfg, name)
             self._active_modules[name].start()
 
+    def __update_selected(self, name: str) -> bool:
+        """Apply config changes to selected active widget in place"""
+        if self.type_id != ConfigType.WIDGET or not cfg.user.setting[name]["enable"]:
+            return False
+        _widget = self._active_modules.get(name)
+        return _widget is not None and _widget.update_config()
+
     def __close_enabled(self):
-        """Close all enabled module"""
-        for _name in tuple(self._active_modules):
-            self.__close_selected(_name)
+        """Close all enabled module
+
+        Signal all modules to stop at once, then wait all to finish in parallel,
+        so that closing time is bounded by the slowest module.
+        """
+        closing = tuple(self._active_modules.items())
+        self._active_modules.clear()  # remove active reference
+        for _, _module in closing:
+            _module.stop()
+        self.__wait_closed(closing)
 
     def __close_selected(self, name: str):
         """Close selected module"""
         if name in self._active_modules:
-            _module = self._active_modules[name]  # get instance
-            self._active_modules.pop(name)  # remove active reference
-            _module.stop()  # close module
-            while not _module.closed:  # wait finish
-                sleep(0.01)
-            _module = None  # remove final reference
+            _module = self._active_modules.pop(name)  # remove active reference
+            _module.stop()
+            self.__wait_closed(((name, _module),))
+
+    def __wait_closed(self, closing: tuple):
+        """Wait stopped modules to finish within timeout, report any failed module
+
+        Widgets are closed immediately in GUI thread after stop. Timed-out modules
+        are kept tracked until their thread exits, and cannot be restarted before.
+        """
+        deadline = monotonic() + CLOSE_TIMEOUT
+        for name, _module in closing:
+            if self.type_id == ConfigType.WIDGET:
+                closed = _module.closed
+            else:
+                closed = _module.wait_closed(deadline - monotonic())
+            if not closed:
+                self._closing_modules[name] = _module
+                logger.error("FAILED TO CLOSE: %s %s, timeout", self.type_id, name)
+
+    def __closing_finished(self, name: str) -> bool:
+        """Check whether previous timed-out instance of selected module has exited"""
+        _module = self._closing_modules.get(name)
+        if _module is None:
+            return True
+        if not _module.closed:
+            return False
+        self._closing_modules.pop(name)  # remove final reference
+        return True
 
     @property
     def number_active(self) -> int:
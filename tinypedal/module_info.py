@@ -24,9 +24,9 @@ from __future__ import annotations
 
 from array import array
 from collections import deque
-from typing import Mapping, NamedTuple
+from typing import Mapping, NamedTuple, Sequence
 
-from .calculation import circular_position_relative, linear_interp
+from .calculation import binary_search_higher, circular_position_relative, linear_interp
 from .const_common import (
     DELTA_DEFAULT,
     EMPTY_DICT,
@@ -94,6 +94,121 @@ class StintDataSet(NamedTuple):
     tyreCompound: str = "----"
 
 
+class DistanceSeries:
+    """Distance series data
+
+    Distance & value columns stored in array("d"),
+    distance column must be in ascending order.
+    Data should not be modified after creation, so it can be shared between cursors.
+
+    Attributes:
+        distance: Distance column.
+        value: Value column.
+    """
+
+    __slots__ = (
+        "distance",
+        "value",
+    )
+
+    def __init__(
+        self, dataset: Sequence[Sequence[float]] = DELTA_DEFAULT,
+        distance_column: int = 0, value_column: int = 1):
+        self.distance = array("d", [data[distance_column] for data in dataset])
+        self.value = array("d", [data[value_column] for data in dataset])
+
+    @classmethod
+    def from_columns(
+        cls, dataset: Sequence[Sequence[float]],
+        distance_column: int = 0, value_column: int = 1) -> DistanceSeries:
+        """Create distance series from columns, array("d") column is shared without copy"""
+        series = cls.__new__(cls)
+        distance = dataset[distance_column]
+        value = dataset[value_column]
+        series.distance = distance if isinstance(distance, array) else array("d", distance)
+        series.value = value if isinstance(value, array) else array("d", value)
+        return series
+
+    @classmethod
+    def from_distance(cls, distance: Sequence[float]) -> DistanceSeries:
+        """Create distance series from distance column only"""
+        series = cls(())
+        series.distance.extend(distance)
+        series.value.extend(0.0 for _ in distance)
+        return series
+
+
+class DistanceCursor:
+    """Distance series lookup cursor
+
+    Keeps last hit index, and walks forward from last hit as position advances.
+    Binary search is only used on position reset (new lap), desync or long jump.
+    Each consumer should use its own cursor.
+
+    Attributes:
+        series: Target distance series.
+        index: Last hit index (nearest higher distance index).
+    """
+
+    __slots__ = (
+        "series",
+        "index",
+    )
+    max_steps = 8  # max forward steps before fallback to binary search
+
+    def __init__(self, series: DistanceSeries | None = None):
+        self.series = DistanceSeries() if series is None else series
+        self.index = 0
+
+    def set_series(self, series: DistanceSeries):
+        """Set new target series & reset cursor"""
+        self.series = series
+        self.index = 0
+
+    def seek_higher(self, position: float) -> int:
+        """Seek nearest higher distance index"""
+        distance = self.series.distance
+        end = len(distance) - 1
+        index = self.index
+        if index > end or (index > 0 and position < distance[index - 1]):
+            index = binary_search_higher(distance, position, 0, end)
+        else:
+            steps = self.max_steps
+            while index < end and distance[index] < position:
+                index += 1
+                steps -= 1
+                if not steps:
+                    index = binary_search_higher(distance, position, index, end)
+                    break
+        self.index = index
+        return index
+
+    def seek_lower(self, position: float) -> int:
+        """Seek nearest lower distance index, -1 if lower than first distance"""
+        index = self.seek_higher(position)
+        if index >= 0 and self.series.distance[index] > position:
+            return index - 1
+        return index
+
+    def delta(self, position: float, target: float, condition: bool = True) -> float:
+        """Calculate delta between target & interpolated value at position"""
+        if not condition:
+            return 0
+        index_higher = self.seek_higher(position)
+        if index_higher > 0:
+            index_lower = index_higher - 1
+            distance = self.series.distance
+            value = self.series.value
+            return target - linear_interp(
+                position,
+                distance[index_lower],
+                value[index_lower],
+                distance[index_higher],
+                value[index_higher],
+            )
+        return 0
+
+
 class DeltaTimeInterval:
     """Delta time interval data
 
@@ -553,7 +668,7 @@ class DeltaInfo:
     )
 
     def __init__(self):
-        self.deltaBestData: tuple[tuple[float, float], ...] = DELTA_DEFAULT
+        self.deltaBestData: DistanceSeries = DistanceSeries()
         self.deltaBest: float = 0.0
         self.deltaLast: float = 0.0
         self.deltaSession: float = 0.0
@@ -719,14 +834,26 @@ class HybridInfo:
         self.fuelEnergyBias: float = 0.0
 
 
+class MappingSnapshot(NamedTuple):
+    """Mapping output snapshot
+
+    Map data is published together as a single immutable snapshot,
+    so that readers never see coordinates from one map with sectors from another.
+    """
+
+    lastModified: float = 0.0
+    coordinates: tuple[tuple[float, float], ...] | None = None
+    elevations: tuple[tuple[float, float], ...] | None = None
+    sectors: tuple[int, int] | None = None
+    coordinatesLOD: tuple[tuple[float, tuple[int, ...]], ...] | None = None
+    elevationsLOD: tuple[tuple[float, tuple[int, ...]], ...] | None = None
+
+
 class MappingInfo:
     """Mapping output data"""
 
     __slots__ = (
-        "coordinates",
-        "elevations",
-        "sectors",
-        "lastModified",
+        "snapshot",
         "speedTrapPosition",
         "pitEntryPosition",
         "pitExitPosition",
@@ -741,10 +868,7 @@ class MappingInfo:
 
     def reset(self):
         """Reset"""
-        self.coordinates: tuple[tuple[float, float], ...] | None = None
-        self.elevations: tuple[tuple[float, float], ...] | None = None
-        self.sectors: tuple[int, int] | None = None
-        self.lastModified: float = 0.0
+        self.snapshot: MappingSnapshot = MappingSnapshot()
         self.speedTrapPosition: float = 0.0
         self.pitEntryPosition: float = 0.0
         self.pitExitPosition: float = 0.0
@@ -753,6 +877,34 @@ class MappingInfo:
         self.pitPassTime: float = 0.0
         self.sunlightPhases: tuple[tuple[float, int], ...] | None = None
 
+    def publish(
+        self, coordinates: tuple, elevations: tuple, sectors: tuple | None, last_modified: float,
+        coordinates_lod: tuple | None = None, elevations_lod: tuple | None = None,
+    ):
+        """Publish map data with single reference swap"""
+        self.snapshot = MappingSnapshot(
+            last_modified, coordinates, elevations, sectors, coordinates_lod, elevations_lod)
+
+    @property
+    def lastModified(self) -> float:
+        """Last modified time of map data"""
+        return self.snapshot.lastModified
+
+    @property
+    def coordinates(self) -> tuple[tuple[float, float], ...] | None:
+        """Map coordinates"""
+        return self.snapshot.coordinates
+
+    @property
+    def elevations(self) -> tuple[tuple[float, float], ...] | None:
+        """Map elevations"""
+        return self.snapshot.elevations
+
+    @property
+    def sectors(self) -> tuple[int, int] | None:
+        """Map sectors index"""
+        return self.snapshot.sectors
+
 
 class NotesInfo:
     """Notes output data"""
@@ -775,23 +927,31 @@ class NotesInfo:
         self.nextNote: Mapping[str, float | str] = EMPTY_DICT
 
 
+class RelativeSnapshot(NamedTuple):
+    """Relative output snapshot
+
+    Relative & standings lists are published together as a single immutable snapshot,
+    so that readers always see lists from the same update.
+    """
+
+    version: int = 0
+    relativeAhead: Sequence[tuple[float, int]] = (REL_TIME_DEFAULT,)
+    relativeBehind: Sequence[tuple[float, int]] = (REL_TIME_DEFAULT,)
+    standings: Sequence[int] = (-1,)
+    drawOrder: Sequence[int] = (0,)
+
+
 class RelativeInfo:
     """Relative output data"""
 
     __slots__ = (
-        "relativeAhead",
-        "relativeBehind",
-        "standings",
-        "drawOrder",
+        "snapshot",
         "relativeDeltaAhead",
         "relativeDeltaBehind",
     )
 
     def __init__(self):
-        self.relativeAhead: list[tuple[float, int]] = [REL_TIME_DEFAULT]
-        self.relativeBehind: list[tuple[float, int]] = [REL_TIME_DEFAULT]
-        self.standings: list[int] = [-1]
-        self.drawOrder: list = [0]
+        self.snapshot: RelativeSnapshot = RelativeSnapshot()
         self.relativeDeltaAhead: tuple[DeltaTimeInterval, ...] = tuple(
             DeltaTimeInterval() for _ in range(MAX_VEHICLES)
         )
@@ -799,6 +959,37 @@ class RelativeInfo:
             DeltaTimeInterval() for _ in range(MAX_VEHICLES)
         )
 
+    def publish(
+        self, relative_ahead: list, relative_behind: list, standings: list, draw_order: list):
+        """Publish new relative data with single reference swap, lists must not be modified after"""
+        self.snapshot = RelativeSnapshot(
+            self.snapshot.version + 1,
+            relative_ahead,
+            relative_behind,
+            standings,
+            draw_order,
+        )
+
+    @property
+    def relativeAhead(self) -> Sequence[tuple[float, int]]:
+        """Relative ahead list"""
+        return self.snapshot.relativeAhead
+
+    @property
+    def relativeBehind(self) -> Sequence[tuple[float, int]]:
+        """Relative behind list"""
+        return self.snapshot.relativeBehind
+
+    @property
+    def standings(self) -> Sequence[int]:
+        """Standings index list"""
+        return self.snapshot.standings
+
+    @property
+    def drawOrder(self) -> Sequence[int]:
+        """Draw order list"""
+        return self.snapshot.drawOrder
+
 
 class SectorData:
     """Sector data set"""
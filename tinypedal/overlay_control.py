@@ -22,7 +22,11 @@ Overlay Control
 
 import logging
 import threading
-from time import sleep
+from collections import deque
+from math import gcd
+from time import perf_counter, sleep
+
+from PySide2.QtCore import QBasicTimer, QObject
 
 from . import app_signal, overlay_signal, realtime_state
 from .api_control import api
@@ -151,4 +155,117 @@ class OverlayControl:
         app_signal.reload.emit(False)
 
 
+class RenderClock(QObject):
+    """Render clock
+
+    Single timer that dispatches updates to all registered overlay widgets (GUI thread only).
+
+    Each widget is updated every N frames (period) according to its own update interval,
+    and is assigned a frame offset (phase) that has the least existing load,
+    so that widgets are spread evenly across frames.
+
+    Due widgets are updated in round-robin order within per-frame time budget,
+    any remaining widgets are deferred to next frame. Error from one widget
+    is logged (once per widget) and does not skip updates of other widgets.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._timer = QBasicTimer()
+        self._schedule: dict = {}  # widget: (period, phase)
+        self._pending: deque = deque()
+        self._pending_set: set = set()  # fast membership check of pending widgets
+        self._failed: set = set()  # widgets that raised error while updating
+        self._frame = 0
+        self._frame_interval = 10  # millisecond
+        self._frame_budget = 0.008  # second
+        self.deferred = 0  # total deferred updates
+
+    def register(self, widget, update_interval: int):
+        """Register widget for update
+
+        Args:
+            widget: overlay widget with render_update() method.
+            update_interval: widget update interval in milliseconds.
+        """
+        if not self._schedule:
+            self.__start()
+        period = max(round(update_interval / self._frame_interval), 1)
+        self._schedule[widget] = (period, self.__least_load_phase(period))
+
+    def unregister(self, widget):
+        """Unregister widget"""
+        if self._schedule.pop(widget, None) is None:
+            return
+        self._failed.discard(widget)
+        if widget in self._pending_set:
+            self._pending_set.remove(widget)
+            self._pending.remove(widget)
+        if not self._schedule:
+            self._timer.stop()
+            if self.deferred:
+                logger.info("RENDER CLOCK: %s deferred updates", self.deferred)
+                self.deferred = 0
+
+    def __start(self):
+        """Start render clock"""
+        self._frame_interval = max(
+            cfg.application["render_clock_update_interval"],
+            cfg.application["minimum_update_interval"],
+            1,
+        )
+        self._frame_budget = max(cfg.application["render_clock_frame_budget"], 1) / 1000
+        self._frame = 0
+        self._timer.start(self._frame_interval, self)
+
+    def __least_load_phase(self, period: int) -> int:
+        """Find phase (frame offset) that has least number of scheduled widgets"""
+        if period == 1:
+            return 0
+        phase_load = [0] * period
+        for other_period, other_phase in self._schedule.values():
+            # Widget (period, phase) shares frame with (other_period, other_phase)
+            # if phase & other_phase are congruent modulo common divisor
+            common = gcd(period, other_period)
+            for phase in range(period):
+                if (phase - other_phase) % common == 0:
+                    phase_load[phase] += 1
+        return phase_load.index(min(phase_load))
+
+    def timerEvent(self, event):
+        """Dispatch updates"""
+        self._frame += 1
+        frame = self._frame
+        pending = self._pending
+        pending_set = self._pending_set
+        deferred = len(pending)
+        for widget, (period, phase) in self._schedule.items():
+            if (frame - phase) % period == 0 and widget not in pending_set:
+                pending_set.add(widget)
+                pending.append(widget)
+
+        deadline = perf_counter() + self._frame_budget
+        while pending:
+            widget = pending.popleft()
+            pending_set.remove(widget)
+            try:
+                widget.render_update()
+            except Exception as error:  # keep dispatching remaining widgets
+                self.__log_error(widget, error)
+            if perf_counter() > deadline:
+                break
+        self.deferred += min(deferred, len(pending))
+
+    def __log_error(self, widget, error: Exception):
+        """Log widget update error, once per widget"""
+        if widget not in self._failed:
+            self._failed.add(widget)
+            logger.error(
+                "RENDER CLOCK: %s failed updating, %s",
+                getattr(widget, "widget_name", widget),
+                error,
+            )
+
+
 octrl = OverlayControl()
+rclock = RenderClock()
@@ -117,6 +117,10 @@ CFG_INTEGER = (
     "^manual_steering_range$|"
     "^maximum_loading_attempts$|"
     "^maximum_saving_attempts$|"
+    "^maximum_image_cache_size$|"
+    "^maximum_text_cache_size$|"
+    "^maximum_log_lines$|"
+    "^render_clock_frame_budget$|"
     "^player_index$|"
     "^parts_width$|"
     "^parts_maximum_height$|"
@@ -22,11 +22,12 @@ Setting
 
 from __future__ import annotations
 
+import atexit
 import logging
 import os
 import threading
 from collections import ChainMap
-from time import sleep
+from time import monotonic
 from types import MappingProxyType
 from typing import Any
 
@@ -36,6 +37,7 @@ from .const_common import EMPTY_DICT
 from .const_file import ConfigType, FileExt
 from .setting_validator import PresetValidator, StyleValidator
 from .userfile import set_global_config_path, set_user_data_path
+from .userfile.file_catalog import file_catalog
 from .userfile.json_setting import (
     copy_setting,
     load_setting_json_file,
@@ -46,6 +48,10 @@ from .validator import is_allowed_filename
 
 logger = logging.getLogger(__name__)
 
+SAVE_DELAY_UNIT = 0.01  # seconds per save delay count
+SAVE_EXIT_TIMEOUT = 10  # max waiting time (seconds) for unfinished saving on exit
+SAVE_RELOAD_TIMEOUT = 5  # max waiting time (seconds) for unfinished saving on reload or restart
+
 
 class FileName:
     """File name"""
@@ -180,8 +186,10 @@ class Setting:
     """APP setting"""
 
     __slots__ = (
-        "_save_delay",
+        "_save_condition",
+        "_save_deadline",
         "_save_queue",
+        "_save_thread",
         "_setting_to_load",
         "is_saving",
         "version_update",
@@ -193,8 +201,10 @@ class Setting:
 
     def __init__(self):
         # States
-        self._save_delay = 0
-        self._save_queue = {}
+        self._save_condition = threading.Condition()
+        self._save_deadline = 0.0
+        self._save_queue: dict[str, tuple[str, dict]] = {}
+        self._save_thread: threading.Thread | None = None
         self._setting_to_load = ""
         self.is_saving = False
         self.version_update = 0
@@ -388,11 +398,12 @@ class Setting:
         Returns:
             JSON filename (without file extension) list.
         """
+        file_entries = file_catalog.entries(self.path.settings)
         if by_date:
             date_file_list = (
-                (os.path.getmtime(f"{self.path.settings}{_filename}"), _filename[:-5])
-                for _filename in os.listdir(self.path.settings)
-                if _filename.lower().endswith(FileExt.JSON)
+                (_entry.mtime, _entry.name[:-5])
+                for _entry in file_entries
+                if _entry.name.lower().endswith(FileExt.JSON)
             )
             valid_file_list = [
                 _filename[1]
@@ -401,9 +412,9 @@ class Setting:
             ]
         else:
             name_file_list = (
-                _filename[:-5]
-                for _filename in os.listdir(self.path.settings)
-                if _filename.lower().endswith(FileExt.JSON)
+                _entry.name[:-5]
+                for _entry in file_entries
+                if _entry.name.lower().endswith(FileExt.JSON)
             )
             valid_file_list = [
                 _filename
@@ -425,9 +436,9 @@ class Setting:
             Backup filename list.
         """
         date_file_list = (
-            (os.path.getmtime(f"{filepath}{_filename}"), _filename)
-            for _filename in os.listdir(filepath)
-            if extension in _filename.lower()
+            (_entry.mtime, _entry.name)
+            for _entry in file_catalog.entries(filepath)
+            if extension in _entry.name.lower()
         )
         valid_file_list = [
             _filename[1]
@@ -449,75 +460,106 @@ class Setting:
     def save(self, delay: int = 66, config_type: str = ConfigType.SETTING, next_task: bool = False):
         """Save trigger, limit to one save operation for a given period.
 
+        Save requests are added to queue and saved by a single background writer thread.
+        Repeated requests for the same file are merged into one saving.
+
         Args:
-            count:
-                Set time delay(count) that can be refreshed before starting saving thread.
+            delay:
+                Set time delay(count) that can be refreshed before start saving.
                 Default is roughly one sec delay, use 0 for instant saving.
             config_type:
                 Set saving config type.
             next_task:
                 Skip adding save task, run next save task in queue.
         """
-        if next_task:
-            self._save_delay = 0
-            return
+        with self._save_condition:
+            if next_task:
+                self._save_deadline = 0.0
+                self._save_condition.notify_all()
+                return
+
+            self._save_deadline = monotonic() + delay * SAVE_DELAY_UNIT
+            filename = getattr(self.filename, config_type, None)
+
+            # Check if valid file name
+            if filename is None:
+                logger.error("USERDATA: invalid config type %s, abort saving", config_type)
+            # Check if file is locked
+            elif filename in self.user.filelock:
+                logger.info("USERDATA: %s is locked, changes not saved", filename)
+            # Add to save queue, or update queued (merge)
+            else:
+                # Save to global config path
+                if config_type in (
+                    ConfigType.CONFIG,
+                    ConfigType.FILELOCK,
+                    ConfigType.SHORTCUTS,
+                ):
+                    filepath = self.path.config
+                # Save to settings (preset) path
+                else:
+                    filepath = self.path.settings
+                dict_user = getattr(self.user, config_type)
+                self._save_queue[filename] = (filepath, dict_user)
+
+            if not self._save_queue:
+                return
 
-        self._save_delay = delay
-        filename = getattr(self.filename, config_type, None)
-        if filename in self._save_queue:
-            return
+            self.is_saving = True
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(target=self.__saving, daemon=True)
+                self._save_thread.start()
+                atexit.register(self.flush, SAVE_EXIT_TIMEOUT)
+            self._save_condition.notify_all()
 
-        # Check if valid file name
-        if filename is None:
-            logger.error("USERDATA: invalid config type %s, abort saving", config_type)
-        # Check if file is locked
-        elif filename in self.user.filelock:
-            logger.info("USERDATA: %s is locked, changes not saved", filename)
-        # Add to save queue
-        elif filename not in self._save_queue:
-            # Save to global config path
-            if config_type in (
-                ConfigType.CONFIG,
-                ConfigType.FILELOCK,
-                ConfigType.SHORTCUTS,
-            ):
-                filepath = self.path.config
-            # Save to settings (preset) path
-            else:
-                filepath = self.path.settings
-            dict_user = getattr(self.user, config_type)
-            self._save_queue[filename] = (filepath, dict_user)
+    def flush(self, timeout: float | None = None) -> bool:
+        """Save all files in queue without delay, and wait saving finish
 
-        if not self._save_queue:
-            return
+        Args:
+            timeout: maximum waiting time in seconds, None for no limit.
 
-        if not self.is_saving:
-            self.is_saving = True
-            threading.Thread(target=self.__saving).start()
+        Returns:
+            True if saving finished.
+        """
+        with self._save_condition:
+            self._save_deadline = 0.0
+            self._save_condition.notify_all()
+            return self._save_condition.wait_for(lambda: not self.is_saving, timeout)
 
     def __saving(self):
-        """Saving thread"""
-        # Update save delay
-        while self._save_delay > 0:
-            self._save_delay -= 1
-            sleep(0.01)
-
-        # Run next save task until queue empty
-        saving_attempts = self.max_saving_attempts
-        while self._save_queue:
-            for filename, (filepath, dict_user) in self._save_queue.items():
-                break  # get next file in queue
-
-            save_and_verify_json_file(
-                dict_user=dict_user,
-                filename=filename,
-                filepath=filepath,
-                max_attempts=saving_attempts,
-            )
-            self._save_queue.pop(filename, None)
-
-        self.is_saving = False
-        self.version_update += 1
+        """Saving thread (persistent), save files from queue"""
+        condition = self._save_condition
+        while True:
+            with condition:
+                # Wait next save task, and wait delay
+                while True:
+                    if not self._save_queue:
+                        if self.is_saving:
+                            self.is_saving = False
+                            self.version_update += 1
+                            condition.notify_all()
+                        condition.wait()
+                        continue
+                    remaining = self._save_deadline - monotonic()
+                    if remaining <= 0:
+                        break
+                    condition.wait(remaining)
+                # Get next file in queue, re-added if requested again while saving
+                filename = next(iter(self._save_queue))
+                filepath, dict_user = self._save_queue.pop(filename)
+                saving_attempts = self.max_saving_attempts
+
+            try:
+                save_and_verify_json_file(
+                    dict_user=dict_user,
+                    filename=filename,
+                    filepath=filepath,
+                    max_attempts=saving_attempts,
+                )
+            except (TypeError, ValueError):
+                logger.error("USERDATA: %s failed saving, invalid data", filename)
+            except Exception as error:  # keep saving thread alive, so is_saving can be reset
+                logger.error("USERDATA: %s failed saving, %s", filename, error)
 
     @property
     def max_saving_attempts(self) -> int:
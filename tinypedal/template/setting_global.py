@@ -44,8 +44,15 @@ GLOBAL_DEFAULT = {
         "snap_gap": 0,
         "grid_move_size": 8,
         "minimum_update_interval": 10,
+        "enable_render_clock": False,
+        "render_clock_update_interval": 10,
+        "render_clock_frame_budget": 8,
         "maximum_loading_attempts": 5,
         "maximum_saving_attempts": 10,
+        "maximum_image_cache_size": 32,
+        "maximum_text_cache_size": 16,
+        "maximum_log_lines": 5000,
+        "enable_userdata_database": False,
         "position_x": 0,
         "position_y": 0,
         "window_width": 0,
@@ -54,6 +61,7 @@ GLOBAL_DEFAULT = {
     },
     "compatibility": {
         "enable_bypass_window_manager": (not PLATFORM.WINDOWS),
+        "enable_overlay_compositor": False,
         "enable_translucent_background": True,
         "enable_window_position_correction": True,
         "enable_x11_platform_plugin_override": (not PLATFORM.WINDOWS),
@@ -67,6 +67,11 @@ MODULE_DEFAULT = {
         "update_interval": 10,
         "idle_update_interval": 400,
     },
+    "module_prefetch": {
+        "enable": True,
+        "update_interval": 400,
+        "idle_update_interval": 400,
+    },
     "module_relative": {
         "enable": True,
         "update_interval": 100,
@@ -21,7 +21,6 @@ Brake editor
 """
 
 import logging
-import time
 
 from PySide2.QtWidgets import (
     QComboBox,
@@ -249,7 +248,6 @@ class BrakeEditor(BaseEditor):
         self.update_brakes_temp()
         cfg.user.brakes = copy_setting(self.brakes_temp)
         cfg.save(0, config_type=ConfigType.BRAKES)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
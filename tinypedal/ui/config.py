@@ -24,7 +24,6 @@ from __future__ import annotations
 
 import os
 import re
-import time
 from itertools import islice, zip_longest
 from typing import Callable, Mapping, Sequence
 
@@ -200,8 +199,7 @@ class FontConfig(BaseDialog):
         self.edit_fontoffset.setValue(0)
         # Wait saving finish
         cfg.save(0)
-        while cfg.is_saving:
-            time.sleep(0.01)
+        cfg.flush()
         self.reloading()
 
 
@@ -387,8 +385,7 @@ class UserConfig(BaseDialog):
             else:
                 cfg.save(0)
             # Wait saving finish
-            while cfg.is_saving:
-                time.sleep(0.01)
+            cfg.flush()
         # Reload
         self.reloading()
 
@@ -20,7 +20,6 @@
 Heatmap editor
 """
 
-import time
 
 from PySide2.QtWidgets import (
     QComboBox,
@@ -328,8 +327,7 @@ class HeatmapEditor(BaseEditor):
         self.update_heatmap_temp()
         cfg.user.heatmap = copy_setting(self.heatmap_temp)
         cfg.save(0, config_type=ConfigType.HEATMAP)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
 
@@ -32,7 +32,7 @@ from PySide2.QtWidgets import (
 )
 
 from ..const_file import FileFilter
-from ..main import log_stream
+from ..log_handler import log_buffer
 from ._common import BaseDialog, CompactButton, UIScaler, singleton_dialog
 
 
@@ -45,7 +45,7 @@ class LogInfo(BaseDialog):
         self.set_utility_title("Log")
 
         self._update_timer = QBasicTimer()
-        self.last_position = -1
+        self.last_sequence = 0
 
         # Text view
         self.log_view = QTextBrowser(self)
@@ -92,10 +92,7 @@ class LogInfo(BaseDialog):
 
     def timerEvent(self, event):
         """Refresh log"""
-        position = log_stream.tell()
-        if self.last_position != position:
-            self.last_position = position
-            self.refresh_log()
+        self.update_log()
 
     def toggle_auto_refresh(self, checked: bool):
         """Toggle auto refresh"""
@@ -108,14 +105,31 @@ class LogInfo(BaseDialog):
 
     def refresh_log(self):
         """Refresh log"""
-        self.log_view.setText(log_stream.getvalue())
+        self.last_sequence, lines = log_buffer.read()
+        self.log_view.document().setMaximumBlockCount(log_buffer.maximum_lines)
+        self.log_view.setPlainText("\n".join(lines))
+        self.log_view.moveCursor(QTextCursor.End)
+
+    def update_log(self):
+        """Update log, append only new lines since last reading"""
+        sequence, lines = log_buffer.read(self.last_sequence)
+        if not lines:
+            return
+        if sequence - self.last_sequence > len(lines):  # older lines removed
+            self.refresh_log()
+            return
+        self.last_sequence = sequence
+        text = "\n".join(lines)
+        if not self.log_view.document().isEmpty():
+            text = f"\n{text}"
+        self.log_view.moveCursor(QTextCursor.End)
+        self.log_view.insertPlainText(text)
         self.log_view.moveCursor(QTextCursor.End)
 
     def clear_log(self):
         """Clear log"""
         if self.confirm_operation(message="Clear all log?"):
-            log_stream.truncate(0)
-            log_stream.seek(0)
+            log_buffer.clear()
             self.refresh_log()
 
     def copy_log(self):
@@ -134,7 +148,4 @@ class LogInfo(BaseDialog):
         if not filename_full:
             return
         with open(filename_full, "w", newline="", encoding="utf-8") as log_file:
-            log_stream.seek(0)
-            log_file.writelines(log_stream)
-        # Set back to end
-        log_stream.seek(2)
+            log_file.write(log_buffer.getvalue())
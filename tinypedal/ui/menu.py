@@ -28,12 +28,15 @@ from PySide2.QtWidgets import QMenu, QMessageBox
 from .. import app_signal, loader
 from ..api_control import api
 from ..const_app import PLATFORM, URL_FAQ, URL_USER_GUIDE
-from ..const_file import ConfigType
+from ..const_file import ConfigType, FileExt
 from ..formatter import format_option_name
 from ..module_info import minfo
 from ..overlay_control import octrl
 from ..setting import cfg
 from ..update import update_checker
+from ..userfile.delta_best import export_delta_best_file
+from ..userfile.fuel_delta import export_fuel_delta_file
+from ..userfile.userdata_store import data_exists, delete_data
 from .about import About
 from .brake_editor import BrakeEditor
 from .config import FontConfig, UserConfig
@@ -121,6 +124,10 @@ class OverlayMenu(QMenu):
         # Reset submenu
         menu_reset_data = ResetDataMenu("Reset Data", parent)
         self.addMenu(menu_reset_data)
+
+        # Export submenu
+        menu_export_data = ExportDataMenu("Export Data", parent)
+        self.addMenu(menu_export_data)
         self.addSeparator()
 
         # Quit
@@ -260,9 +267,8 @@ class ResetDataMenu(QMenu):
                 "Cannot reset data while on track.",
             )
             return False
-        # Check if file exist
-        filename_full = f"{filepath}{filename}.{extension}"
-        if not os.path.exists(filename_full):
+        # Check if data exist (include packed data file & database)
+        if not data_exists(filepath, filename, f".{extension}"):
             QMessageBox.warning(
                 self._parent,
                 "Error",
@@ -282,8 +288,8 @@ class ResetDataMenu(QMenu):
         )
         if delete_msg != QMessageBox.Yes:
             return False
-        # Delete file
-        os.remove(filename_full)
+        # Delete data
+        delete_data(filepath, filename, f".{extension}")
         QMessageBox.information(
             self._parent,
             f"Reset {data_type.title()}",
@@ -292,6 +298,65 @@ class ResetDataMenu(QMenu):
         return True
 
 
+class ExportDataMenu(QMenu):
+    """Export user data menu (packed binary or database to CSV format)"""
+
+    def __init__(self, title, parent):
+        super().__init__(title, parent)
+        self._parent = parent
+
+        export_deltabest = self.addAction("Delta Best")
+        export_deltabest.triggered.connect(self.export_deltabest)
+
+        export_energydelta = self.addAction("Energy Delta")
+        export_energydelta.triggered.connect(self.export_energydelta)
+
+        export_fueldelta = self.addAction("Fuel Delta")
+        export_fueldelta.triggered.connect(self.export_fueldelta)
+
+    def export_deltabest(self):
+        """Export deltabest data"""
+        filename = api.read.session.combo_name()
+        self.__notification(
+            data_type="delta best",
+            filename=filename,
+            exported=export_delta_best_file(cfg.path.delta_best, filename),
+        )
+
+    def export_energydelta(self):
+        """Export energy delta data"""
+        filename = api.read.session.combo_name()
+        self.__notification(
+            data_type="energy delta",
+            filename=filename,
+            exported=export_fuel_delta_file(cfg.path.energy_delta, filename, FileExt.ENERGY),
+        )
+
+    def export_fueldelta(self):
+        """Export fuel delta data"""
+        filename = api.read.session.combo_name()
+        self.__notification(
+            data_type="fuel delta",
+            filename=filename,
+            exported=export_fuel_delta_file(cfg.path.fuel_delta, filename, FileExt.FUEL),
+        )
+
+    def __notification(self, data_type: str, filename: str, exported: bool):
+        """Message notification"""
+        if not exported:
+            QMessageBox.warning(
+                self._parent,
+                "Error",
+                f"No valid {data_type} data found.<br><br>You can only export data from active session.",
+            )
+            return
+        QMessageBox.information(
+            self._parent,
+            f"Export {data_type.title()}",
+            f"{data_type.capitalize()} data has been exported (CSV format) for<br><b>{filename}</b>",
+        )
+
+
 class ConfigMenu(QMenu):
     """Config menu"""
 
@@ -200,6 +200,6 @@ class ModuleControlItem(QWidget):
         _dialog.open()
 
     def reload_module(self):
-        """Reload module & button state"""
-        self.module_control.reload(self.module_name)
+        """Reload module (or apply changes in place) & button state"""
+        self.module_control.update(self.module_name)
         self.update_state()
@@ -40,6 +40,7 @@ from .. import app_signal
 from ..const_app import VERSION
 from ..const_file import ConfigType, FileExt
 from ..setting import cfg
+from ..userfile.file_catalog import file_catalog
 from ._common import UIScaler
 from .preset_management import CreatePreset, PresetTransfer, RestoreBackup
 
@@ -54,7 +55,7 @@ class PresetList(QWidget):
 
         # Button
         button_refresh = QPushButton("Refresh")
-        button_refresh.clicked.connect(self.refresh)
+        button_refresh.clicked.connect(self.rescan)
 
         button_transfer = QPushButton("Transfer")
         button_transfer.clicked.connect(self.open_preset_transfer)
@@ -115,6 +116,11 @@ class PresetList(QWidget):
         self.label_loaded.setText(f"Loaded: <b>{loaded_preset[:-5]}{locked_tag}</b>")
         self.checkbox_autoload.setChecked(cfg.application["enable_auto_load_preset"])
 
+    def rescan(self):
+        """Rescan preset folder and refresh preset list"""
+        file_catalog.rescan(cfg.path.settings)
+        self.refresh()
+
     def load_preset(self):
         """Load selected preset"""
         selected_preset_name = self.listbox_preset.currentItem().text()
@@ -21,7 +21,6 @@ Track info editor
 """
 
 import logging
-import time
 
 from PySide2.QtCore import QPoint, Qt
 from PySide2.QtWidgets import (
@@ -284,7 +283,6 @@ class TrackInfoEditor(BaseEditor):
         self.update_tracks_temp()
         cfg.user.tracks = copy_setting(self.tracks_temp)
         cfg.save(0, config_type=ConfigType.TRACKS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
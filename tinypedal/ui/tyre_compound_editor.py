@@ -21,7 +21,6 @@ Tyre compound editor
 """
 
 import logging
-import time
 
 from PySide2.QtWidgets import (
     QComboBox,
@@ -269,7 +268,6 @@ class TyreCompoundEditor(BaseEditor):
         self.update_compounds_temp()
         cfg.user.compounds = copy_setting(self.compounds_temp)
         cfg.save(0, config_type=ConfigType.COMPOUNDS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
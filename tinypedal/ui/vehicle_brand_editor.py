@@ -26,7 +26,6 @@ import asyncio
 import json
 import logging
 import os
-import time
 
 from PySide2.QtWidgets import (
     QFileDialog,
@@ -327,8 +326,7 @@ class VehicleBrandEditor(BaseEditor):
         self.update_brands_temp()
         cfg.user.brands = copy_setting(self.brands_temp)
         cfg.save(0, config_type=ConfigType.BRANDS)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
 
@@ -21,7 +21,6 @@ Vehicle class editor
 """
 
 import random
-import time
 
 from PySide2.QtWidgets import (
     QHBoxLayout,
@@ -219,7 +218,6 @@ class VehicleClassEditor(BaseEditor):
         self.update_classes_temp()
         cfg.user.classes = copy_setting(self.classes_temp)
         cfg.save(0, config_type=ConfigType.CLASSES)
-        while cfg.is_saving:  # wait saving finish
-            time.sleep(0.01)
+        cfg.flush()  # wait saving finish
         self.reloading()
         self.set_unmodified()
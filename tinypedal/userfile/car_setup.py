@@ -18,16 +18,30 @@
 
 """
 Car setup file function
+
+Backup structure:
+    One setup file per unique setup content, named with latest backup info:
+        [game name] - [date & time] - [track name] - [class name] - [brand name] - [lap time].svm
+    One index file per game, track, class, brand:
+        [game name] - [track name] - [class name] - [brand name].setups
+    Index file contains list of backup entries (JSON), each entry records
+    date & time, content hash, stint best lap time, and current setup file name.
+    Entries of setup files that no longer exist are removed from index on saving.
+    Identical setups from different sessions share the same setup file, which is
+    renamed to date & time and stint best lap time of the latest backup.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 import os
 
 from ..const_common import CRLF, FLOAT_INF
 from ..const_file import FileExt
 from ..regex_pattern import rex_special_char
+from .file_writer import atomic_open, atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -55,7 +69,21 @@ def remove_car_setup_file(filepath: str, filename: str, extension: str = FileExt
         logger.error("USERDATA: %s not found", filename)
 
 
-def rename_car_setup_file(filepath: str, old_filename: str, new_filename: str, extension: str = FileExt.SVM):
+def save_car_setup_file(
+    filepath: str, filename: str, dataset: tuple[str],
+    extension: str = FileExt.SVM
+) -> None:
+    """Save car setup file"""
+    if len(dataset) < 2:
+        return
+    with atomic_open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as temp_file:
+        for line in dataset:
+            temp_file.write(line)
+            temp_file.write(CRLF)
+        logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def rename_car_setup_file(filepath: str, old_filename: str, new_filename: str, extension: str = FileExt.SVM) -> bool:
     """Rename car setup file"""
     try:
         os.rename(
@@ -63,19 +91,115 @@ def rename_car_setup_file(filepath: str, old_filename: str, new_filename: str, e
             f"{filepath}{new_filename}{extension}",
         )
         logger.info("USERDATA: %s%s updated", new_filename, extension)
+        return True
     except (FileNotFoundError, PermissionError, OSError):
         logger.error("USERDATA: backup not found %s", new_filename)
+        return False
 
 
-def save_car_setup_file(
-    filepath: str, filename: str, dataset: tuple[str],
-    extension: str = FileExt.SVM
+def hash_car_setup(dataset: tuple[str, ...]) -> str:
+    """Hash car setup content (persistent across sessions)"""
+    return hashlib.blake2b(CRLF.join(dataset).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def load_car_setup_index(filepath: str, filename: str, extension: str = FileExt.SETUPS) -> list[dict]:
+    """Load car setup backup index, return empty list if not found or invalid"""
+    try:
+        with open(f"{filepath}{filename}{extension}", "r", encoding="utf-8") as jsonfile:
+            index = json.load(jsonfile)
+        if not isinstance(index, list):
+            raise TypeError
+        return [
+            entry for entry in index
+            if isinstance(entry, dict)
+            and isinstance(entry.get("hash"), str)
+            and isinstance(entry.get("timestamp"), str)
+            and isinstance(entry.get("filename"), str)
+        ]
+    except FileNotFoundError:
+        return []
+    except (AttributeError, TypeError, ValueError, OSError):
+        logger.error("USERDATA: %s%s is invalid, index reset", filename, extension)
+        return []
+
+
+def save_car_setup_index(
+    filepath: str, filename: str, index: list[dict], extension: str = FileExt.SETUPS
 ) -> None:
-    """Save car setup file"""
+    """Save car setup backup index, remove entries of setup files that no longer exist"""
+    existing = {
+        entry["filename"] for entry in index
+        if os.path.exists(f"{filepath}{entry['filename']}{FileExt.SVM}")
+    }
+    try:
+        atomic_write(
+            f"{filepath}{filename}{extension}",
+            json.dumps([entry for entry in index if entry["filename"] in existing], indent=4),
+        )
+    except OSError:
+        logger.error("USERDATA: failed saving %s%s", filename, extension)
+
+
+def rename_car_setup_entry(filepath: str, index: list[dict], setup_hash: str, new_filename: str) -> bool:
+    """Rename car setup file of setup hash to new name, update file name of all matched entries"""
+    for entry in reversed(index):
+        if entry["hash"] == setup_hash:
+            old_filename = entry["filename"]
+            break
+    else:
+        return False
+    if not os.path.exists(f"{filepath}{old_filename}{FileExt.SVM}"):
+        return False
+    if old_filename != new_filename and not rename_car_setup_file(filepath, old_filename, new_filename):
+        return False
+    for entry in index:
+        if entry["hash"] == setup_hash:
+            entry["filename"] = new_filename
+    return True
+
+
+def backup_car_setup(
+    filepath: str, filename: str, index_filename: str, timestamp: str, dataset: tuple[str, ...]
+) -> bool:
+    """Backup car setup
+
+    Identical setup file found in index is renamed to new file name,
+    otherwise setup file is saved, and a new backup entry is added to index.
+
+    Args:
+        filepath: car setup file path.
+        filename: car setup file name (game, date & time, track, class, brand).
+        index_filename: car setup index name (game, track, class, brand).
+        timestamp: backup date & time.
+        dataset: car setup content (lines).
+
+    Returns:
+        True if backup added.
+    """
     if len(dataset) < 2:
-        return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as temp_file:
-        for line in dataset:
-            temp_file.write(line)
-            temp_file.write(CRLF)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+        return False
+    setup_hash = hash_car_setup(dataset)
+    index = load_car_setup_index(filepath, index_filename)
+    if not rename_car_setup_entry(filepath, index, setup_hash, filename):
+        save_car_setup_file(filepath, filename, dataset)
+    index.append({"hash": setup_hash, "timestamp": timestamp, "laptime": 0.0, "filename": filename})
+    save_car_setup_index(filepath, index_filename, index)
+    return True
+
+
+def update_car_setup_laptime(filepath: str, index_filename: str, timestamp: str, laptime: float) -> None:
+    """Update stint best lap time of car setup backup entry, append lap time to setup file name
+
+    Lap time is appended as "0-00-000" if no valid lap time set.
+    """
+    index = load_car_setup_index(filepath, index_filename)
+    for entry in reversed(index):
+        if entry["timestamp"] == timestamp:
+            entry["laptime"] = laptime if laptime < FLOAT_INF else 0.0
+            rename_car_setup_entry(
+                filepath, index, entry["hash"],
+                f"{entry['filename']} - {set_car_setup_laptime(laptime)}",
+            )
+            save_car_setup_index(filepath, index_filename, index)
+            return
+    logger.error("USERDATA: backup not found %s", timestamp)
@@ -23,29 +23,50 @@ Consumption history file function
 from __future__ import annotations
 
 import csv
+import json
 import logging
+import os
+from typing import Sequence
 
 from ..const_file import FileExt
 from ..module_info import ConsumptionDataSet
 from ..validator import dict_value_type, invalid_save_name
+from .file_writer import append_write, atomic_open
+from .userdata_cache import userdata_cache
 
 logger = logging.getLogger(__name__)
 
+MAX_HISTORY_RECORDS = 100  # same as consumption history data set size
+JOURNAL_COMPACT_RECORDS = 20  # number of journal records before compacting
+
 
 def load_consumption_history_file(
     filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
 ) -> tuple[ConsumptionDataSet, ...]:
-    """Load fuel/energy consumption history file (*.consumption)"""
+    """Load fuel/energy consumption history file (*.consumption & *.consumption.journal)
+
+    Consumption history file structure:
+        Snapshot (*.consumption): CSV with header, one record per row, newest first.
+        Journal (*.consumption.journal): one record (json array) per line, oldest first,
+            appended after each save, and compacted into snapshot after number of records.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.DictReader(csvfile, restval="", restkey="unknown")
-            default_data = ConsumptionDataSet._field_defaults
-            dataset = tuple(
-                ConsumptionDataSet(**dict_value_type(data, default_data))
-                for data in data_reader
-            )
-            if not dataset:
-                raise ValueError
+        try:
+            with open(filename_full, newline="", encoding="utf-8") as csvfile:
+                snapshot = parse_consumption_history(csv.DictReader(csvfile, restval="", restkey="unknown"))
+        except FileNotFoundError:
+            snapshot = ()
+        journal = load_consumption_history_journal(f"{filename_full}{FileExt.JOURNAL}")
+        if not snapshot and not journal:
+            raise FileNotFoundError
+        # Skip journal if already compacted into snapshot (deleting journal interrupted)
+        journal_newest = tuple(reversed(journal))
+        if snapshot[:len(journal_newest)] == journal_newest:
+            journal_newest = ()
+        dataset = (journal_newest + snapshot)[:MAX_HISTORY_RECORDS]
+        if not dataset:
+            raise ValueError
         return dataset
     except FileNotFoundError:
         logger.info("MISSING: consumption history (%s) data", extension)
@@ -54,14 +75,71 @@ def load_consumption_history_file(
     return (ConsumptionDataSet(),)
 
 
+def load_consumption_history_journal(filename_full: str) -> tuple[ConsumptionDataSet, ...]:
+    """Load consumption history journal (skip incomplete records), oldest first"""
+    try:
+        with open(filename_full, "r", encoding="utf-8") as jsonfile:
+            lines = jsonfile.read().splitlines()
+    except FileNotFoundError:
+        return ()
+    fields = ConsumptionDataSet._fields
+    default_data = ConsumptionDataSet._field_defaults
+    records = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            values = json.loads(line)
+            if not isinstance(values, list) or len(values) != len(fields):
+                continue
+            records.append(ConsumptionDataSet(**dict_value_type(dict(zip(fields, values)), default_data)))
+        except (TypeError, ValueError):  # skip incomplete record
+            continue
+    return tuple(records)
+
+
+def parse_consumption_history(data_reader: csv.DictReader) -> tuple[ConsumptionDataSet, ...]:
+    """Parse consumption history rows"""
+    default_data = ConsumptionDataSet._field_defaults
+    return tuple(
+        ConsumptionDataSet(**dict_value_type(data, default_data))
+        for data in data_reader
+    )
+
+
 def save_consumption_history_file(
-    dataset: tuple, filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
+    dataset: Sequence[ConsumptionDataSet], filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
 ) -> None:
-    """Save fuel/energy consumption history file (*.consumption)"""
+    """Save fuel/energy consumption history file (snapshot), replaces existing snapshot & journal"""
     if len(dataset) < 2 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    filename_full = f"{filepath}{filename}{extension}"
+    userdata_cache.invalidate(filepath, filename, extension)
+    with atomic_open(filename_full, "w", newline="", encoding="utf-8") as csvfile:
         data_writer = csv.writer(csvfile, quoting=csv.QUOTE_NONNUMERIC)
         data_writer.writerow(ConsumptionDataSet._fields)  # write field name as column header
         data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    try:
+        os.remove(f"{filename_full}{FileExt.JOURNAL}")
+    except FileNotFoundError:
+        pass
+    logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def append_consumption_history_file(
+    records: Sequence[ConsumptionDataSet], filepath: str, filename: str, extension: str = FileExt.CONSUMPTION
+) -> None:
+    """Append new consumption history records (oldest first) to journal, compact if reached limit"""
+    if not records or invalid_save_name(filename):
+        return
+    filename_journal = f"{filepath}{filename}{extension}{FileExt.JOURNAL}"
+    userdata_cache.invalidate(filepath, filename, extension)
+    append_write(filename_journal, "".join(
+        f"\n{json.dumps(record, separators=(',', ':'))}" for record in records))
+    logger.info("USERDATA: %s%s saved (journal, %s records)", filename, extension, len(records))
+    # Compact journal into snapshot
+    if len(load_consumption_history_journal(filename_journal)) >= JOURNAL_COMPACT_RECORDS:
+        save_consumption_history_file(
+            load_consumption_history_file(filepath, filename, extension),
+            filepath, filename, extension,
+        )
@@ -20,11 +20,14 @@
 Custom image file function
 """
 
+import os
+
 from PySide2.QtCore import Qt
 from PySide2.QtGui import QPainter, QPixmap
 
 from ..const_file import FileExt
 from ..validator import image_exists
+from .file_catalog import file_catalog
 
 
 def split_pixmap_image(
@@ -49,9 +52,16 @@ def load_brand_logo_image(
     filepath:str, filename: str, max_width: int, max_height: int, extension: str = FileExt.PNG
 ) -> QPixmap:
     """Load brand logo image (*.png)"""
-    filename_full = f"{filepath}{filename}{extension}"
-    # Check existing file and size < 5MB
-    if not image_exists(filename_full, extension, 5_120_000):
+    # Check existing file (from catalog)
+    file_entry = file_catalog.find(filepath, f"{filename}{extension}")
+    if file_entry is None:
+        return QPixmap()
+    # Check current size < 5MB, as catalog size is not updated on in-place file edit
+    filename_full = f"{filepath}{file_entry.name}"
+    try:
+        if os.stat(filename_full).st_size >= 5_120_000:
+            return QPixmap()
+    except OSError:
         return QPixmap()
     # Load and scale logo
     image = QPixmap(filename_full)
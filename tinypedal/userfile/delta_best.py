@@ -22,11 +22,12 @@ Delta best file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name, valid_delta_set
+from .userdata_cache import userdata_cache
+from .userdata_store import export_columns_data, load_columns_data, save_rows_data
 
 logger = logging.getLogger(__name__)
 
@@ -34,14 +35,14 @@ logger = logging.getLogger(__name__)
 def load_delta_best_file(
     filepath: str, filename: str, defaults: tuple, extension: str = FileExt.CSV
 ) -> tuple[tuple, float]:
-    """Load delta best file (*.csv)"""
+    """Load delta best file (prefetched, database or *.csv.bin, or import from *.csv)
+
+    Returns:
+        Data set (distance, laptime columns), best laptime.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
-        # Validate data
-        bestlist = valid_delta_set(temp_list)
-        laptime_best = bestlist[-1][1]
+        bestlist = userdata_cache.load(load_columns_data, filepath, filename, extension, valid_delta_set)
+        laptime_best = bestlist[1][-1]
         return bestlist, laptime_best
     except FileNotFoundError:
         logger.info("MISSING: delta best (%s) data", extension)
@@ -50,13 +51,31 @@ def load_delta_best_file(
     return defaults
 
 
+def prefetch_delta_best_file(filepath: str, filename: str, extension: str = FileExt.CSV) -> bool:
+    """Prefetch delta best file"""
+    return userdata_cache.prefetch(load_columns_data, filepath, filename, extension, valid_delta_set)
+
+
 def save_delta_best_file(
     filepath: str, filename: str, dataset: tuple, extension: str = FileExt.CSV
 ) -> None:
-    """Save delta best file (*.csv)"""
+    """Save delta best file (database if enabled, or *.csv.bin)"""
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_rows_data(filepath, filename, extension, dataset)
+    logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def export_delta_best_file(filepath: str, filename: str, extension: str = FileExt.CSV) -> bool:
+    """Export delta best file (database or *.csv.bin) to *.csv, returns true if exported"""
+    try:
+        export_columns_data(filepath, filename, extension, valid_delta_set)
+        logger.info("USERDATA: %s%s exported", filename, extension)
+        return True
+    except FileNotFoundError:
+        logger.info("MISSING: delta best (%s) data", extension)
+    except (IndexError, ValueError, TypeError):
+        logger.info("MISSING: invalid delta best (%s) data", extension)
+    except OSError:
+        logger.info("USERDATA: failed exporting %s%s", filename, extension)
+    return False
@@ -24,22 +24,28 @@ from __future__ import annotations
 
 import json
 import logging
+import os
+import threading
 from dataclasses import dataclass
-from time import sleep
-from typing import KeysView, get_type_hints
+from typing import KeysView, Mapping, Sequence, get_type_hints
 
 from ..const_common import MAX_SECONDS
 from ..const_file import FileExt, StatsFile
 from ..validator import convert_value_type, purge_data_key
+from .file_writer import append_write
 from .json_setting import (
     create_backup_file,
     save_and_verify_json_file,
     save_json_file,
     set_backup_timestamp,
 )
+from .userdata_cache import userdata_cache
 
 logger = logging.getLogger(__name__)
 
+JOURNAL_COMPACT_RECORDS = 50  # number of journal records before compacting
+stats_file_lock = threading.Lock()  # guard journal appending & compacting
+
 
 @dataclass
 class DriverStats:
@@ -112,11 +118,8 @@ def get_sub_dict(source: dict, key_name: str) -> dict:
 def load_driver_stats(
     key_list: tuple[str, str], filepath: str, filename: str = StatsFile.DRIVER
 ) -> DriverStats:
-    """Load driver stats"""
-    stats_user = load_stats_json_file(
-        filepath=filepath,
-        filename=filename,
-    )
+    """Load driver stats (prefetched or from file)"""
+    stats_user = userdata_cache.load(load_stats_json_file, filepath, filename, FileExt.STATS)
     if stats_user is None:
         return DriverStats()
     # Get data from matching key
@@ -136,28 +139,48 @@ def load_driver_stats(
 def save_driver_stats(
     key_list: tuple[str, str], stats_update: DriverStats, filepath: str, filename: str = StatsFile.DRIVER
 ) -> None:
-    """Save driver stats"""
+    """Save driver stats (append record to stats journal), compact journal if reached limit"""
     if not key_list or not all(key_list):  # ignore invalid key name
         return
-    # Load stats with limited attempts
-    load_attempts = 10
-    while load_attempts > 0:
-        stats_user = load_stats_json_file(
-            filepath=filepath,
-            filename=filename,
-            show_log=False,
-        )
-        if stats_user is not None:
-            break
-        load_attempts -= 1
-        logger.info("USERDATA: unable to load %s%s, %s attempt(s) left", filename, FileExt.STATS, load_attempts)
-        sleep(0.05)
-    # Create backup if failed to load stats
+    record = json.dumps({"keys": key_list, "stats": stats_update.__dict__}, separators=(",", ":"))
+    filename_journal = f"{filepath}{filename}{FileExt.STATS}{FileExt.JOURNAL}"
+    userdata_cache.invalidate(filepath, filename, FileExt.STATS)
+    try:
+        with stats_file_lock:
+            append_write(filename_journal, f"\n{record}")
+            logger.info("USERDATA: %s%s saved (journal)", filename, FileExt.STATS)
+            if len(load_stats_journal(filename_journal)) >= JOURNAL_COMPACT_RECORDS:
+                compact_stats_journal(filepath, filename, FileExt.STATS)
+    except OSError:
+        logger.error("USERDATA: %s%s failed saving", filename, FileExt.STATS)
+
+
+def compact_stats_journal(filepath: str, filename: str, extension: str) -> None:
+    """Merge stats journal into stats file (snapshot), and remove journal
+
+    Invalid stats file is backed up and reset before merging.
+    Must be called with stats_file_lock acquired.
+
+    Raises:
+        OSError: if failed saving.
+    """
+    filename_journal = f"{filepath}{filename}{extension}{FileExt.JOURNAL}"
+    stats_user = read_stats_json_file(filepath, filename, extension)
     if stats_user is None:
-        logger.info("USERDATA: unable to load %s%s, creating backup", filename, FileExt.STATS)
-        if not create_backup_file(f"{filename}{FileExt.STATS}", filepath, set_backup_timestamp(), show_log=True):
-            return  # abort saving if failed to create backup
-        stats_user = {}  # reset stats
+        logger.info("USERDATA: unable to load %s%s, creating backup", filename, extension)
+        if not create_backup_file(f"{filename}{extension}", filepath, set_backup_timestamp(), show_log=True):
+            return  # abort compacting if failed to create backup
+        stats_user = {}
+    records = load_stats_journal(filename_journal)
+    for record in records:
+        update_driver_stats(stats_user, record["keys"], record["stats"])
+    save_json_file(stats_user, filename, filepath, extension, compact_json=True)
+    os.remove(filename_journal)
+    logger.info("USERDATA: %s%s compacted (%s records)", filename, extension, len(records))
+
+
+def update_driver_stats(stats_user: dict, key_list: Sequence[str], stats_update: Mapping) -> None:
+    """Update (merge) driver stats record into stats"""
     # Get data from matching key
     loaded_dict = stats_user
     for key in key_list:
@@ -165,7 +188,9 @@ def save_driver_stats(
     # Verify and update new data
     default_dict = DriverStats.__dict__
     default_type = get_type_hints(DriverStats)
-    for key, value in stats_update.__dict__.items():
+    for key, value in stats_update.items():
+        if key not in default_type or not isinstance(value, (int, float)):
+            continue  # ignore unknown key or invalid value
         # Add new default value if not exists
         if key not in loaded_dict:
             loaded_dict[key] = default_dict[key]
@@ -181,44 +206,89 @@ def save_driver_stats(
             continue
         # Update value (increment)
         loaded_dict[key] += value
-    # Save new data
-    save_stats_json_file(
-        stats_user=stats_user,
-        filepath=filepath,
-        filename=filename,
-    )
 
 
-def load_stats_json_file(
-    filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS, show_log: bool = True
-) -> dict | None:
-    """Load stats json file, create new if not exists, or returns "None" if invalid"""
+def load_stats_journal(filename_full: str) -> list[dict]:
+    """Load stats journal records (skip incomplete records), oldest first"""
+    try:
+        with open(filename_full, "r", encoding="utf-8") as jsonfile:
+            lines = jsonfile.read().splitlines()
+    except FileNotFoundError:
+        return []
+    records = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:  # skip incomplete record
+            continue
+        if (
+            isinstance(record, dict)
+            and isinstance(record.get("keys"), list)
+            and all(record["keys"])
+            and isinstance(record.get("stats"), dict)
+        ):
+            records.append(record)
+    return records
+
+
+def read_stats_json_file(filepath: str, filename: str, extension: str) -> dict | None:
+    """Read stats json file (snapshot only), returns empty dict if not exists, or "None" if invalid"""
     try:
         with open(f"{filepath}{filename}{extension}", "r", encoding="utf-8") as jsonfile:
             stats_user = json.load(jsonfile)
-            if not isinstance(stats_user, dict):
-                raise TypeError
-            return stats_user
-    except FileNotFoundError:
-        if show_log:
-            logger.info("MISSING: %s stats (%s) data, create new stats", filename, extension)
-        stats_user = {}
-        save_json_file(stats_user, filename, filepath, extension, compact_json=True)
+        if not isinstance(stats_user, dict):
+            raise TypeError
         return stats_user
+    except FileNotFoundError:
+        return {}
     except (AttributeError, TypeError, KeyError, ValueError):
-        if show_log:
-            logger.info("MISSING: invalid %s stats (%s) data", filename, extension)
-    return None
+        return None
+
+
+def load_stats_json_file(
+    filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS, show_log: bool = True
+) -> dict | None:
+    """Load stats json file (snapshot & journal), create new if not exists, or returns "None" if invalid
+
+    Stats file structure:
+        Snapshot (*.stats): stats in compact json format.
+        Journal (*.stats.journal): one stats update record (json) per line, oldest first,
+            appended after each save, and compacted into snapshot after number of records.
+
+    Journal records are merged into loaded stats only, file is not modified.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    with stats_file_lock:
+        if not os.path.exists(filename_full):
+            if show_log:
+                logger.info("MISSING: %s stats (%s) data, create new stats", filename, extension)
+            save_json_file({}, filename, filepath, extension, compact_json=True)
+        stats_user = read_stats_json_file(filepath, filename, extension)
+        if stats_user is None:
+            if show_log:
+                logger.info("MISSING: invalid %s stats (%s) data", filename, extension)
+            return None
+        for record in load_stats_journal(f"{filename_full}{FileExt.JOURNAL}"):
+            update_driver_stats(stats_user, record["keys"], record["stats"])
+    return stats_user
 
 
 def save_stats_json_file(
     stats_user: dict, filepath: str, filename: str = StatsFile.DRIVER, extension: str = FileExt.STATS
 ) -> None:
-    """Save stats to json file"""
-    save_and_verify_json_file(
-        dict_user=stats_user,
-        filename=f"{filename}{extension}",
-        filepath=filepath,
-        max_attempts=10,
-        compact_json=True,
-    )
+    """Save stats to json file (snapshot), replaces existing snapshot & journal"""
+    userdata_cache.invalidate(filepath, filename, extension)
+    with stats_file_lock:
+        save_and_verify_json_file(
+            dict_user=stats_user,
+            filename=f"{filename}{extension}",
+            filepath=filepath,
+            max_attempts=10,
+            compact_json=True,
+        )
+        try:
+            os.remove(f"{filepath}{filename}{extension}{FileExt.JOURNAL}")
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,113 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+File catalog function
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from time import time_ns
+from typing import NamedTuple
+
+# Directory modified within this time (nanoseconds) since scanning is rescanned,
+# as same-tick changes may not update directory modified time on coarse filesystem
+RACY_TIME_NS = 2_000_000_000
+
+
+class FileEntry(NamedTuple):
+    """File entry"""
+
+    name: str
+    mtime: float
+    size: int
+
+
+class FileCatalog:
+    """File catalog
+
+    Stores file entries (name, modified time, size) of scanned folders in memory,
+    keyed by folder path. Folder is only rescanned if folder modified time changed
+    (file added, removed, renamed or replaced), or on explicit rescan.
+
+    In-place file edit does not change folder modified time, so file modified time
+    & size of cached entry can be outdated until rescan (such as preset Refresh).
+    Re-stat file found from catalog if current modified time or size is required.
+
+    File lookup by name is case-insensitive on case-insensitive platform (Windows).
+    """
+
+    __slots__ = (
+        "_lock",
+        "_folders",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._folders: dict[str, tuple[int, int, dict[str, FileEntry]]] = {}
+
+    def rescan(self, filepath: str = ""):
+        """Mark folder for rescanning on next access, or all folders if not specified"""
+        with self._lock:
+            if filepath:
+                self._folders.pop(os.path.abspath(filepath), None)
+            else:
+                self._folders.clear()
+
+    def entries(self, filepath: str) -> tuple[FileEntry, ...]:
+        """Get file entries in folder, empty if folder not exist"""
+        return tuple(self.__scan(filepath).values())
+
+    def find(self, filepath: str, filename: str) -> FileEntry | None:
+        """Find file entry in folder by file name (with extension)"""
+        return self.__scan(filepath).get(os.path.normcase(filename))
+
+    def __scan(self, filepath: str) -> dict[str, FileEntry]:
+        """Scan folder if changed since last scanning"""
+        key = os.path.abspath(filepath)
+        try:
+            folder_mtime = os.stat(key).st_mtime_ns
+        except OSError:
+            return {}
+        with self._lock:
+            cached = self._folders.get(key)
+        if cached is not None and cached[0] == folder_mtime and cached[1] - folder_mtime > RACY_TIME_NS:
+            return cached[2]
+        scan_time = time_ns()
+        files = {}
+        try:
+            with os.scandir(key) as folder:
+                for entry in folder:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        file_stat = entry.stat()
+                    except OSError:
+                        continue
+                    files[os.path.normcase(entry.name)] = FileEntry(
+                        entry.name, file_stat.st_mtime, file_stat.st_size)
+        except OSError:
+            return {}
+        with self._lock:
+            self._folders[key] = (folder_mtime, scan_time, files)
+        return files
+
+
+file_catalog = FileCatalog()
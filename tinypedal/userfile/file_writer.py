@@ -0,0 +1,175 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Atomic file writer function
+
+Saving steps:
+    1. Write data to temporary file in same folder as target file.
+    2. Flush and fsync temporary file.
+    3. Replace target file with temporary file (atomic).
+
+Target file is either fully updated or left untouched if saving failed,
+and never left partially written.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+import threading
+from contextlib import contextmanager
+from typing import Iterator
+
+TEMP_EXTENSION = ".tmp"
+
+
+class ContentHashCache:
+    """Content hash cache
+
+    Keep content hash and file stat of last saved files,
+    which is used for skipping saving if content unchanged.
+    File stat is checked, so that file modified or deleted
+    after last saving (ex. externally) is saved again.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_hashes",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hashes: dict[str, tuple[bytes, int, int]] = {}
+
+    def is_unchanged(self, filename_full: str, digest: bytes) -> bool:
+        """Check whether file content unchanged since last saving"""
+        with self._lock:
+            saved = self._hashes.get(filename_full)
+        if saved is None or saved[0] != digest:
+            return False
+        try:
+            file_stat = os.stat(filename_full)
+        except OSError:
+            return False
+        return saved[1] == file_stat.st_mtime_ns and saved[2] == file_stat.st_size
+
+    def update(self, filename_full: str, digest: bytes):
+        """Update content hash after saving"""
+        file_stat = os.stat(filename_full)
+        with self._lock:
+            self._hashes[filename_full] = (digest, file_stat.st_mtime_ns, file_stat.st_size)
+
+    def discard(self, filename_full: str):
+        """Discard content hash"""
+        with self._lock:
+            self._hashes.pop(filename_full, None)
+
+
+def atomic_write(
+    filename_full: str, data: str | bytes, encoding: str = "utf-8", newline: str | None = None
+) -> bool:
+    """Write data to file (atomic), skip if content unchanged since last saving
+
+    Args:
+        filename_full: full file path & name.
+        data: text (str) or binary (bytes) data.
+        encoding: text encoding, ignored for binary data.
+        newline: newline translation for text data, same as open().
+
+    Returns:
+        True if saved, False if skipped (content unchanged).
+
+    Raises:
+        OSError: if failed saving, target file is not modified.
+    """
+    is_binary = isinstance(data, bytes)
+    digest = hashlib.blake2b(
+        data if is_binary else data.encode(encoding, "surrogatepass"),  # type: ignore[union-attr]
+        digest_size=16,
+    ).digest()
+    filename_full = os.path.abspath(filename_full)
+    if content_hash_cache.is_unchanged(filename_full, digest):
+        return False
+    filename_temp = f"{filename_full}.{os.getpid()}.{threading.get_ident()}{TEMP_EXTENSION}"
+    try:
+        if is_binary:
+            temp_file = open(filename_temp, "wb")
+        else:
+            temp_file = open(filename_temp, "w", encoding=encoding, newline=newline)
+        with temp_file:
+            temp_file.write(data)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        os.replace(filename_temp, filename_full)
+    except BaseException:
+        content_hash_cache.discard(filename_full)
+        try:
+            os.remove(filename_temp)
+        except OSError:
+            pass
+        raise
+    content_hash_cache.update(filename_full, digest)
+    return True
+
+
+def append_write(
+    filename_full: str, data: str, encoding: str = "utf-8", newline: str | None = None
+) -> None:
+    """Append text data to file (create if not exist), flush and fsync after writing
+
+    Used for append-only journal file, a crash while appending
+    may only leave last (incomplete) line partially written.
+
+    Raises:
+        OSError: if failed saving.
+    """
+    filename_full = os.path.abspath(filename_full)
+    content_hash_cache.discard(filename_full)
+    with open(filename_full, "a", encoding=encoding, newline=newline) as append_file:
+        append_file.write(data)
+        append_file.flush()
+        os.fsync(append_file.fileno())
+
+
+@contextmanager
+def atomic_open(
+    filename_full: str, mode: str = "w", encoding: str = "utf-8", newline: str | None = None
+) -> Iterator[io.StringIO | io.BytesIO]:
+    """Open file for writing (atomic), same usage as open() for writing
+
+    Data is written to memory buffer, and saved to file on exit
+    without error, see atomic_write() for details.
+
+    Args:
+        filename_full: full file path & name.
+        mode: "w" for text, "wb" for binary.
+        encoding: text encoding, ignored in binary mode.
+        newline: newline translation in text mode, same as open().
+    """
+    if "b" in mode:
+        buffer: io.StringIO | io.BytesIO = io.BytesIO()
+    else:
+        buffer = io.StringIO(newline="")  # translate newline on saving
+    with buffer:
+        yield buffer
+        atomic_write(filename_full, buffer.getvalue(), encoding, newline)
+
+
+content_hash_cache = ContentHashCache()
@@ -22,10 +22,11 @@ Fuel/Energy delta file function
 
 from __future__ import annotations
 
-import csv
 import logging
 
 from ..validator import invalid_save_name, valid_delta_set
+from .userdata_cache import userdata_cache
+from .userdata_store import export_columns_data, load_columns_data, save_rows_data
 
 logger = logging.getLogger(__name__)
 
@@ -33,15 +34,15 @@ logger = logging.getLogger(__name__)
 def load_fuel_delta_file(
     filepath: str, filename: str, extension: str, defaults: tuple
 ) -> tuple[tuple, float, float]:
-    """Load fuel/energy delta file (*.fuel, *.energy)"""
+    """Load fuel/energy delta file (prefetched, database or *.fuel.bin, *.energy.bin, or import from *.fuel, *.energy)
+
+    Returns:
+        Data set (distance, used, laptime columns), last used, last laptime.
+    """
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
-            temp_list = tuple(tuple(data) for data in data_reader)
-        # Validate data
-        lastlist = valid_delta_set(temp_list)
-        used_last = lastlist[-1][1]
-        laptime_last = lastlist[-1][2]
+        lastlist = userdata_cache.load(load_columns_data, filepath, filename, extension, valid_delta_set)
+        used_last = lastlist[1][-1]
+        laptime_last = lastlist[2][-1]
         return lastlist, used_last, laptime_last
     except FileNotFoundError:
         logger.info("MISSING: consumption delta (%s) data", extension)
@@ -50,13 +51,31 @@ def load_fuel_delta_file(
     return defaults
 
 
+def prefetch_fuel_delta_file(filepath: str, filename: str, extension: str) -> bool:
+    """Prefetch fuel/energy delta file"""
+    return userdata_cache.prefetch(load_columns_data, filepath, filename, extension, valid_delta_set)
+
+
 def save_fuel_delta_file(
     filepath: str, filename: str, extension: str, dataset: tuple
 ) -> None:
-    """Save fuel/energy delta file (*.fuel, *.energy)"""
+    """Save fuel/energy delta file (database if enabled, or *.fuel.bin, *.energy.bin)"""
     if len(dataset) < 10 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
-        data_writer = csv.writer(csvfile)
-        data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+    save_rows_data(filepath, filename, extension, dataset)
+    logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def export_fuel_delta_file(filepath: str, filename: str, extension: str) -> bool:
+    """Export fuel/energy delta file (database or *.fuel.bin, *.energy.bin) to *.fuel, *.energy, returns true if exported"""
+    try:
+        export_columns_data(filepath, filename, extension, valid_delta_set)
+        logger.info("USERDATA: %s%s exported", filename, extension)
+        return True
+    except FileNotFoundError:
+        logger.info("MISSING: consumption delta (%s) data", extension)
+    except (IndexError, ValueError, TypeError):
+        logger.info("MISSING: invalid consumption delta (%s) data", extension)
+    except OSError:
+        logger.info("USERDATA: failed exporting %s%s", filename, extension)
+    return False
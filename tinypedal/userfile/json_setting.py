@@ -25,13 +25,13 @@ from __future__ import annotations
 import filecmp
 import json
 import logging
-import os
 import shutil
 from time import localtime, monotonic, sleep, strftime, time
 from typing import Callable
 
 from ..const_file import FileExt
 from ..setting_validator import PresetValidator
+from .file_writer import atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -131,14 +131,16 @@ def load_style_json_file(
 
 def save_json_file(
     dict_user: dict, filename: str, filepath: str, extension: str = "", compact_json: bool = False
-) -> None:
-    """Save json file"""
-    filename_source = f"{filepath}{filename}{extension}"
-    with open(filename_source, "w", encoding="utf-8") as jsonfile:
-        if compact_json:
-            json.dump(dict_user, jsonfile, separators=(",", ":"))
-        else:
-            json.dump(dict_user, jsonfile, indent=4)
+) -> bool:
+    """Save json file (atomic), returns False if skipped (content unchanged)"""
+    return atomic_write(f"{filepath}{filename}{extension}", dump_json(dict_user, compact_json))
+
+
+def dump_json(dict_user: dict, compact_json: bool = False) -> str:
+    """Serialize setting to json string"""
+    if compact_json:
+        return json.dumps(dict_user, separators=(",", ":"))
+    return json.dumps(dict_user, indent=4)
 
 
 def verify_json_file(
@@ -190,64 +192,6 @@ def create_backup_file(
     return False
 
 
-def restore_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BACKUP
-) -> bool:
-    """Restore backup file if saving failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_source = f"{filepath}{filename}"
-    try:
-        if not copy_and_verify_file(filename_backup, filename_source):
-            raise FileNotFoundError
-        logger.info("USERDATA: backup restored %s", filename_source)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except (AttributeError, TypeError, ValueError, OSError):
-        logger.error("USERDATA: unable to restore backup %s", filename_backup)
-    return False
-
-
-def copy_and_rename_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BACKUP
-) -> bool:
-    """Copy and rename backup file if restoring backup failed"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    filename_renamed = f"{filepath}{filename}{set_backup_timestamp()}"
-    try:
-        if not copy_and_verify_file(filename_backup, filename_renamed):
-            raise FileNotFoundError
-        logger.info("USERDATA: backup renamed %s", filename_renamed)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except (AttributeError, TypeError, ValueError, OSError):
-        logger.error("USERDATA: unable to copy and rename backup %s", filename_backup)
-    return False
-
-
-def delete_backup_file(
-    filename: str, filepath: str, extension: str = FileExt.BACKUP
-) -> bool:
-    """Delete backup file"""
-    filename_backup = f"{filepath}{filename}{extension}"
-    try:
-        if os.path.exists(filename_backup):
-            os.remove(filename_backup)
-        return True
-    except FileNotFoundError:
-        logger.error("USERDATA: backup not found %s", filename_backup)
-    except PermissionError:
-        logger.error("USERDATA: no permission to access backup %s", filename_backup)
-    except OSError:
-        logger.error("USERDATA: unable to delete backup %s", filename_backup)
-    return False
-
-
 def save_and_verify_json_file(
     dict_user: dict,
     filename: str,
@@ -255,36 +199,33 @@ def save_and_verify_json_file(
     max_attempts: int = 10,
     compact_json: bool = False,
 ) -> None:
-    """Save and verify json file, backup or restore if saving failed"""
-    file_found = os.path.exists(f"{filepath}{filename}")
-    backup_extension = set_backup_timestamp()
-    # Create backup: abort saving if backup failed; skip backup and create new if not exist
-    if not file_found:
-        logger.info("USERDATA: %s not found, create new", filename)
-    elif not create_backup_file(filename, filepath, backup_extension):
-        logger.info("USERDATA: %s saving abort", filename)
-        return
+    """Save json file (atomic), retry if saving failed
+
+    Existing file is replaced only after new file fully written,
+    and is left untouched if saving failed, no backup or re-read verification needed.
+    Saving is skipped if content unchanged since last saving.
+    """
+    data = dump_json(dict_user, compact_json)
+    filename_source = f"{filepath}{filename}"
     # Start saving attempts
     attempts = max_attempts
+    is_saved = False
     timer_start = monotonic()
     while attempts > 0:
-        save_json_file(dict_user, filename, filepath, compact_json=compact_json)
-        if verify_json_file(dict_user, filename, filepath):
+        try:
+            is_saved = atomic_write(filename_source, data)
             break
-        attempts -= 1
-        logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
-        sleep(0.05)
+        except OSError:
+            attempts -= 1
+            logger.error("USERDATA: %s failed saving, %s attempt(s) left", filename, attempts)
+            sleep(0.05)
     timer_end = round((monotonic() - timer_start) * 1000)
-    # Clean up
-    if attempts > 0:
+    if attempts <= 0:
+        state_text = "failed saving"
+    elif is_saved:
         state_text = "saved"
     else:
-        if file_found and not restore_backup_file(filename, filepath, backup_extension):
-            if not copy_and_rename_backup_file(filename, filepath, backup_extension):
-                return  # abort without delete backup
-        state_text = "failed saving"
-    if file_found:
-        delete_backup_file(filename, filepath, backup_extension)
+        state_text = "unchanged, skip saving"
     logger.info(
         "USERDATA: %s %s (took %sms, %s/%s attempts)",
         filename,
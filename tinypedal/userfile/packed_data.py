@@ -0,0 +1,202 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Packed binary data file function
+
+Packed file structure:
+    Header: magic(4s), version(B), columns(B), reserved(H), rows(I), little-endian.
+    Body: float64 columns stored one after another (column-major), little-endian.
+"""
+
+from __future__ import annotations
+
+import csv
+import logging
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Sequence
+
+from ..const_file import FileExt
+from .file_writer import atomic_open, atomic_write
+
+logger = logging.getLogger(__name__)
+
+PACKED_MAGIC = b"TPPD"
+PACKED_VERSION = 1
+PACKED_HEADER = struct.Struct("<4sBBHI")
+IS_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def load_packed_file(filename_full: str) -> tuple[array, ...]:
+    """Load packed binary file, returns float64 column arrays
+
+    Raises:
+        FileNotFoundError: if file not exist.
+        ValueError: if file is empty or invalid.
+    """
+    with open(filename_full, "rb") as file:
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return unpack_columns(data)
+
+
+def save_packed_file(filename_full: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Save data set (columns) to packed binary file (atomic)"""
+    atomic_write(filename_full, pack_columns(dataset))
+
+
+def unpack_columns(data) -> tuple[array, ...]:
+    """Unpack packed binary data (bytes-like), returns float64 column arrays
+
+    Raises:
+        ValueError: if data is empty or invalid.
+    """
+    if len(data) < PACKED_HEADER.size:
+        raise ValueError
+    magic, version, columns, _, rows = PACKED_HEADER.unpack_from(data, 0)
+    column_size = rows * 8
+    if (
+        magic != PACKED_MAGIC
+        or version != PACKED_VERSION
+        or len(data) != PACKED_HEADER.size + columns * column_size
+    ):
+        raise ValueError
+    output = []
+    offset = PACKED_HEADER.size
+    with memoryview(data) as view:
+        for _ in range(columns):
+            column = array("d")
+            column.frombytes(view[offset:offset + column_size])
+            if IS_BIG_ENDIAN:
+                column.byteswap()
+            output.append(column)
+            offset += column_size
+    return tuple(output)
+
+
+def pack_rows(dataset: Sequence[Sequence[float]]) -> bytes:
+    """Pack data set (rows) to packed binary data"""
+    rows = len(dataset)
+    columns = len(dataset[0]) if rows else 0
+    return pack_columns([[data[index] for data in dataset] for index in range(columns)])
+
+
+def pack_columns(dataset: Sequence[Sequence[float]]) -> bytes:
+    """Pack data set (columns) to packed binary data"""
+    rows = len(dataset[0]) if dataset else 0
+    output = [PACKED_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, len(dataset), 0, rows)]
+    for data in dataset:
+        column = array("d", data)
+        if len(column) != rows:
+            raise ValueError
+        if IS_BIG_ENDIAN:
+            column.byteswap()
+        output.append(column.tobytes())
+    return b"".join(output)
+
+
+def rows_to_columns(dataset: Sequence[Sequence[float]]) -> tuple[array, ...]:
+    """Convert data set (rows) to float64 column arrays
+
+    Raises:
+        ValueError: if row length is not identical.
+        TypeError: if value is not number.
+    """
+    columns = len(dataset[0]) if dataset else 0
+    if any(len(data) != columns for data in dataset):
+        raise ValueError
+    return tuple(array("d", [data[index] for data in dataset]) for index in range(columns))
+
+
+def load_csv_file(filename_full: str) -> tuple[tuple[float, ...], ...]:
+    """Load numeric CSV file (rows)"""
+    with open(filename_full, newline="", encoding="utf-8") as csvfile:
+        data_reader = csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC)
+        return tuple(tuple(data) for data in data_reader)
+
+
+def save_csv_file(filename_full: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Save data set (columns) to numeric CSV file (rows, atomic)"""
+    with atomic_open(filename_full, "w", newline="", encoding="utf-8") as csvfile:
+        data_writer = csv.writer(csvfile)
+        data_writer.writerows(zip(*dataset))
+
+
+def is_packed_file_newer(filename_packed: str, filename_csv: str) -> bool:
+    """Check whether packed file exists and is not older than CSV file"""
+    try:
+        packed_mtime = os.stat(filename_packed).st_mtime
+    except OSError:
+        return False
+    try:
+        return packed_mtime >= os.stat(filename_csv).st_mtime
+    except OSError:
+        return True
+
+
+def load_columns_file(filepath: str, filename: str, extension: str, validator) -> tuple:
+    """Load data set (columns) from packed binary file, or import from CSV file
+
+    CSV file is imported if packed file does not exist, or is older than CSV file,
+    or is invalid, and then converted to packed file (one-time migration).
+
+    Args:
+        filepath: file path.
+        filename: file name without extension.
+        extension: CSV file extension, packed file uses same name with extra ".bin" extension.
+        validator: data set (columns) validator function, raises error if invalid.
+    """
+    filename_csv = f"{filepath}{filename}{extension}"
+    filename_packed = f"{filename_csv}{FileExt.BIN}"
+    if is_packed_file_newer(filename_packed, filename_csv):
+        try:
+            return validator(load_packed_file(filename_packed))
+        except (IndexError, TypeError, ValueError):
+            if not os.path.exists(filename_csv):
+                raise
+            logger.info("USERDATA: invalid %s%s packed data, import from CSV", filename, extension)
+    dataset = validator(rows_to_columns(load_csv_file(filename_csv)))
+    try:
+        save_packed_file(filename_packed, dataset)
+        logger.info("USERDATA: %s%s converted to packed data", filename, extension)
+    except OSError:
+        logger.info("USERDATA: failed converting %s%s to packed data", filename, extension)
+    return dataset
+
+
+def save_rows_file(filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Save data set (rows) to packed binary file"""
+    atomic_write(f"{filepath}{filename}{extension}{FileExt.BIN}", pack_rows(dataset))
+
+
+def export_columns_file(filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]]) -> None:
+    """Export data set (columns) to CSV file
+
+    Exported CSV file modified time is set to packed file modified time,
+    so that exported file is not imported back on next loading, unless edited.
+    """
+    filename_csv = f"{filepath}{filename}{extension}"
+    save_csv_file(filename_csv, dataset)
+    try:
+        packed_mtime = os.stat(f"{filename_csv}{FileExt.BIN}").st_mtime
+        os.utime(filename_csv, (packed_mtime, packed_mtime))
+    except OSError:
+        pass
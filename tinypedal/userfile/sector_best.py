@@ -27,6 +27,10 @@ import logging
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name
+from .file_writer import atomic_open
+from .userdata_cache import userdata_cache
+from .packed_data import rows_to_columns
+from .userdata_store import load_columns_data, save_rows_data
 
 logger = logging.getLogger(__name__)
 
@@ -34,10 +38,10 @@ logger = logging.getLogger(__name__)
 def load_sector_best_file(
     filepath:str, filename: str, session_id: tuple, defaults: list, extension: str = FileExt.SECTOR
 ) -> tuple[list, list, list, list]:
-    """Load sector best file (*.sector)"""
+    """Load sector best file (prefetched, database or *.sector)"""
     try:
-        with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
-            temp_list = list(csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC))
+        temp_list = tuple(zip(*userdata_cache.load(
+            load_columns_data, filepath, filename, extension, valid_sector_set, load_sector_csv)))
         # Check if same session
         if (temp_list[0][0] == session_id[0] and  # session_stamp
             temp_list[0][1] <= session_id[1] and  # session_etime
@@ -59,6 +63,12 @@ def load_sector_best_file(
     return defaults.copy(), defaults.copy(), defaults.copy(), defaults.copy()
 
 
+def prefetch_sector_best_file(filepath: str, filename: str, extension: str = FileExt.SECTOR) -> bool:
+    """Prefetch sector best file"""
+    return userdata_cache.prefetch(
+        load_columns_data, filepath, filename, extension, valid_sector_set, load_sector_csv)
+
+
 def save_sector_best_file(
     filepath: str, filename: str, dataset: tuple, extension: str = FileExt.SECTOR
 ) -> None:
@@ -73,7 +83,25 @@ def save_sector_best_file(
     """
     if len(dataset) != 5 or invalid_save_name(filename):
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    save_rows_data(filepath, filename, extension, dataset, save_sector_csv)
+    logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def load_sector_csv(filepath: str, filename: str, extension: str, validator) -> tuple:
+    """Load sector best CSV file (*.sector), returns columns"""
+    with open(f"{filepath}{filename}{extension}", newline="", encoding="utf-8") as csvfile:
+        return validator(rows_to_columns(tuple(csv.reader(csvfile, quoting=csv.QUOTE_NONNUMERIC))))
+
+
+def save_sector_csv(filepath: str, filename: str, extension: str, dataset: tuple) -> None:
+    """Save sector best CSV file (*.sector)"""
+    with atomic_open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
         data_writer = csv.writer(csvfile)
         data_writer.writerows(dataset)
-        logger.info("USERDATA: %s%s saved", filename, extension)
+
+
+def valid_sector_set(dataset: tuple) -> tuple:
+    """Validate sector best data set (3 columns, 5 rows)"""
+    if len(dataset) != 3 or any(len(data) != 5 for data in dataset):
+        raise ValueError
+    return dataset
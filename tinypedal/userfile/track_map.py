@@ -18,19 +18,39 @@
 
 """
 Track map file function
+
+Track map sidecar file structure (binary cache of svg file, *.svg.bin):
+    Header: magic(4s), version(B), reserved(B), reserved(H),
+        svg mtime_ns(q), svg size(q), sector index(ii), map data size(I), little-endian.
+    Body: map coordinates (x, y) packed data, followed by
+        distance reference (dist, elevation) packed data (see packed_data).
+    SVG file is the canonical (shareable) format, sidecar file is only used
+    if svg modified time & size match, and is recreated from svg otherwise.
+    Sidecar file is only created for track map files in user track map folder,
+    and never from read-only loading (such as track map viewer).
 """
 
 from __future__ import annotations
 
 import logging
+import mmap
+import os
+import struct
 import xml.dom.minidom
 import xml.parsers.expat
 
 from ..const_file import FileExt
 from ..validator import invalid_save_name
+from .file_writer import atomic_open, atomic_write
+from .packed_data import pack_rows, unpack_columns
+from .userdata_cache import userdata_cache
 
 logger = logging.getLogger(__name__)
 
+SIDECAR_MAGIC = b"TPMP"
+SIDECAR_VERSION = 1
+SIDECAR_HEADER = struct.Struct("<4sBBHqqiiI")
+
 
 def string_pair_to_int(string: str) -> tuple[int, int]:
     """Convert string pair "x,y" to int list"""
@@ -73,10 +93,80 @@ def coords_to_points(coords: tuple | list) -> str:
     return " ".join(map(list_pair_to_string, coords))
 
 
-def load_track_map_file(filepath: str, filename: str, extension: str = FileExt.SVG):
-    """Load svg track map file (*.svg)"""
+def load_track_map_sidecar(filename_full: str, svg_stat: os.stat_result):
+    """Load track map sidecar file, returns None if not exist or outdated
+
+    Raises:
+        ValueError: if sidecar data is invalid.
+    """
+    try:
+        with open(f"{filename_full}{FileExt.BIN}", "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                if len(data) < SIDECAR_HEADER.size:
+                    raise ValueError
+                (magic, version, _, _, svg_mtime, svg_size, sector_0, sector_1, map_size
+                 ) = SIDECAR_HEADER.unpack_from(data, 0)
+                if magic != SIDECAR_MAGIC or version != SIDECAR_VERSION:
+                    raise ValueError
+                if svg_mtime != svg_stat.st_mtime_ns or svg_size != svg_stat.st_size:
+                    return None
+                map_end = SIDECAR_HEADER.size + map_size
+                map_columns = unpack_columns(data[SIDECAR_HEADER.size:map_end])
+                dist_columns = unpack_columns(data[map_end:])
+    except FileNotFoundError:
+        return None
+    if len(map_columns) != 2 or len(dist_columns) != 2:
+        raise ValueError
+    if not map_columns[0] or not dist_columns[0]:
+        raise ValueError
+    return tuple(zip(*map_columns)), tuple(zip(*dist_columns)), (sector_0, sector_1)
+
+
+def save_track_map_sidecar(
+    filename_full: str, raw_coords: tuple, raw_dists: tuple, sector_index: tuple
+) -> None:
+    """Save track map sidecar file, must save after svg file"""
+    try:
+        svg_stat = os.stat(filename_full)
+        map_data = pack_rows(raw_coords)
+        atomic_write(f"{filename_full}{FileExt.BIN}", b"".join((
+            SIDECAR_HEADER.pack(
+                SIDECAR_MAGIC, SIDECAR_VERSION, 0, 0,
+                svg_stat.st_mtime_ns, svg_stat.st_size,
+                sector_index[0], sector_index[1], len(map_data),
+            ),
+            map_data,
+            pack_rows(raw_dists),
+        )))
+    except (IndexError, OSError, TypeError, ValueError, struct.error):
+        logger.info("USERDATA: failed saving track map cache")
+
+
+def load_track_map_file(
+    filepath: str, filename: str, extension: str = FileExt.SVG, save_sidecar: bool = False
+):
+    """Load svg track map file (*.svg), or sidecar file if svg unchanged
+
+    Args:
+        filepath: track map file path.
+        filename: track map file name.
+        extension: track map file extension.
+        save_sidecar: whether to create sidecar file if outdated,
+            only for track map files in user track map folder.
+    """
+    filename_full = f"{filepath}{filename}{extension}"
+    try:
+        svg_stat = os.stat(filename_full)
+        track_map = load_track_map_sidecar(filename_full, svg_stat)
+        if track_map is not None:
+            return track_map
+    except FileNotFoundError:
+        logger.info("MISSING: track map (%s) data", extension)
+        return None, None, None
+    except (OSError, ValueError):
+        logger.info("USERDATA: invalid track map cache, load from svg")
     try:
-        dom = xml.dom.minidom.parse(f"{filepath}{filename}{extension}")
+        dom = xml.dom.minidom.parse(filename_full)
         desc_col = dom.documentElement.getElementsByTagName("desc")
         path_col = dom.documentElement.getElementsByTagName("polyline")
         svg_coords = svg_dists = None
@@ -95,6 +185,8 @@ def load_track_map_file(filepath: str, filename: str, extension: str = FileExt.S
         raw_coords = points_to_coords(svg_coords)
         raw_dists = points_to_coords(svg_dists)
         sector_index = string_pair_to_int(desc_col[0].childNodes[0].nodeValue)
+        if save_sidecar:
+            save_track_map_sidecar(filename_full, raw_coords, raw_dists, sector_index)
         return raw_coords, raw_dists, sector_index
     except FileNotFoundError:
         logger.info("MISSING: track map (%s) data", extension)
@@ -158,6 +250,9 @@ def save_track_map_file(
     dist_node.setAttribute("points", svg_dists)
     root_node.appendChild(dist_node)
     # Save svg
-    with open(f"{filepath}{filename}{extension}", "w", encoding="utf-8") as svgfile:
+    userdata_cache.invalidate(filepath, filename, extension)
+    filename_full = f"{filepath}{filename}{extension}"
+    with atomic_open(filename_full, "w", encoding="utf-8") as svgfile:
         new_svg.writexml(svgfile, indent="", addindent="\t", newl="\n", encoding="utf-8")
         logger.info("USERDATA: %s%s saved", filename, extension)
+    save_track_map_sidecar(filename_full, raw_coords, raw_dists, sector_index)
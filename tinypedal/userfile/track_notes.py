@@ -30,6 +30,7 @@ from typing import Any, Callable, Iterable
 
 from ..const_common import CRLF
 from ..const_file import FileFilter
+from .file_writer import atomic_open
 
 NOTESTYPE_PACE = "Pace Notes"
 NOTESTYPE_TRACK = "Track Notes"
@@ -273,7 +274,7 @@ def save_notes_file(
     """Save notes file"""
     if len(dataset) < 1:
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as temp_file:
+    with atomic_open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as temp_file:
         writer(temp_file, table_header, dataset, metadata, filename)
 
 
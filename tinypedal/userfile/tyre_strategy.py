@@ -28,6 +28,7 @@ import logging
 
 from ..setting_validator import PresetValidator
 from ..userfile.json_setting import copy_setting
+from .file_writer import atomic_open, atomic_write
 
 logger = logging.getLogger(__name__)
 
@@ -229,8 +230,7 @@ def load_tyre_strategy_file(filename: str, filepath: str, extension: str = ""):
 def save_tyre_strategy_file(dict_user: dict, filename: str, filepath: str, extension: str = ""):
     """Save tyre strategy file (*.tyres)"""
     filename_source = f"{filepath}{filename}{extension}"
-    with open(filename_source, "w", encoding="utf-8") as jsonfile:
-        json.dump(dict_user, jsonfile, indent=2)
+    atomic_write(filename_source, json.dumps(dict_user, indent=2))
 
 
 def export_tyre_strategy_file(
@@ -244,7 +244,7 @@ def export_tyre_strategy_file(
     """Export tyre strategy file as spreadsheet (*.CSV)"""
     if len(plan_data) < 1:
         return
-    with open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
+    with atomic_open(f"{filepath}{filename}{extension}", "w", newline="", encoding="utf-8") as csvfile:
         data_writer = csv.writer(csvfile, quoting=csv.QUOTE_NONNUMERIC)
         # Write tyre rule
         data_writer.writerows(rule_data)
@@ -0,0 +1,146 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Userdata cache function
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from itertools import chain
+from typing import Any, Callable
+
+from ..const_file import FileExt
+
+# Loader errors that are cached and raised again on loading
+CACHED_ERRORS = (OSError, IndexError, KeyError, TypeError, ValueError)
+# Userdata database file name (shared by all combos in same userdata folder)
+DATABASE_FILENAME = f"userdata{FileExt.DB}"
+# Userdata source file suffixes (file, packed file, journal, database)
+SOURCE_SUFFIXES = ("", FileExt.BIN, FileExt.JOURNAL)
+DATABASE_SUFFIXES = ("", "-wal")
+
+
+class UserDataCache:
+    """Userdata cache
+
+    Stores prefetched userdata (loader result or error), keyed by full file name.
+    Loader must take file path, file name, extension as first 3 arguments.
+
+    Cached data is taken (removed) on loading, so that each loading
+    receives a new copy of data, and cache holds no data while driving.
+
+    Cached data is invalidated on saving or deleting (see invalidate), which every
+    userdata saver calls, or if file saved while prefetching (checked by version).
+    Cached data is also discarded on loading if any source file (file, packed file,
+    journal, database) was changed after prefetching (checked by source_signature),
+    such as file replaced externally.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_data",
+        "_version",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: dict[str, tuple[Any, Exception | None, tuple]] = {}
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self):
+        """Clear cached data"""
+        with self._lock:
+            self._data.clear()
+            self._version += 1
+
+    def invalidate(self, filepath: str, filename: str, extension: str):
+        """Invalidate cached data, call after saving or deleting file"""
+        with self._lock:
+            self._data.pop(f"{filepath}{filename}{extension}", None)
+            self._version += 1
+
+    def prefetch(
+        self, loader: Callable, filepath: str, filename: str, extension: str, *args
+    ) -> bool:
+        """Prefetch data if not cached
+
+        Returns:
+            True if data loaded from loader.
+        """
+        key = f"{filepath}{filename}{extension}"
+        with self._lock:
+            if key in self._data:
+                return False
+            version = self._version
+        try:
+            data, error = loader(filepath, filename, extension, *args), None
+        except CACHED_ERRORS as _error:
+            data, error = None, _error
+        # Signature after loading, as loader may create derived file (such as sidecar)
+        entry = (data, error, source_signature(filepath, filename, extension))
+        with self._lock:
+            if version == self._version:  # discard if saved while loading
+                self._data[key] = entry
+        return True
+
+    def load(
+        self, loader: Callable, filepath: str, filename: str, extension: str, *args
+    ) -> Any:
+        """Load data from cache if prefetched, or from loader
+
+        Raises:
+            Same error as loader.
+        """
+        with self._lock:
+            entry = self._data.pop(f"{filepath}{filename}{extension}", None)
+        if entry is None or entry[2] != source_signature(filepath, filename, extension):
+            return loader(filepath, filename, extension, *args)
+        error = entry[1]
+        if error is not None:
+            raise error
+        return entry[0]
+
+
+def source_signature(filepath: str, filename: str, extension: str) -> tuple:
+    """Userdata source files signature (modified time & size), None for missing file"""
+    filename_full = f"{filepath}{filename}{extension}"
+    filename_db = os.path.join(filepath, DATABASE_FILENAME)
+    return tuple(
+        file_signature(_filename) for _filename in chain(
+            (f"{filename_full}{suffix}" for suffix in SOURCE_SUFFIXES),
+            (f"{filename_db}{suffix}" for suffix in DATABASE_SUFFIXES),
+        )
+    )
+
+
+def file_signature(filename_full: str) -> tuple[int, int] | None:
+    """File signature (modified time in nanoseconds, size), None if not exist"""
+    try:
+        file_stat = os.stat(filename_full)
+        return file_stat.st_mtime_ns, file_stat.st_size
+    except OSError:
+        return None
+
+
+userdata_cache = UserDataCache()
@@ -0,0 +1,358 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Userdata store function (SQLite)
+
+Database structure:
+    One database file (userdata.db) per userdata folder.
+    One table per data kind, one row per combo (track & vehicle class or vehicle) name.
+    Data set (rows) is stored in packed binary format (see packed_data).
+    Database is the only write target while enabled, userdata files are
+    exported from database after disabled (see UserDataStore.set_enabled).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from time import time
+from typing import Callable, Sequence
+
+from ..const_file import FileExt
+from .file_writer import atomic_write
+from .packed_data import (
+    export_columns_file,
+    load_columns_file,
+    pack_columns,
+    pack_rows,
+    save_csv_file,
+    save_rows_file,
+    unpack_columns,
+)
+from .userdata_cache import DATABASE_FILENAME, userdata_cache
+
+logger = logging.getLogger(__name__)
+
+STORE_FILENAME = DATABASE_FILENAME
+STORE_TABLES = {
+    FileExt.CSV: "delta_best",
+    FileExt.ENERGY: "energy_delta",
+    FileExt.FUEL: "fuel_delta",
+    FileExt.SECTOR: "sector_best",
+}
+
+
+class UserDataStore:
+    """Userdata store
+
+    Optional SQLite database (WAL mode) for per combo userdata,
+    which provides indexed lookup by combo name with single row update.
+
+    Existing userdata file is imported into database on loading
+    if combo name not found in database, or if file is newer than database row
+    (such as shared file placed in userdata folder).
+
+    Connection is shared by all module threads, and guarded by lock.
+    """
+
+    __slots__ = (
+        "_lock",
+        "_connections",
+        "_filepaths",
+        "enabled",
+    )
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._connections: dict[str, sqlite3.Connection] = {}
+        self._filepaths: set[str] = set()  # database paths used while enabled
+        self.enabled = False
+
+    def set_enabled(self, enabled: bool):
+        """Set enabled state, export newer data to userdata files after disabled"""
+        last_enabled = self.enabled
+        self.enabled = enabled
+        if last_enabled and not enabled:
+            for filepath in self._filepaths:
+                try:
+                    self.export_files(filepath)
+                except sqlite3.Error as error:
+                    logger.error("USERDATA: database error, %s, failed exporting files", error)
+            self._filepaths.clear()
+        if not enabled:
+            self.close()
+
+    def close(self):
+        """Close all database connections"""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+    def load_columns(
+        self, filepath: str, filename: str, extension: str, importer: Callable[[], Sequence]
+    ) -> tuple[Sequence[float], ...]:
+        """Load data set (columns) from database, or import from file
+
+        Args:
+            filepath: userdata file path.
+            filename: combo name.
+            extension: userdata file extension (data kind).
+            importer: userdata file loader, called if combo name not found in database,
+                or if userdata file is newer than database row.
+
+        Raises:
+            FileNotFoundError: if not found in database or file.
+            ValueError: if data is invalid.
+        """
+        table = STORE_TABLES[extension]
+        with self._lock:
+            row = self.__connect(filepath).execute(
+                f"SELECT data, updated FROM {table} WHERE name = ?", (filename,)
+            ).fetchone()
+        if row is not None and row[1] >= file_modified_time(filepath, filename, extension):
+            return unpack_columns(row[0])
+        dataset = importer()
+        self.__save(filepath, filename, extension, pack_columns(dataset))
+        logger.info("USERDATA: %s%s imported to database", filename, extension)
+        return dataset
+
+    def exists(self, filepath: str, filename: str, extension: str) -> bool:
+        """Check whether data set exists in database"""
+        table = STORE_TABLES.get(extension)
+        if table is None:
+            return False
+        with self._lock:
+            return self.__connect(filepath).execute(
+                f"SELECT 1 FROM {table} WHERE name = ?", (filename,)
+            ).fetchone() is not None
+
+    def updated_time(self, filepath: str, filename: str, extension: str) -> float:
+        """Data set updated time in database, 0 if not exist"""
+        table = STORE_TABLES[extension]
+        with self._lock:
+            row = self.__connect(filepath).execute(
+                f"SELECT updated FROM {table} WHERE name = ?", (filename,)
+            ).fetchone()
+        return 0.0 if row is None else row[0]
+
+    def delete(self, filepath: str, filename: str, extension: str) -> bool:
+        """Delete data set from database, returns true if deleted"""
+        table = STORE_TABLES.get(extension)
+        if table is None:
+            return False
+        with self._lock:
+            connection = self.__connect(filepath)
+            with connection:  # commit
+                return connection.execute(
+                    f"DELETE FROM {table} WHERE name = ?", (filename,)
+                ).rowcount > 0
+
+    def export_files(self, filepath: str) -> None:
+        """Export data sets that are newer than userdata files from database
+
+        Delta best, fuel delta, energy delta are exported to packed binary file,
+        sector best is exported to CSV file. Exported file modified time is set to
+        database row updated time (whole seconds), so that it is not imported back
+        on next loading.
+        """
+        exported = 0
+        with self._lock:
+            connection = self.__connect(filepath)
+            for extension, table in STORE_TABLES.items():
+                for filename, data, updated in connection.execute(
+                    f"SELECT name, data, updated FROM {table}"
+                ):
+                    modified = int(updated)
+                    if modified <= file_modified_time(filepath, filename, extension):
+                        continue
+                    if extension == FileExt.SECTOR:
+                        filename_full = f"{filepath}{filename}{extension}"
+                        save_csv_file(filename_full, unpack_columns(data))
+                    else:
+                        filename_full = f"{filepath}{filename}{extension}{FileExt.BIN}"
+                        atomic_write(filename_full, data)
+                    os.utime(filename_full, (modified, modified))
+                    exported += 1
+        if exported:
+            logger.info("USERDATA: %s data set(s) exported from database to %s", exported, filepath)
+
+    def save_rows(
+        self, filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]]
+    ) -> None:
+        """Save data set (rows) to database"""
+        self.__save(filepath, filename, extension, pack_rows(dataset))
+
+    def __save(self, filepath: str, filename: str, extension: str, data: bytes) -> None:
+        """Save packed data to database"""
+        table = STORE_TABLES[extension]
+        with self._lock:
+            connection = self.__connect(filepath)
+            with connection:  # commit
+                connection.execute(
+                    f"INSERT OR REPLACE INTO {table} (name, data, updated) VALUES (?, ?, ?)",
+                    (filename, data, time()),
+                )
+
+    def __connect(self, filepath: str) -> sqlite3.Connection:
+        """Get database connection for userdata path, create database if not exist"""
+        key = os.path.abspath(filepath)
+        connection = self._connections.get(key)
+        if connection is None:
+            self._filepaths.add(filepath)
+            connection = sqlite3.connect(
+                os.path.join(key, STORE_FILENAME),
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                for table in STORE_TABLES.values():
+                    connection.execute(
+                        f"CREATE TABLE IF NOT EXISTS {table} ("
+                        "name TEXT PRIMARY KEY NOT NULL, "
+                        "data BLOB NOT NULL, "
+                        "updated REAL NOT NULL)"
+                    )
+            self._connections[key] = connection
+        return connection
+
+
+def load_columns_data(
+    filepath: str, filename: str, extension: str, validator: Callable,
+    file_loader: Callable = load_columns_file,
+) -> tuple:
+    """Load data set (columns) from database if enabled, or from file
+
+    Args:
+        filepath: userdata file path.
+        filename: combo name.
+        extension: userdata file extension (data kind).
+        validator: data set (columns) validator function, raises error if invalid.
+        file_loader: userdata file loader, same arguments as this function.
+
+    Raises:
+        FileNotFoundError: if data not exist.
+        ValueError: if data is invalid.
+    """
+    if userdata_store.enabled:
+        try:
+            return validator(userdata_store.load_columns(
+                filepath, filename, extension,
+                importer=lambda: file_loader(filepath, filename, extension, validator),
+            ))
+        except sqlite3.Error as error:
+            logger.error("USERDATA: database error, %s, load from file", error)
+    return file_loader(filepath, filename, extension, validator)
+
+
+def save_rows_data(
+    filepath: str, filename: str, extension: str, dataset: Sequence[Sequence[float]],
+    file_saver: Callable = save_rows_file,
+) -> None:
+    """Save data set (rows) to database if enabled, or to file
+
+    Userdata file is only written if database is disabled, or on database error.
+
+    Args:
+        filepath: userdata file path.
+        filename: combo name.
+        extension: userdata file extension (data kind).
+        dataset: data set (rows).
+        file_saver: userdata file saver, same arguments as this function.
+    """
+    userdata_cache.invalidate(filepath, filename, extension)
+    if userdata_store.enabled:
+        try:
+            userdata_store.save_rows(filepath, filename, extension, dataset)
+            return
+        except sqlite3.Error as error:
+            logger.error("USERDATA: database error, %s, save to file", error)
+    file_saver(filepath, filename, extension, dataset)
+
+
+def delete_data(filepath: str, filename: str, extension: str) -> bool:
+    """Delete data set from userdata file (include packed file) and database, returns true if deleted
+
+    Database is checked even if disabled, so that reset data is not loaded again after enabled.
+    Prefetched data is invalidated, so that reset data is not loaded from cache.
+    """
+    userdata_cache.invalidate(filepath, filename, extension)
+    deleted = False
+    filename_full = f"{filepath}{filename}{extension}"
+    for _filename in (filename_full, f"{filename_full}{FileExt.BIN}", f"{filename_full}{FileExt.JOURNAL}"):
+        if os.path.exists(_filename):
+            os.remove(_filename)
+            deleted = True
+    if extension in STORE_TABLES and os.path.exists(os.path.join(filepath, STORE_FILENAME)):
+        try:
+            deleted = userdata_store.delete(filepath, filename, extension) or deleted
+        except sqlite3.Error as error:
+            logger.error("USERDATA: database error, %s", error)
+    return deleted
+
+
+def data_exists(filepath: str, filename: str, extension: str) -> bool:
+    """Check whether data set exists in userdata file (include packed file) or database"""
+    filename_full = f"{filepath}{filename}{extension}"
+    if os.path.exists(filename_full) or os.path.exists(f"{filename_full}{FileExt.BIN}"):
+        return True
+    if extension in STORE_TABLES and os.path.exists(os.path.join(filepath, STORE_FILENAME)):
+        try:
+            return userdata_store.exists(filepath, filename, extension)
+        except sqlite3.Error as error:
+            logger.error("USERDATA: database error, %s", error)
+    return False
+
+
+def file_modified_time(filepath: str, filename: str, extension: str) -> float:
+    """Latest modified time of userdata file (include packed file), 0 if not exist"""
+    filename_full = f"{filepath}{filename}{extension}"
+    modified = 0.0
+    for _filename in (filename_full, f"{filename_full}{FileExt.BIN}"):
+        try:
+            modified = max(modified, os.stat(_filename).st_mtime)
+        except OSError:
+            pass
+    return modified
+
+
+def export_columns_data(filepath: str, filename: str, extension: str, validator: Callable) -> None:
+    """Export data set (columns) from database or packed file to CSV file
+
+    Exported CSV file modified time is set to database row updated time if enabled,
+    so that it is not imported back on next loading, unless edited.
+
+    Raises:
+        FileNotFoundError: if data not exist.
+        ValueError: if data is invalid.
+    """
+    dataset = load_columns_data(filepath, filename, extension, validator)
+    export_columns_file(filepath, filename, extension, dataset)
+    if userdata_store.enabled:
+        try:
+            modified = int(userdata_store.updated_time(filepath, filename, extension))
+            os.utime(f"{filepath}{filename}{extension}", (modified, modified))
+        except (sqlite3.Error, OSError):
+            pass
+
+
+userdata_store = UserDataStore()
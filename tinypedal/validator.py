@@ -133,16 +133,18 @@ def image_exists(filepath: str, extension: str = FileExt.PNG, max_size: int = 10
 
 # Delta list validate
 def valid_delta_set(data: tuple) -> tuple:
-    """Validate delta data set"""
+    """Validate delta data set (columns)"""
+    distance = data[0]
+    value = data[1]
     # Final row value(second column) must be higher than previous row
-    if data[-1][1] < data[-2][1]:
+    if value[-1] < value[-2]:
         raise ValueError
     # Check distance greater than next row for first 10 rows
     for idx in range(11, 0, -1):
-        if data[idx][0] > data[idx + 1][0]:
+        if distance[idx] > distance[idx + 1]:
             raise ValueError
     # Delta list must have at least 10 lines of samples
-    if len(data) < 10:
+    if len(distance) < 10:
         raise ValueError
     return data
 
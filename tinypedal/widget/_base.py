@@ -25,21 +25,27 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from PySide2.QtCore import QBasicTimer, Qt, Slot
-from PySide2.QtGui import QFont, QFontMetrics, QPalette, QPixmap
+from PySide2.QtCore import QBasicTimer, QPoint, Qt, Slot
+from PySide2.QtGui import QFont, QPalette, QPixmap
 from PySide2.QtWidgets import QGridLayout, QLayout, QMenu, QWidget
 
 from .. import app_signal, overlay_signal, realtime_state
 from ..const_app import APP_NAME
 from ..formatter import format_module_name
+from ..overlay_control import rclock
 from ..regex_pattern import FONT_WEIGHT_MAP
 from ..setting import Setting
-from ._common import FontMetrics, MousePosition
-from ._painter import RawImage, RawText
+from ._common import FontMetrics, MousePosition, widget_screen
+from ._cache import font_metrics_cache
+from ._compositor import compositor
+from ._painter import PainterTable, RawImage, RawText, TableImage, TableText
 
 logger = logging.getLogger(__name__)
 mousepos = MousePosition()  # single instance shared by all widgets
 
+# Options that can be applied to existing widget in place
+INPLACE_OPTIONS = frozenset(("opacity", "position_x", "position_y"))
+
 
 class Base(QWidget):
     """Base window"""
@@ -54,9 +60,16 @@ class Base(QWidget):
         # Widget config
         self.wcfg = validate_option(self.cfg.user.setting[widget_name])
 
+        # Compositor mode, position offset from global screen coordinates
+        self._composited = compositor.enabled(config)
+        if self._composited:
+            self._position_offset = compositor.attach(self)
+        else:
+            self._position_offset = QPoint(0, 0)
+
         # Base setting
         self.setWindowTitle(f"{APP_NAME} - {widget_name.capitalize()}")
-        self.move(self.wcfg["position_x"], self.wcfg["position_y"])
+        self.__move_global(self.wcfg["position_x"], self.wcfg["position_y"])
 
         # Set update timer
         self._update_timer = QBasicTimer()
@@ -64,6 +77,11 @@ class Base(QWidget):
             self.wcfg["update_interval"],
             self.cfg.application["minimum_update_interval"],
         )
+        self._render_clock = self.cfg.application["enable_render_clock"]
+
+        # Style bindings for in place config update
+        self._style_bindings: dict[str, list] = {}
+        self._wcfg_last = self.wcfg.copy()
 
     def start(self):
         """Set initial widget state in orders, and start update"""
@@ -77,6 +95,8 @@ class Base(QWidget):
         widget_name = self.widget_name
         self.__toggle_timer(True)
         self.__break_signal()
+        if self._composited:
+            compositor.detach(self)
         self.__unload_resource()
         if not self.close():
             logger.error("FAILED TO CLOSE: widget %s", widget_name)
@@ -89,14 +109,52 @@ class Base(QWidget):
     def post_update(self):
         """Run once after state inactive"""
 
+    def update_config(self) -> bool:
+        """Apply widget config changes in place
+
+        Compare current config with last applied config. Changes are applied
+        to existing widget elements only if all changed options are style-only
+        (see INPLACE_OPTIONS & bind_style), otherwise full reload is required.
+
+        Returns:
+            True if all changes applied (or nothing changed), False if requires full reload.
+        """
+        validate_option(self.wcfg)
+        last_wcfg = self._wcfg_last
+        changed = [key for key, value in self.wcfg.items() if last_wcfg.get(key) != value]
+        if any(key not in INPLACE_OPTIONS and key not in self._style_bindings for key in changed):
+            return False
+        for key in changed:
+            value = self.wcfg[key]
+            for target, attr_name in self._style_bindings.get(key, ()):
+                setattr(target, attr_name, value)
+                target.update()
+        if "opacity" in changed:
+            if self._composited:
+                compositor.update_opacity()
+            else:
+                self.setWindowOpacity(self.wcfg["opacity"])
+        if "position_x" in changed or "position_y" in changed:
+            self.__move_global(self.wcfg["position_x"], self.wcfg["position_y"])
+        self._wcfg_last = self.wcfg.copy()
+        if changed:
+            logger.info("UPDATED: %s, %s option(s) applied in place", self.widget_name, len(changed))
+        return True
+
+    def render_update(self):
+        """Update from render clock"""
+        self.timerEvent(None)
+
     def __unload_resource(self):
         """Unload widget resource"""
         self.__dict__.clear()
 
     def __set_window_attributes(self):
         """Set window attributes"""
-        self.setWindowOpacity(self.wcfg["opacity"])
         self.setAttribute(Qt.WA_DeleteOnClose, True)
+        if self._composited:  # opacity & background set by compositor
+            return
+        self.setWindowOpacity(self.wcfg["opacity"])
         if self.cfg.compatibility["enable_translucent_background"]:
             self.setAttribute(Qt.WA_TranslucentBackground, True)
         else:
@@ -104,6 +162,9 @@ class Base(QWidget):
 
     def __set_window_flags(self):
         """Set window flags"""
+        if self._composited:  # window flags set by compositor
+            self.__toggle_lock(locked=self.cfg.overlay["fixed_position"])
+            return
         self.setWindowFlag(Qt.FramelessWindowHint, True)
         self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
         if not self.cfg.overlay["vr_compatibility"]:  # hide taskbar widget
@@ -118,11 +179,15 @@ class Base(QWidget):
         palette.setColor(QPalette.Window, self.cfg.compatibility["background_color_global"])
         self.setPalette(palette)
 
+    def __move_global(self, x_pos: int, y_pos: int):
+        """Move widget to global screen coordinates"""
+        self.move(x_pos - self._position_offset.x(), y_pos - self._position_offset.y())
+
     def __save_position(self):
         """Save widget position"""
         save_changes = False
-        x_pos = self.x()
-        y_pos = self.y()
+        x_pos = self.x() + self._position_offset.x()
+        y_pos = self.y() + self._position_offset.y()
         if self.wcfg["position_x"] != x_pos:
             self.wcfg["position_x"] = x_pos
             save_changes = True
@@ -135,13 +200,16 @@ class Base(QWidget):
     @Slot(bool)  # type: ignore[operator]
     def __toggle_lock(self, locked: bool):
         """Toggle widget lock state"""
-        self.setWindowFlag(Qt.WindowTransparentForInput, locked)
+        if not self._composited:
+            self.setWindowFlag(Qt.WindowTransparentForInput, locked)
         # Need re-check after lock/unlock
         self.setHidden(self.cfg.overlay["auto_hide"] and not realtime_state.active)
 
     @Slot(bool)  # type: ignore[operator]
     def __toggle_vr_compat(self, enabled: bool):
         """Toggle widget VR compatibility"""
+        if self._composited:
+            return
         self.setWindowFlag(Qt.Tool, not enabled)
         # Need re-check
         self.setHidden(self.cfg.overlay["auto_hide"] and not realtime_state.active)
@@ -150,8 +218,13 @@ class Base(QWidget):
     def __toggle_timer(self, paused: bool):
         """Toggle widget timer state"""
         if paused:
-            self._update_timer.stop()
+            if self._render_clock:
+                rclock.unregister(self)
+            else:
+                self._update_timer.stop()
             self.post_update()
+        elif self._render_clock:
+            rclock.register(self, self._update_interval)
         else:
             self._update_timer.start(self._update_interval, self)
 
@@ -174,9 +247,9 @@ class Base(QWidget):
         if mousepos.valid() and event.buttons() == Qt.LeftButton:
             # Snapping to reference grid if Ctrl is pressed
             if (event.modifiers() & Qt.ControlModifier):
-                self.move(mousepos.snapping(self, event.globalPos()))
+                self.move(mousepos.snapping(self, event.globalPos()) - self._position_offset)
             else:
-                self.move(mousepos.moving(event.globalPos()))
+                self.move(mousepos.moving(event.globalPos()) - self._position_offset)
 
     def mousePressEvent(self, event):
         """Set offset position & press state"""
@@ -220,10 +293,16 @@ class Base(QWidget):
 
         action = selected_action.text()
         if action == "Center Horizontally":
-            self.move((self.screen().geometry().width() - self.width()) // 2, self.y())
+            self.__move_global(
+                (widget_screen(self).geometry().width() - self.width()) // 2,
+                self.y() + self._position_offset.y(),
+            )
             self.__save_position()
         elif action == "Center Vertically":
-            self.move(self.x(), (self.screen().geometry().height() - self.height()) // 2)
+            self.__move_global(
+                self.x() + self._position_offset.x(),
+                (widget_screen(self).geometry().height() - self.height()) // 2,
+            )
             self.__save_position()
         elif action == "Config":
             config_widget(self.widget_name)
@@ -273,17 +352,17 @@ class Overlay(Base):
         """
         # Disable font hinting for more accuracy (necessary for pyside6)
         font.setHintingPreference(QFont.PreferNoHinting)
-        font_metrics = QFontMetrics(font)
+        width, height, leading, capital, descent = font_metrics_cache.get(font)
         return FontMetrics(
-            width=font_metrics.averageCharWidth(),
-            height=font_metrics.height(),
-            leading=font_metrics.leading(),
-            capital=font_metrics.capHeight(),
-            descent=font_metrics.descent(),
-            voffset=self.__calc_font_offset(font_metrics),
+            width=width,
+            height=height,
+            leading=leading,
+            capital=capital,
+            descent=descent,
+            voffset=self.__calc_font_offset(height, leading, capital, descent),
         )
 
-    def __calc_font_offset(self, metrics: QFontMetrics) -> int:
+    def __calc_font_offset(self, height: int, leading: int, capital: int, descent: int) -> int:
         """Calculate auto font vertical offset
 
         Find difference between actual height and height reading
@@ -291,18 +370,16 @@ class Overlay(Base):
         for overlay that uses QPainter drawing.
 
         Args:
-            metrics: FontMetrics object.
+            height: font height.
+            leading: font leading.
+            capital: font cap height.
+            descent: font descent.
 
         Returns:
             Calculated font offset in pixel.
         """
         if self.wcfg["enable_auto_font_offset"]:
-            return (
-                metrics.capHeight()
-                + metrics.descent() * 2
-                + metrics.leading() * 2
-                - metrics.height()
-            )
+            return capital + descent * 2 + leading * 2 - height
         return self.wcfg["font_offset_vertical"]
 
     @staticmethod
@@ -335,6 +412,20 @@ class Overlay(Base):
             return Qt.AlignLeft | Qt.AlignVCenter
         return Qt.AlignRight | Qt.AlignVCenter
 
+    def bind_style(self, target: QWidget | tuple[QWidget, ...], **option_keys: str):
+        """Bind widget config options to element style attributes for in place update
+
+        Args:
+            target: widget element, such as RawText, or tuple of elements (set with count).
+            option_keys: attribute name & config option key pairs,
+                ex. fg="font_color", bg="background_color".
+        """
+        targets = target if isinstance(target, tuple) else (target,)
+        for attr_name, key in option_keys.items():
+            self._style_bindings.setdefault(key, []).extend(
+                (element, attr_name) for element in targets
+            )
+
     def set_rawtext(
         self,
         *,
@@ -350,6 +441,7 @@ class Overlay(Base):
         alignment: Qt.Alignment = Qt.AlignCenter,
         last: Any | None = None,
         count: int = 1,
+        cached: bool = False,
     ) -> tuple[RawText, ...] | RawText:
         """Set RawText, keyword arguments only
 
@@ -366,6 +458,7 @@ class Overlay(Base):
             alignment: Qt.Alignment.
             last: cache last data for comparison.
             count: number of RawText to set.
+            cached: whether to use text cache, only for text that repeats often.
 
         Returns:
             A single or multiple(tuple) RawText instances,
@@ -385,6 +478,7 @@ class Overlay(Base):
                 text=text,
                 alignment=alignment,
                 last=last,
+                cached=cached,
             )
             for _ in range(count)
         )
@@ -437,6 +531,122 @@ class Overlay(Base):
             return tuple(bar_set)
         return next(bar_set)
 
+    def set_tabletext(
+        self,
+        *,
+        text: str = "",
+        width: int = 0,
+        height: int = 0,
+        fixed_width: int = 0,
+        fixed_height: int = 0,
+        offset_y: int = 0,
+        fg_color: str = "",
+        bg_color: str = "",
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+        count: int = 1,
+        cached: bool = True,
+    ) -> tuple[TableText, ...] | TableText:
+        """Set TableText (drawn by PainterTable), keyword arguments only
+
+        Args:
+            text: bar text.
+            width: fixed width in pixel.
+            height: fixed height in pixel.
+            fixed_width: fixed width in pixel, takes priority over width.
+            fixed_height: fixed height in pixel, takes priority over height.
+            offset_y: font vertical offset in pixel.
+            fg_color: foreground (font) color.
+            bg_color: background color.
+            alignment: Qt.Alignment.
+            last: cache last data for comparison.
+            count: number of TableText to set.
+            cached: whether to use text cache, set false for volatile text (such as timing, gap, speed).
+
+        Returns:
+            A single or multiple(tuple) TableText instances,
+            depends on count value (default 1).
+        """
+        bar_set = (
+            TableText(
+                width=width,
+                height=height,
+                fixed_width=fixed_width,
+                fixed_height=fixed_height,
+                offset_y=offset_y,
+                fg_color=fg_color,
+                bg_color=bg_color,
+                text=text,
+                alignment=alignment,
+                last=last,
+                cached=cached,
+            )
+            for _ in range(count)
+        )
+        if count > 1:
+            return tuple(bar_set)
+        return next(bar_set)
+
+    def set_tableimage(
+        self,
+        *,
+        image: QPixmap | None = None,
+        width: int = 0,
+        height: int = 0,
+        fixed_width: int = 0,
+        fixed_height: int = 0,
+        bg_color: str = "",
+        last: Any | None = None,
+        count: int = 1,
+    ) -> tuple[TableImage, ...] | TableImage:
+        """Set TableImage (drawn by PainterTable), keyword arguments only
+
+        Args:
+            image: QPixmap image.
+            width: fixed width in pixel.
+            height: fixed height in pixel.
+            fixed_width: fixed width in pixel, takes priority over width.
+            fixed_height: fixed height in pixel, takes priority over height.
+            bg_color: background color.
+            last: cache last data for comparison.
+            count: number of TableImage to set.
+
+        Returns:
+            A single or multiple(tuple) TableImage instances,
+            depends on count value (default 1).
+        """
+        bar_set = (
+            TableImage(
+                image=image,
+                width=width,
+                height=height,
+                fixed_width=fixed_width,
+                fixed_height=fixed_height,
+                bg_color=bg_color,
+                last=last,
+            )
+            for _ in range(count)
+        )
+        if count > 1:
+            return tuple(bar_set)
+        return next(bar_set)
+
+    def set_table(self, gap_hori: int = 0, gap_vert: int = 0) -> PainterTable:
+        """Set painter table as primary layout content
+
+        Args:
+            gap_hori: horizontal gap between columns in pixel.
+            gap_vert: vertical gap between rows in pixel.
+
+        Returns:
+            PainterTable instance.
+        """
+        table = PainterTable(self, gap_hori=gap_hori, gap_vert=gap_vert)
+        layout = self.set_grid_layout()
+        layout.addWidget(table, 0, 0)
+        self.set_primary_layout(layout=layout)
+        return table
+
     @staticmethod
     def set_grid_layout_vert(
         layout: QGridLayout,
@@ -0,0 +1,322 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Overlay cache
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from math import ceil
+from typing import Any, Callable
+
+from PySide2.QtCore import Qt
+from PySide2.QtGui import QFont, QFontMetrics, QPainter, QPen, QPixmap
+
+logger = logging.getLogger(__name__)
+
+
+class CacheStats:
+    """Cache hit & miss stats
+
+    Base class of overlay caches.
+
+    Attributes:
+        hits: number of cache hits.
+        misses: number of cache misses.
+    """
+
+    __slots__ = (
+        "_cache",
+        "hits",
+        "misses",
+    )
+    cache_name = "cache"
+
+    def __init__(self):
+        self._cache: dict = {}
+        self.hits = 0
+        self.misses = 0
+
+    def hit_rate(self) -> float:
+        """Cache hit rate (fraction)"""
+        total = self.hits + self.misses
+        if total:
+            return self.hits / total
+        return 0.0
+
+    def stats(self) -> str:
+        """Cache stats info"""
+        return f"hit rate {self.hit_rate():.1%} ({self.hits} hits, {self.misses} misses)"
+
+    def clear_stats(self):
+        """Log & reset stats"""
+        if self.hits or self.misses:
+            logger.info(
+                "CACHE: %s, %s, %s",
+                self.cache_name,
+                self.stats(),
+                self.usage(),
+            )
+        self.hits = 0
+        self.misses = 0
+
+    def usage(self) -> str:
+        """Cache usage info"""
+        return f"{len(self._cache)} entries"
+
+
+class LRUCache(CacheStats):
+    """Least recently used (LRU) cache with memory size limit
+
+    Base class of overlay caches that store entries as (value, memory size) tuple.
+
+    Attributes:
+        evictions: number of evicted entries.
+    """
+
+    __slots__ = (
+        "_size_limit",
+        "_size_used",
+        "evictions",
+    )
+
+    def __init__(self, size_limit: int = 0):
+        super().__init__()
+        self._cache: OrderedDict[tuple, tuple[Any, int]] = OrderedDict()
+        self._size_limit = size_limit
+        self._size_used = 0
+        self.evictions = 0
+
+    def set_limit(self, size_mb: float):
+        """Set cache memory limit (MB), 0 to disable cache"""
+        self._size_limit = int(max(size_mb, 0) * 1048576)
+        self._evict(self._size_limit)
+
+    def clear(self):
+        """Clear cache & log stats"""
+        self.clear_stats()
+        self._cache.clear()
+        self._size_used = 0
+        self.evictions = 0
+
+    def stats(self) -> str:
+        """Cache stats info"""
+        return (
+            f"hit rate {self.hit_rate():.1%} "
+            f"({self.hits} hits, {self.misses} misses, {self.evictions} evictions)"
+        )
+
+    def usage(self) -> str:
+        """Cache usage info"""
+        return f"{len(self._cache)} entries, {self._size_used // 1024}KB"
+
+    def _lookup(self, key: tuple) -> tuple[Any, int] | None:
+        """Get cached entry & mark as recently used, count hit or miss"""
+        entry = self._cache.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._cache.move_to_end(key)
+        return entry
+
+    def _store(self, key: tuple, entry: tuple[Any, int]):
+        """Add entry, then evict least recently used entries above size limit"""
+        self._cache[key] = entry
+        self._size_used += entry[1]
+        self._evict(self._size_limit)
+
+    def _evict(self, size_limit: int):
+        """Remove least recently used entries until below size limit"""
+        cache = self._cache
+        while cache and self._size_used > size_limit:
+            self._size_used -= cache.popitem(last=False)[1][1]
+            self.evictions += 1
+
+
+class TextCache(LRUCache):
+    """Text pixmap cache
+
+    Least recently used (LRU) cache of pre-rendered text pixmap,
+    shared by all widgets (GUI thread only).
+
+    Cache key:
+        text, font key, color, alignment, width, height, vertical offset, pixel ratio.
+    """
+
+    __slots__ = ("_pen",)
+    cache_name = "text"
+
+    def __init__(self, size_limit: int = 0):
+        super().__init__(size_limit)
+        self._pen = QPen()
+
+    def draw_text(
+        self,
+        painter: QPainter,
+        font: QFont,
+        font_key: str,
+        x: int,
+        y: int,
+        width: int,
+        height: int,
+        offset_y: int,
+        alignment: Qt.Alignment,
+        color: Any,
+        text: str,
+        cached: bool = True,
+    ):
+        """Draw cached text pixmap, text is clipped to (width, height) area
+
+        Args:
+            painter: target painter.
+            font: text font.
+            font_key: font key string, see QFont.key().
+            x, y: target position.
+            width, height: text area size.
+            offset_y: text vertical offset within text area.
+            alignment: text alignment within text area.
+            color: text color (hashable).
+            text: text string.
+            cached: whether to use cache, set false for volatile text
+                (such as timing, gap, speed) that rarely repeats, which is drawn directly.
+        """
+        if not cached or self._size_limit <= 0 or width <= 0 or height <= 0:
+            self.__draw_direct(painter, x, y, width, height, offset_y, alignment, color, text)
+            return
+        scale = painter.device().devicePixelRatioF()
+        key = (text, font_key, color, int(alignment), width, height, offset_y, scale)
+        try:
+            entry = self._lookup(key)
+        except TypeError:  # unhashable color type
+            self.__draw_direct(painter, x, y, width, height, offset_y, alignment, color, text)
+            return
+        if entry is None:
+            entry = self.__render(font, width, height, offset_y, alignment, color, text, scale)
+            self._store(key, entry)
+        painter.drawPixmap(x, y, entry[0])
+
+    def __draw_direct(self, painter, x, y, width, height, offset_y, alignment, color, text):
+        """Draw text without cache, text is clipped to text area by drawText (no TextDontClip flag)"""
+        self._pen.setColor(color)
+        painter.setPen(self._pen)
+        painter.drawText(x, y + offset_y, width, height, alignment, text)
+
+    def __render(self, font, width, height, offset_y, alignment, color, text, scale):
+        """Render text pixmap, returns pixmap & memory size (bytes)"""
+        pixel_width = ceil(width * scale)
+        pixel_height = ceil(height * scale)
+        pixmap = QPixmap(pixel_width, pixel_height)
+        pixmap.setDevicePixelRatio(scale)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setFont(font)
+        self._pen.setColor(color)
+        painter.setPen(self._pen)
+        painter.drawText(0, offset_y, width, height, alignment, text)
+        painter.end()
+        return pixmap, pixel_width * pixel_height * 4
+
+
+class ImageCache(LRUCache):
+    """Image (pixmap) cache
+
+    Least recently used (LRU) cache of loaded & scaled image resource,
+    shared by all widgets (GUI thread only), cleared on preset reload.
+
+    Cache key:
+        resource name, size, variant (such as color, icon index), see widget usage.
+    Cache value:
+        QPixmap or tuple of QPixmap (icon set).
+    """
+
+    __slots__ = ()
+    cache_name = "image"
+
+    def get(self, key: tuple, loader: Callable, *args, **kwargs) -> Any:
+        """Get cached image, or load & cache image from loader
+
+        Args:
+            key: cache key (resource name, size, variant).
+            loader: image loader function, returns QPixmap or tuple of QPixmap.
+            args, kwargs: loader arguments.
+
+        Returns:
+            QPixmap or tuple of QPixmap.
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            return entry[0]
+        image = loader(*args, **kwargs)
+        if self._size_limit > 0:
+            self._store(key, (image, image_size(image)))
+        return image
+
+
+class FontMetricsCache(CacheStats):
+    """Font metrics cache
+
+    Font metrics readings shared by all widgets with same font (GUI thread only),
+    which avoids repeated font matching & metrics calculation on widget loading.
+
+    Cached font metrics are kept across preset reloading,
+    as number of font combinations is limited.
+
+    Cache key:
+        font key (family, size, weight, style, hinting, etc).
+    """
+
+    __slots__ = ()
+    cache_name = "font metrics"
+
+    def get(self, font: QFont) -> tuple[int, int, int, int, int]:
+        """Get font metrics readings
+
+        Returns:
+            Average char width, height, leading, cap height, descent.
+        """
+        key = font.key()
+        metrics = self._cache.get(key)
+        if metrics is not None:
+            self.hits += 1
+            return metrics
+        self.misses += 1
+        font_metrics = QFontMetrics(font)
+        metrics = self._cache[key] = (
+            font_metrics.averageCharWidth(),
+            font_metrics.height(),
+            font_metrics.leading(),
+            font_metrics.capHeight(),
+            font_metrics.descent(),
+        )
+        return metrics
+
+
+def image_size(image: QPixmap | tuple[QPixmap, ...]) -> int:
+    """Image memory size (bytes)"""
+    if isinstance(image, QPixmap):
+        return image.width() * image.height() * max(image.depth(), 8) // 8
+    return sum(map(image_size, image))
+
+
+text_cache = TextCache()  # single instance shared by all widgets
+image_cache = ImageCache()  # single instance shared by all widgets
+font_metrics_cache = FontMetricsCache()  # single instance shared by all widgets
@@ -25,7 +25,8 @@ from __future__ import annotations
 from time import monotonic
 from typing import NamedTuple
 
-from PySide2.QtCore import QPoint
+from PySide2.QtCore import QPoint, QRect
+from PySide2.QtGui import QGuiApplication
 from PySide2.QtWidgets import QApplication, QWidget
 
 from ..validator import generator_init
@@ -93,7 +94,7 @@ class MousePosition:
     def update_grid(self, widget: QWidget):
         """Update widget snap position grid"""
         # Update grid if active screen name changed
-        screen = widget.screen()
+        screen = widget_screen(widget)
         if self._screen_name == screen.name():
             return
         self._screen_name = screen.name()
@@ -104,17 +105,18 @@ class MousePosition:
         # Update grid set (avoid duplicates)
         x_grid = {scr_x, scr_x + scr_width, scrfull_x, scrfull_x + scrfull_width}
         y_grid = {scr_y, scr_y + scr_height, scrfull_y, scrfull_y + scrfull_height}
-        # Add widget x, y coords
+        # Add widget x, y coords (child widgets in compositor mode)
+        parent = widget.parentWidget()
         try:
-            for other_widget in QApplication.topLevelWidgets():
+            for other_widget in parent.children() if parent else QApplication.topLevelWidgets():
                 if (
                     not hasattr(other_widget, "widget_name")
                     or widget is other_widget
                     or not other_widget.isVisible()
-                    or screen is not other_widget.screen()
+                    or screen is not widget_screen(other_widget)
                 ):
                     continue
-                other_x, other_y, other_width, other_height = other_widget.geometry().getRect()
+                other_x, other_y, other_width, other_height = global_geometry(other_widget).getRect()
                 x_grid.add(other_x)
                 x_grid.add(other_x + other_width)
                 y_grid.add(other_y)
@@ -173,6 +175,20 @@ class MousePosition:
         return pos
 
 
+def global_geometry(widget: QWidget) -> QRect:
+    """Widget geometry in global screen coordinates"""
+    if widget.isWindow():
+        return widget.geometry()
+    return QRect(widget.mapToGlobal(QPoint(0, 0)), widget.size())
+
+
+def widget_screen(widget: QWidget):
+    """Screen that contains widget center"""
+    if widget.isWindow():
+        return widget.screen()
+    return QGuiApplication.screenAt(global_geometry(widget).center()) or widget.screen()
+
+
 @generator_init
 def warning_flash(duration: float, interval: float, max_count: int):
     """Warning flash state"""
@@ -0,0 +1,230 @@
+#  TinyPedal is an open-source overlay application for racing simulation.
+#  Copyright (C) 2022-2026 TinyPedal developers, see contributors.md file
+#
+#  This file is part of TinyPedal.
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Overlay compositor window
+"""
+
+from __future__ import annotations
+
+import logging
+
+from PySide2.QtCore import QCoreApplication, QEvent, QPoint, Qt, Slot
+from PySide2.QtGui import QGuiApplication, QRegion
+from PySide2.QtWidgets import QGraphicsOpacityEffect, QWidget
+
+from .. import overlay_signal, realtime_state
+from ..const_app import APP_NAME
+from ..setting import Setting
+
+logger = logging.getLogger(__name__)
+
+# Events that change visible region of overlay widget
+REGION_EVENTS = frozenset((QEvent.Move, QEvent.Resize, QEvent.Show, QEvent.Hide))
+
+
+class CompositorWindow(QWidget):
+    """Compositor window
+
+    Single transparent top-level window that covers entire virtual desktop,
+    and hosts all overlay widgets as child widgets, so that all widgets share
+    one backing store and are drawn in one paint pass.
+
+    Window mask is set to visible widget region, so that mouse input
+    outside of widgets passes through to underlying windows.
+    """
+
+    def __init__(self, config: Setting):
+        super().__init__()
+        self.cfg = config
+        self._mask_pending = False
+        self.setWindowTitle(f"{APP_NAME} - Overlay")
+        self.setAttribute(Qt.WA_TranslucentBackground, True)
+        self.setWindowFlag(Qt.FramelessWindowHint, True)
+        self.setWindowFlag(Qt.WindowStaysOnTopHint, True)
+        self.setWindowFlag(Qt.WindowDoesNotAcceptFocus, True)
+        if not self.cfg.overlay["vr_compatibility"]:  # hide taskbar widget
+            self.setWindowFlag(Qt.Tool, True)
+        if self.cfg.compatibility["enable_bypass_window_manager"]:
+            self.setWindowFlag(Qt.X11BypassWindowManagerHint, True)
+        self.setWindowFlag(Qt.WindowTransparentForInput, self.cfg.overlay["fixed_position"])
+        self.setGeometry(QGuiApplication.primaryScreen().virtualGeometry())
+        self.setMask(QRegion(0, 0, 1, 1))
+        self.__connect_signal()
+
+    def origin(self) -> QPoint:
+        """Window origin in global screen coordinates"""
+        return self.geometry().topLeft()
+
+    def overlay_widgets(self) -> tuple[QWidget, ...]:
+        """Attached overlay widgets"""
+        return tuple(
+            child for child in self.children()
+            if isinstance(child, QWidget) and hasattr(child, "widget_name")
+        )
+
+    def unload(self):
+        """Unload compositor window"""
+        self.__break_signal()
+        self.close()
+        self.deleteLater()
+
+    def update_opacity(self):
+        """Update window opacity from attached widgets
+
+        Window opacity is set to highest widget opacity, widgets with
+        lower opacity are adjusted relative to window opacity.
+        """
+        widgets = self.overlay_widgets()
+        if not widgets:
+            return
+        opacity_max = max(max(_widget.wcfg["opacity"] for _widget in widgets), 0.01)
+        self.setWindowOpacity(opacity_max)
+        for _widget in widgets:
+            opacity = _widget.wcfg["opacity"] / opacity_max
+            if opacity < 1:
+                effect = _widget.graphicsEffect()
+                if not isinstance(effect, QGraphicsOpacityEffect):
+                    effect = QGraphicsOpacityEffect(_widget)
+                    _widget.setGraphicsEffect(effect)
+                effect.setOpacity(opacity)
+            elif _widget.graphicsEffect() is not None:
+                _widget.setGraphicsEffect(None)
+
+    def request_mask_update(self):
+        """Request window mask update (coalesced)"""
+        if not self._mask_pending:
+            self._mask_pending = True
+            QCoreApplication.postEvent(self, QEvent(QEvent.LayoutRequest))
+
+    def eventFilter(self, watched, event):
+        """Update window mask if widget region changed"""
+        if event.type() in REGION_EVENTS:
+            self.request_mask_update()
+        return False
+
+    def event(self, event):
+        """Update window mask"""
+        if event.type() == QEvent.LayoutRequest:
+            self._mask_pending = False
+            self.__update_mask()
+            return True
+        return super().event(event)
+
+    def __update_mask(self):
+        """Set window mask to visible widget region"""
+        region = QRegion()
+        for _widget in self.overlay_widgets():
+            if _widget.isVisible():
+                region += QRegion(_widget.geometry())
+        if region.isEmpty():  # empty mask would remove mask
+            region = QRegion(0, 0, 1, 1)
+        self.setMask(region)
+
+    def __reset_visibility(self):
+        """Reset visibility after window flag changed"""
+        self.setHidden(self.cfg.overlay["auto_hide"] and not realtime_state.active)
+
+    @Slot(bool)  # type: ignore[operator]
+    def __toggle_lock(self, locked: bool):
+        """Toggle window lock state"""
+        self.setWindowFlag(Qt.WindowTransparentForInput, locked)
+        self.__reset_visibility()
+
+    @Slot(bool)  # type: ignore[operator]
+    def __toggle_vr_compat(self, enabled: bool):
+        """Toggle window VR compatibility"""
+        self.setWindowFlag(Qt.Tool, not enabled)
+        self.__reset_visibility()
+
+    def __connect_signal(self):
+        """Connect overlay lock and hide signal"""
+        overlay_signal.locked.connect(self.__toggle_lock)
+        overlay_signal.hidden.connect(self.setHidden)
+        overlay_signal.iconify.connect(self.__toggle_vr_compat)
+
+    def __break_signal(self):
+        """Disconnect overlay lock and hide signal"""
+        overlay_signal.locked.disconnect(self.__toggle_lock)
+        overlay_signal.hidden.disconnect(self.setHidden)
+        overlay_signal.iconify.disconnect(self.__toggle_vr_compat)
+
+    def closeEvent(self, event):
+        """Ignore attempts to close via window Close button while widgets attached"""
+        if self.overlay_widgets():
+            event.ignore()
+
+
+class OverlayCompositor:
+    """Overlay compositor control
+
+    Creates compositor window on first attached widget,
+    and unloads compositor window after last widget detached.
+    """
+
+    __slots__ = ("_window",)
+
+    def __init__(self):
+        self._window: CompositorWindow | None = None
+
+    @staticmethod
+    def enabled(config: Setting) -> bool:
+        """Whether compositor mode is enabled (requires translucent background)"""
+        return (
+            config.compatibility["enable_overlay_compositor"]
+            and config.compatibility["enable_translucent_background"]
+        )
+
+    def attach(self, widget: QWidget) -> QPoint:
+        """Attach overlay widget to compositor window
+
+        Returns:
+            Position offset between global screen coordinates and compositor window.
+        """
+        window = self._window
+        if window is None:
+            window = self._window = CompositorWindow(widget.cfg)
+            window.setHidden(widget.cfg.overlay["auto_hide"] and not realtime_state.active)
+            logger.info("COMPOSITOR: overlay compositor window created")
+        widget.setParent(window)
+        widget.installEventFilter(window)
+        window.update_opacity()
+        return window.origin()
+
+    def update_opacity(self):
+        """Update compositor window opacity from attached widgets"""
+        if self._window is not None:
+            self._window.update_opacity()
+
+    def detach(self, widget: QWidget):
+        """Detach overlay widget from compositor window"""
+        window = self._window
+        if window is None:
+            return
+        widget.removeEventFilter(window)
+        widget.setParent(None)
+        if window.overlay_widgets():
+            window.update_opacity()
+            window.request_mask_update()
+        else:
+            self._window = None
+            window.unload()
+            logger.info("COMPOSITOR: overlay compositor window closed")
+
+
+compositor = OverlayCompositor()
@@ -22,12 +22,17 @@ Overlay base painter class.
 
 from __future__ import annotations
 
+import logging
 from typing import Any
 
-from PySide2.QtCore import QRectF, Qt
+from PySide2.QtCore import QCoreApplication, QEvent, QRectF, Qt
 from PySide2.QtGui import QFont, QPainter, QPen, QPixmap
 from PySide2.QtWidgets import QWidget
 
+from ._cache import text_cache
+
+logger = logging.getLogger(__name__)
+
 
 class WheelGaugeBar(QWidget):
     """Wheel gauge bar"""
@@ -383,6 +388,7 @@ class RawText(QWidget):
         bg_color: str = "",
         alignment: Qt.Alignment = Qt.AlignCenter,
         last: Any | None = None,
+        cached: bool = False,
     ):
         super().__init__(parent)
         if font is not None:
@@ -405,7 +411,9 @@ class RawText(QWidget):
         self.bg = bg_color if bg_color else Qt.transparent
         self._alignment = alignment
         self._offset_y = offset_y
-        self._pen_text = QPen()
+        self._cached = cached
+        self._font = self.font()
+        self._font_key = self._font.key()
         self._width = self.width()
         self._height = self.height()
 
@@ -415,6 +423,12 @@ class RawText(QWidget):
         self.fg = Qt.transparent
         self.bg = Qt.transparent
 
+    def changeEvent(self, event):
+        """Update font info"""
+        if event.type() == QEvent.FontChange:
+            self._font = self.font()
+            self._font_key = self._font.key()
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -423,10 +437,13 @@ class RawText(QWidget):
     def paintEvent(self, event):
         """Draw"""
         painter = QPainter(self)
-        self._pen_text.setColor(self.fg)
-        painter.setPen(self._pen_text)
         painter.fillRect(0, 0, self._width, self._height, self.bg)
-        painter.drawText(0, self._offset_y, self._width, self._height, self._alignment, self.text)
+        if self.text:
+            text_cache.draw_text(
+                painter, self._font, self._font_key,
+                0, 0, self._width, self._height, self._offset_y,
+                self._alignment, self.fg, self.text, self._cached,
+            )
 
 
 class RawImage(QWidget):
@@ -562,7 +579,8 @@ class MultiCompounds(QWidget):
         self._offset_y = offset_y
         self._padding = padding // 2
         self._word_width = width + spacing
-        self._pen_text = QPen()
+        self._font = self.font()
+        self._font_key = self._font.key()
         self._width = self.width()
         self._height = self.height()
         self.compounds = ()
@@ -574,6 +592,12 @@ class MultiCompounds(QWidget):
         self.colors = (Qt.transparent,) * self._count
         self.bg = Qt.transparent
 
+    def changeEvent(self, event):
+        """Update font info"""
+        if event.type() == QEvent.FontChange:
+            self._font = self.font()
+            self._font_key = self._font.key()
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -586,15 +610,11 @@ class MultiCompounds(QWidget):
         for index, compound in enumerate(self.compounds):
             if compound == "":
                 continue
-            self._pen_text.setColor(self.colors[index])
-            painter.setPen(self._pen_text)
-            painter.drawText(
-                self._padding + self._word_width * index,
-                self._offset_y,
-                self._word_width,
-                self._height,
-                self._alignment,
-                compound,
+            text_cache.draw_text(
+                painter, self._font, self._font_key,
+                self._padding + self._word_width * index, 0,
+                self._word_width, self._height, self._offset_y,
+                self._alignment, self.colors[index], compound,
             )
 
 
@@ -639,7 +659,8 @@ class DeltaLapTime(QWidget):
         self._offset_y = offset_y
         self._padding = padding // 2
         self._word_width = width + spacing
-        self._pen_text = QPen()
+        self._font = self.font()
+        self._font_key = self._font.key()
         self._width = self.width()
         self._height = self.height()
         self._inverted = inverted
@@ -652,6 +673,12 @@ class DeltaLapTime(QWidget):
         self.bg = Qt.transparent
         self.is_player = False
 
+    def changeEvent(self, event):
+        """Update font info"""
+        if event.type() == QEvent.FontChange:
+            self._font = self.font()
+            self._font_key = self._font.key()
+
     def resizeEvent(self, event):
         """Update size info"""
         self._width = self.width()
@@ -667,35 +694,500 @@ class DeltaLapTime(QWidget):
             if delta == "":
                 continue
 
-            if -999 < delta < 0:  # player time gain
-                if delta < -9.94:
-                    text = f"{-delta:.0f}"
-                else:
-                    text = f"{-delta:.1f}"
+            text, color_index = format_delta_laptime(delta)
+            if self.is_player:
+                fg_color = self.fg_player
+            elif color_index == 1:
                 fg_color = self.fg_gain
-            elif 0 < delta < 999:  # player time loss
-                if delta > 9.94:
-                    text = f"{delta:.0f}"
-                else:
-                    text = f"{delta:.1f}"
+            elif color_index == 2:
                 fg_color = self.fg_loss
-            elif delta == 0:
-                text = "0.0"
-                fg_color = self.fg
             else:
-                text = "-.-"
                 fg_color = self.fg
 
+            text_cache.draw_text(
+                painter, self._font, self._font_key,
+                self._padding + self._word_width * index, 0,
+                self._word_width, self._height, self._offset_y,
+                self._alignment, fg_color, text,
+            )
+
+
+class TableCell:
+    """Table cell base, drawn by PainterTable
+
+    Mimic RawText attributes & methods, so that widget update methods
+    can set cell data the same way as QWidget based bars.
+    Calling update() marks cell dirty, which is redrawn in next table paint.
+    """
+
+    __slots__ = (
+        "state",
+        "last",
+        "bg",
+        "_table",
+        "_width",
+        "_height",
+        "_fixed_width",
+        "_hidden",
+        "_dirty",
+        "_rect",
+    )
+
+    def __init__(
+        self,
+        width: int = 0,
+        height: int = 0,
+        fixed_width: int = 0,
+        fixed_height: int = 0,
+        bg_color: str = "",
+        last: Any | None = None,
+    ):
+        self.state = None
+        self.last = last
+        self.bg = bg_color if bg_color else Qt.transparent
+        self._table: PainterTable | None = None
+        self._width = max(fixed_width, width, 0)
+        self._height = max(fixed_height if fixed_height > 0 else height, 0)
+        self._fixed_width = fixed_width > 0
+        self._hidden = False
+        self._dirty = False
+        self._rect: tuple[int, int, int, int] | None = None  # x, y, width, height
+
+    def clear(self):
+        """Clear display"""
+        self.bg = Qt.transparent
+
+    def update(self):
+        """Mark cell dirty"""
+        if not self._dirty and self._table is not None:
+            self._dirty = True
+            self._table.mark_dirty(self)
+
+    def setHidden(self, hidden: bool):
+        """Set hidden state"""
+        hidden = bool(hidden)
+        if self._hidden != hidden:
+            self._hidden = hidden
+            self.__relayout()
+
+    def show(self):
+        """Show cell"""
+        self.setHidden(False)
+
+    def hide(self):
+        """Hide cell"""
+        self.setHidden(True)
+
+    def setFixedHeight(self, height: int):
+        """Set fixed height"""
+        if self._height != height:
+            self._height = height
+            self.__relayout()
+
+    def __relayout(self):
+        """Request table relayout"""
+        if self._table is not None:
+            self._table.relayout()
+
+    def draw(self, painter: QPainter, font: QFont, font_key: str, x: int, y: int, width: int, height: int):
+        """Draw cell background"""
+        painter.setCompositionMode(QPainter.CompositionMode_Source)
+        painter.fillRect(x, y, width, height, self.bg)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceOver)
+
+
+class TableText(TableCell):
+    """Table text cell, equivalent of RawText"""
+
+    __slots__ = (
+        "text",
+        "fg",
+        "_alignment",
+        "_offset_y",
+        "_cached",
+    )
+
+    def __init__(
+        self,
+        text: str = "",
+        width: int = 0,
+        height: int = 0,
+        fixed_width: int = 0,
+        fixed_height: int = 0,
+        offset_y: int = 0,
+        fg_color: str = "",
+        bg_color: str = "",
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+        cached: bool = True,
+    ):
+        super().__init__(width, height, fixed_width, fixed_height, bg_color, last)
+        self.text = text
+        self.fg = fg_color if fg_color else Qt.transparent
+        self._alignment = alignment
+        self._offset_y = offset_y
+        self._cached = cached
+
+    def clear(self):
+        """Clear display"""
+        self.text = ""
+        self.fg = Qt.transparent
+        self.bg = Qt.transparent
+
+    def draw(self, painter: QPainter, font: QFont, font_key: str, x: int, y: int, width: int, height: int):
+        """Draw cell"""
+        super().draw(painter, font, font_key, x, y, width, height)
+        if self.text:
+            text_cache.draw_text(
+                painter, font, font_key,
+                x, y, width, height, self._offset_y,
+                self._alignment, self.fg, self.text, self._cached,
+            )
+
+
+class TableImage(TableCell):
+    """Table image cell, equivalent of RawImage"""
+
+    __slots__ = (
+        "image",
+    )
+
+    def __init__(
+        self,
+        image: QPixmap | None = None,
+        width: int = 0,
+        height: int = 0,
+        fixed_width: int = 0,
+        fixed_height: int = 0,
+        bg_color: str = "",
+        last: Any | None = None,
+    ):
+        super().__init__(width, height, fixed_width, fixed_height, bg_color, last)
+        self.image = image
+
+    def clear(self):
+        """Clear display"""
+        self.image = None
+        self.bg = Qt.transparent
+
+    def draw(self, painter: QPainter, font: QFont, font_key: str, x: int, y: int, width: int, height: int):
+        """Draw cell"""
+        super().draw(painter, font, font_key, x, y, width, height)
+        if isinstance(self.image, QPixmap):
+            painter.drawPixmap(
+                x + (width - self.image.width()) // 2,  # align center
+                y + (height - self.image.height()) // 2,
+                self.image,
+            )
+
+
+class TableCompounds(TableCell):
+    """Table multi color compounds text cell, equivalent of MultiCompounds"""
+
+    __slots__ = (
+        "compounds",
+        "colors",
+        "_count",
+        "_alignment",
+        "_offset_y",
+        "_padding",
+        "_word_width",
+    )
+
+    def __init__(
+        self,
+        count: int = 4,
+        spacing: int = 0,
+        padding: int = 0,
+        width: int = 0,
+        height: int = 0,
+        offset_y: int = 0,
+        fg_color: str = "",
+        bg_color: str = "",
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+    ):
+        super().__init__(
+            fixed_width=count * (width + spacing) + padding,
+            fixed_height=height,
+            bg_color=bg_color,
+            last=last,
+        )
+        fg = fg_color if fg_color else Qt.transparent
+        self._count = count
+        self._alignment = alignment
+        self._offset_y = offset_y
+        self._padding = padding // 2
+        self._word_width = width + spacing
+        self.compounds = ()
+        self.colors = (fg,) * count
+
+    def clear(self):
+        """Clear display"""
+        self.compounds = ()
+        self.colors = (Qt.transparent,) * self._count
+        self.bg = Qt.transparent
+
+    def draw(self, painter: QPainter, font: QFont, font_key: str, x: int, y: int, width: int, height: int):
+        """Draw cell"""
+        super().draw(painter, font, font_key, x, y, width, height)
+        for index, compound in enumerate(self.compounds):
+            if compound == "":
+                continue
+            text_cache.draw_text(
+                painter, font, font_key,
+                x + self._padding + self._word_width * index, y,
+                self._word_width, height, self._offset_y,
+                self._alignment, self.colors[index], compound,
+            )
+
+
+class TableDeltaLapTime(TableCell):
+    """Table delta lap time text cell, equivalent of DeltaLapTime"""
+
+    __slots__ = (
+        "fg",
+        "fg_gain",
+        "fg_loss",
+        "fg_player",
+        "delta",
+        "is_player",
+        "_alignment",
+        "_offset_y",
+        "_padding",
+        "_word_width",
+        "_inverted",
+    )
+
+    def __init__(
+        self,
+        count: int = 5,
+        spacing: int = 0,
+        padding: int = 0,
+        width: int = 0,
+        height: int = 0,
+        offset_y: int = 0,
+        fg_color: str = "",
+        bg_color: str = "",
+        fg_color_gain: str = "",
+        fg_color_loss: str = "",
+        fg_color_player: str = "",
+        inverted: bool = False,
+        alignment: Qt.Alignment = Qt.AlignCenter,
+        last: Any | None = None,
+    ):
+        super().__init__(
+            fixed_width=count * (width + spacing) + padding,
+            fixed_height=height,
+            bg_color=bg_color,
+            last=last,
+        )
+        self.fg = fg_color if fg_color else Qt.transparent
+        self.fg_gain = fg_color_gain
+        self.fg_loss = fg_color_loss
+        self.fg_player = fg_color_player
+        self._alignment = alignment
+        self._offset_y = offset_y
+        self._padding = padding // 2
+        self._word_width = width + spacing
+        self._inverted = inverted
+        self.delta = ()
+        self.is_player = False
+
+    def clear(self):
+        """Clear display"""
+        self.delta = ()
+        self.bg = Qt.transparent
+        self.is_player = False
+
+    def draw(self, painter: QPainter, font: QFont, font_key: str, x: int, y: int, width: int, height: int):
+        """Draw cell"""
+        super().draw(painter, font, font_key, x, y, width, height)
+        for index, delta in enumerate(
+            reversed(self.delta) if self._inverted else self.delta
+        ):
+            if delta == "":
+                continue
+            text, color_index = format_delta_laptime(delta)
             if self.is_player:
                 fg_color = self.fg_player
-
-            self._pen_text.setColor(fg_color)
-            painter.setPen(self._pen_text)
-            painter.drawText(
-                self._padding + self._word_width * index,
-                self._offset_y,
-                self._word_width,
-                self._height,
-                self._alignment,
-                text,
+            elif color_index == 1:
+                fg_color = self.fg_gain
+            elif color_index == 2:
+                fg_color = self.fg_loss
+            else:
+                fg_color = self.fg
+            text_cache.draw_text(
+                painter, font, font_key,
+                x + self._padding + self._word_width * index, y,
+                self._word_width, height, self._offset_y,
+                self._alignment, fg_color, text,
             )
+
+
+class PainterTable(QWidget):
+    """Painter table widget
+
+    Draw all table cells with a single painter onto a backing pixmap,
+    only cells that marked dirty are redrawn on each paint.
+    Column & row placement follows same rule as grid layout:
+    columns are ordered by column index, hidden rows & columns take no space.
+    Each column index can only be added once, and each cell is clipped to its own area.
+    """
+
+    def __init__(self, parent, gap_hori: int = 0, gap_vert: int = 0):
+        super().__init__(parent)
+        self._gap_hori = gap_hori
+        self._gap_vert = gap_vert
+        self._columns: dict[int, tuple[TableCell, ...]] = {}
+        self._dirty: list[TableCell] = []
+        self._relayout = False
+        self._pixmap = QPixmap()
+
+    def add_column(
+        self,
+        targets: tuple[TableCell, ...],
+        column: int = 0,
+        bottom_to_top: bool = False,
+        hide_start: int = 99999,
+    ):
+        """Add table cells as column, same as set_grid_layout_table_column
+
+        Column with duplicated column index is rejected (not drawn),
+        instead of overlapping cells of existing column.
+        """
+        if column in self._columns:
+            logger.warning("PAINTER: duplicated column index %s, column not added", column)
+            return
+        if bottom_to_top:
+            targets = tuple(reversed(targets))
+        for row, target in enumerate(targets):
+            target._table = self
+            if hide_start <= row:
+                target._hidden = True
+        self._columns[column] = targets
+        self.relayout()
+
+    def relayout(self):
+        """Request relayout, processed once in next event loop"""
+        if not self._relayout:
+            self._relayout = True
+            QCoreApplication.postEvent(self, QEvent(QEvent.LayoutRequest))
+
+    def event(self, event):
+        """Handle relayout request"""
+        if event.type() == QEvent.LayoutRequest and self._relayout:
+            self.__update_layout()
+            self.update()
+        return super().event(event)
+
+    def mark_dirty(self, target: TableCell):
+        """Add dirty cell"""
+        if not self._dirty:
+            self.update()
+        self._dirty.append(target)
+
+    def __update_layout(self):
+        """Update cell geometry & backing pixmap"""
+        self._relayout = False
+        columns = [self._columns[key] for key in sorted(self._columns)]
+        total_rows = max(map(len, columns), default=0)
+
+        # Row height, hidden row takes no space
+        rows_y = [-1] * total_rows
+        rows_height = [0] * total_rows
+        pos_y = 0
+        for row in range(total_rows):
+            height = -1
+            for targets in columns:
+                if row < len(targets) and not targets[row]._hidden:
+                    height = max(targets[row]._height, height)
+            if height >= 0:
+                if pos_y:
+                    pos_y += self._gap_vert
+                rows_y[row] = pos_y
+                rows_height[row] = height
+                pos_y += height
+        total_height = pos_y
+
+        # Column width, hidden column takes no space
+        pos_x = 0
+        for targets in columns:
+            width = -1
+            for target in targets:
+                if not target._hidden:
+                    width = max(target._width, width)
+            if width >= 0 and pos_x:
+                pos_x += self._gap_hori
+            for row, target in enumerate(targets):
+                target._dirty = False
+                if target._hidden or width < 0:
+                    target._rect = None
+                    continue
+                row_y = rows_y[row]
+                row_height = rows_height[row]
+                cell_width = target._width if target._fixed_width else width
+                cell_height = min(target._height, row_height)
+                target._rect = (
+                    pos_x + (width - cell_width) // 2,
+                    row_y + (row_height - cell_height) // 2,
+                    cell_width,
+                    cell_height,
+                )
+            if width >= 0:
+                pos_x += width
+        total_width = pos_x
+
+        self.setFixedSize(total_width, total_height)
+        scale = self.devicePixelRatioF()
+        self._pixmap = QPixmap(round(total_width * scale), round(total_height * scale))
+        self._pixmap.setDevicePixelRatio(scale)
+        self._pixmap.fill(Qt.transparent)
+        self._dirty = [target for targets in columns for target in targets if target._rect]
+
+    def __draw_dirty(self):
+        """Draw dirty cells onto backing pixmap"""
+        if not self._pixmap.isNull():
+            painter = QPainter(self._pixmap)
+            font = self.font()
+            font_key = font.key()
+            painter.setFont(font)
+            for target in self._dirty:
+                target._dirty = False
+                rect = target._rect
+                if rect is not None:
+                    painter.setClipRect(*rect)  # replace clip per cell
+                    target.draw(painter, font, font_key, *rect)
+            painter.end()
+        else:
+            for target in self._dirty:
+                target._dirty = False
+        self._dirty.clear()
+
+    def paintEvent(self, event):
+        """Draw"""
+        if self._relayout:
+            self.__update_layout()
+        if self._dirty:
+            self.__draw_dirty()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._pixmap)
+
+
+def format_delta_laptime(delta: float) -> tuple[str, int]:
+    """Format delta lap time text
+
+    Returns:
+        Delta text, color index: 0 = default, 1 = gain, 2 = loss.
+    """
+    if -999 < delta < 0:  # player time gain
+        if delta < -9.94:
+            return f"{-delta:.0f}", 1
+        return f"{-delta:.1f}", 1
+    if 0 < delta < 999:  # player time loss
+        if delta > 9.94:
+            return f"{delta:.0f}", 2
+        return f"{delta:.1f}", 2
+    if delta == 0:
+        return "0.0", 0
+    return "-.-", 0
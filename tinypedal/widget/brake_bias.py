@@ -66,6 +66,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_brake_bias"],
                 bg_color=self.wcfg["background_color_brake_bias"],
             )
+            self.bind_style(
+                self.bar_bbias,
+                fg="font_color_brake_bias",
+                bg="background_color_brake_bias",
+            )
             self.set_primary_orient(
                 target=self.bar_bbias,
                 column=self.wcfg["display_order_brake_bias"],
@@ -82,6 +87,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_baseline_bias_delta"],
                 bg_color=self.wcfg["background_color_baseline_bias_delta"],
             )
+            self.bind_style(
+                self.bar_delta,
+                fg="font_color_baseline_bias_delta",
+                bg="background_color_baseline_bias_delta",
+            )
             self.set_primary_orient(
                 target=self.bar_delta,
                 column=self.wcfg["display_order_baseline_bias_delta"],
@@ -98,6 +108,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_brake_migration"],
                 bg_color=self.wcfg["background_color_brake_migration"],
             )
+            self.bind_style(
+                self.bar_bmigt,
+                fg="font_color_brake_migration",
+                bg="background_color_brake_migration",
+            )
             self.set_primary_orient(
                 target=self.bar_bmigt,
                 column=self.wcfg["display_order_brake_migration"],
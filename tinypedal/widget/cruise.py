@@ -73,6 +73,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_compass"],
                 bg_color=self.wcfg["background_color_compass"],
             )
+            self.bind_style(
+                self.bar_compass,
+                fg="font_color_compass",
+                bg="background_color_compass",
+            )
             self.set_primary_orient(
                 target=self.bar_compass,
                 column=self.wcfg["display_order_compass"],
@@ -89,6 +94,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_elevation"],
                 bg_color=self.wcfg["background_color_elevation"],
             )
+            self.bind_style(
+                self.bar_elevation,
+                fg="font_color_elevation",
+                bg="background_color_elevation",
+            )
             self.set_primary_orient(
                 target=self.bar_elevation,
                 column=self.wcfg["display_order_elevation"],
@@ -105,6 +115,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_odometer"],
                 bg_color=self.wcfg["background_color_odometer"],
             )
+            self.bind_style(
+                self.bar_odometer,
+                fg="font_color_odometer",
+                bg="background_color_odometer",
+            )
             self.set_primary_orient(
                 target=self.bar_odometer,
                 column=self.wcfg["display_order_odometer"],
@@ -121,6 +136,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_distance_into_lap"],
                 bg_color=self.wcfg["background_color_distance_into_lap"],
             )
+            self.bind_style(
+                self.bar_lap_distance,
+                fg="font_color_distance_into_lap",
+                bg="background_color_distance_into_lap",
+            )
             self.set_primary_orient(
                 target=self.bar_lap_distance,
                 column=self.wcfg["display_order_distance_into_lap"],
@@ -137,6 +157,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_cornering_radius"],
                 bg_color=self.wcfg["background_color_cornering_radius"],
             )
+            self.bind_style(
+                self.bar_cornering_radius,
+                fg="font_color_cornering_radius",
+                bg="background_color_cornering_radius",
+            )
             self.set_primary_orient(
                 target=self.bar_cornering_radius,
                 column=self.wcfg["display_order_cornering_radius"],
@@ -75,6 +75,11 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_power_locking_front"],
                 last=0,
             )
+            self.bind_style(
+                self.bar_power_front,
+                fg="font_color_power_locking_front",
+                bg="background_color_power_locking_front",
+            )
             self.set_primary_orient(
                 target=self.bar_power_front,
                 column=self.wcfg["display_order_power_locking_front"],
@@ -92,6 +97,11 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_coast_locking_front"],
                 last=0,
             )
+            self.bind_style(
+                self.bar_coast_front,
+                fg="font_color_coast_locking_front",
+                bg="background_color_coast_locking_front",
+            )
             self.set_primary_orient(
                 target=self.bar_coast_front,
                 column=self.wcfg["display_order_coast_locking_front"],
@@ -109,6 +119,11 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_power_locking_rear"],
                 last=0,
             )
+            self.bind_style(
+                self.bar_power_rear,
+                fg="font_color_power_locking_rear",
+                bg="background_color_power_locking_rear",
+            )
             self.set_primary_orient(
                 target=self.bar_power_rear,
                 column=self.wcfg["display_order_power_locking_rear"],
@@ -126,6 +141,11 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_coast_locking_rear"],
                 last=0,
             )
+            self.bind_style(
+                self.bar_coast_rear,
+                fg="font_color_coast_locking_rear",
+                bg="background_color_coast_locking_rear",
+            )
             self.set_primary_orient(
                 target=self.bar_coast_rear,
                 column=self.wcfg["display_order_coast_locking_rear"],
@@ -26,7 +26,7 @@ from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 from .. import calculation as calc
 from .. import units
 from ..api_control import api
-from ..module_info import minfo
+from ..module_info import MappingSnapshot, minfo
 from ._base import Overlay
 
 
@@ -88,19 +88,19 @@ class Realtime(Overlay):
         self.pen_text_scale.setColor(self.wcfg["font_color_elevation_scale"])
 
         # Last data
-        self.last_modified = 0
+        self.last_modified = None
+        self.map_sectors = None
         self.veh_pos = 0
         self.map_scaled = None
         self.map_range = (0,10,0,10)
         self.map_scale = 1,1
 
-        self.update_elevation(-1)
+        self.update_elevation(MappingSnapshot())
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Elevation map
-        modified = minfo.mapping.lastModified
-        self.update_elevation(modified)
+        self.update_elevation(minfo.mapping.snapshot)
 
         # Vehicle position
         temp_veh_pos = self.display_width * api.read.lap.progress()
@@ -109,12 +109,12 @@ class Realtime(Overlay):
             self.update()
 
     # GUI update methods
-    def update_elevation(self, data):
+    def update_elevation(self, snapshot: MappingSnapshot):
         """Elevation map update"""
-        if self.last_modified != data:
-            self.last_modified = data
-            raw_data = minfo.mapping.elevations if data != -1 else None
-            map_path = self.create_elevation_path(raw_data)
+        if self.last_modified != snapshot.lastModified:
+            self.last_modified = snapshot.lastModified
+            self.map_sectors = snapshot.sectors
+            map_path = self.create_elevation_path(snapshot.elevations, snapshot.elevationsLOD)
             self.draw_background(map_path)
             self.draw_progress(map_path)
             self.draw_progress_line(map_path)
@@ -158,8 +158,8 @@ class Realtime(Overlay):
                 f"1:{map_scale}"
             )
 
-    def create_elevation_path(self, raw_coords=None):
-        """Create elevation path"""
+    def create_elevation_path(self, raw_coords=None, map_lod=None):
+        """Create elevation path, use map LOD level that fits display scale"""
         map_path = QPainterPath()
         if raw_coords:
             self.map_scaled, self.map_range, self.map_scale = calc.scale_elevation(
@@ -174,20 +174,21 @@ class Realtime(Overlay):
             map_path.moveTo(-999, self.map_scaled[-2][1])  # 2nd last node y pos
 
             # Set middle nodes
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.display_width, self.display_detail_level)
+            map_scaled = self.map_scaled
+            total_nodes = len(map_scaled) - 1
+            map_nodes = calc.select_map_lod(map_lod, self.map_scale[1], self.display_detail_level)
+            if map_nodes is None:  # full detail
+                map_nodes = range(len(map_scaled))
             last_dist = 0
-            last_skip = 0
-            for index, coords in enumerate(self.map_scaled):
+            for index in map_nodes:
+                coords = map_scaled[index]
                 if index == 0:
                     map_path.lineTo(0, sf_y_average)
-                elif index >= total_nodes:  # don't skip last node
+                elif index >= total_nodes:  # last node
                     map_path.lineTo(self.display_width, sf_y_average)
-                elif coords[0] > last_dist and last_skip >= skip_node:
+                elif coords[0] > last_dist:
                     map_path.lineTo(*coords)
-                    last_skip = 0
                     last_dist = coords[0]
-                last_skip += 1
 
             # Set boundary end node
             map_path.lineTo(self.display_width + 999, self.map_scaled[1][1])  # 2nd node y pos
@@ -304,7 +305,7 @@ class Realtime(Overlay):
             painter.drawLine(self.display_width, -999, self.display_width, 999)
 
         # Draw sector line
-        sectors_index = minfo.mapping.sectors
+        sectors_index = self.map_sectors
         if self.wcfg["show_sector_line"] and self.map_scaled and isinstance(sectors_index, tuple):
             pen.setWidth(self.wcfg["sector_line_width"])
             pen.setColor(self.wcfg["sector_line_color"])
@@ -26,7 +26,9 @@ from PySide2.QtGui import QBrush, QPainter, QPen, QPixmap
 from .. import calculation as calc
 from ..api_control import api
 from ..const_file import ImageFile
+from ..userfile.custom_image import load_custom_image
 from ._base import Overlay
+from ._cache import image_cache
 
 
 class Realtime(Overlay):
@@ -81,9 +83,12 @@ class Realtime(Overlay):
         self.resize(self.area_size, self.area_size)
         self.pixmap_background = QPixmap(self.area_size, self.area_size)
         self.pixmap_dot = QPixmap(self.dot_size * 2, self.dot_size * 2)
-        self.pixmap_icon = QPixmap(ImageFile.COMPASS).scaledToWidth(
-            int(self.area_size * 1.5),
-            mode=Qt.SmoothTransformation
+        self.pixmap_icon = image_cache.get(
+            (ImageFile.COMPASS, int(self.area_size * 1.5)),
+            load_custom_image,
+            user_file="",
+            default_file=ImageFile.COMPASS,
+            width=int(self.area_size * 1.5),
         )
 
         self.pen_yaw = QPen()
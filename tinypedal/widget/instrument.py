@@ -20,14 +20,14 @@
 Instrument Widget
 """
 
-from PySide2.QtCore import Qt
 from PySide2.QtGui import QPixmap
 
 from ..api_control import api
 from ..const_file import ImageFile
 from ..module_info import minfo
-from ..userfile.custom_image import split_pixmap_image
+from ..userfile.custom_image import load_custom_image, split_pixmap_image
 from ._base import Overlay
+from ._cache import image_cache
 
 
 class Realtime(Overlay):
@@ -43,8 +43,13 @@ class Realtime(Overlay):
         icon_size = max(self.wcfg["icon_size"], 16) // 2 * 2
 
         # Config canvas
-        pixmap_icon = QPixmap(ImageFile.INSTRUMENT).scaledToWidth(
-            icon_size * 2, mode=Qt.SmoothTransformation)
+        pixmap_icon = image_cache.get(
+            (ImageFile.INSTRUMENT, icon_size * 2),
+            load_custom_image,
+            user_file="",
+            default_file=ImageFile.INSTRUMENT,
+            width=icon_size * 2,
+        )
         # 0 = enabled icon state, 1 = disabled icon state.
         self.pixmap_headlights = create_icon_set(pixmap_icon, icon_size, 0)
         self.pixmap_ignition = create_icon_set(pixmap_icon, icon_size, 1)
@@ -25,7 +25,7 @@ from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap, QRadial
 
 from .. import calculation as calc
 from ..api_control import api
-from ..module_info import minfo
+from ..module_info import MappingSnapshot, minfo
 from ._base import Overlay
 
 
@@ -108,20 +108,20 @@ class Realtime(Overlay):
 
         # Last data
         self.last_veh_data_version = None
-        self.last_modified = 0
+        self.last_modified = None
+        self.map_sectors = None
         self.map_scaled = None
         self.map_size = 1,1
         self.map_offset = 0,0
 
         self.draw_background()
         self.draw_map_mask_pixmap()
-        self.update_map(-1)
+        self.update_map(MappingSnapshot())
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Map
-        modified = minfo.mapping.lastModified
-        self.update_map(modified)
+        self.update_map(minfo.mapping.snapshot)
 
         # Vehicles
         veh_data_version = minfo.vehicles.dataSetVersion
@@ -130,11 +130,12 @@ class Realtime(Overlay):
             self.update()
 
     # GUI update methods
-    def update_map(self, data):
+    def update_map(self, snapshot: MappingSnapshot):
         """Map update"""
-        if self.last_modified != data:
-            self.last_modified = data
-            self.create_map_path(minfo.mapping.coordinates)
+        if self.last_modified != snapshot.lastModified:
+            self.last_modified = snapshot.lastModified
+            self.map_sectors = snapshot.sectors
+            self.create_map_path(snapshot.coordinates, snapshot.coordinatesLOD)
 
     def paintEvent(self, event):
         """Draw"""
@@ -143,7 +144,7 @@ class Realtime(Overlay):
         # Draw map
         self.draw_map_image(painter)
         # Draw vehicles
-        self.draw_vehicle(painter, minfo.vehicles.dataSet, minfo.relative.drawOrder)
+        self.draw_vehicle(painter, minfo.vehicles.dataSet, minfo.relative.snapshot.drawOrder)
         # Apply mask
         if self.wcfg["show_fade_out"]:
             painter.setCompositionMode(QPainter.CompositionMode_DestinationOut)
@@ -183,18 +184,22 @@ class Realtime(Overlay):
                 (self.area_center - self.wcfg["circle_outline_width"]) * 2
             )
 
-    def create_map_path(self, raw_coords=None):
-        """Create map path"""
+    def create_map_path(self, raw_coords=None, map_lod=None):
+        """Create map path, use map LOD level that fits display scale"""
         if raw_coords:
             map_path = QPainterPath()
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             (self.map_scaled, self.map_size, self.map_offset
              ) = calc.zoom_map(raw_coords, self.global_scale)
-            for index, coords in enumerate(self.map_scaled):
+            map_scaled = self.map_scaled
+            map_nodes = calc.select_map_lod(map_lod, self.global_scale, 1)
+            if map_nodes is None:  # full detail
+                map_nodes = range(len(map_scaled))
+            for index in map_nodes:
                 if index == 0:
-                    map_path.moveTo(*coords)
+                    map_path.moveTo(*map_scaled[index])
                 else:
-                    map_path.lineTo(*coords)
+                    map_path.lineTo(*map_scaled[index])
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
                 map_path.closeSubpath()
@@ -203,7 +208,7 @@ class Realtime(Overlay):
             self.create_sector_path(
                 sfinish_path, self.map_scaled, 0, self.wcfg["start_line_length"])
             # Create sectors paths
-            sectors_index = minfo.mapping.sectors
+            sectors_index = self.map_sectors
             if isinstance(sectors_index, tuple):
                 sector_path = QPainterPath()
                 for index in sectors_index:
@@ -34,7 +34,8 @@ from ..module_info import minfo
 from ..userfile.custom_image import load_brand_logo_image
 from ..userfile.heatmap import select_compound_color, select_compound_symbol
 from ._base import Overlay
-from ._painter import MultiCompounds
+from ._cache import image_cache
+from ._painter import TableCompounds
 
 
 class Realtime(Overlay):
@@ -43,8 +44,7 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
-        self.set_primary_layout(layout=layout)
+        self.table = self.set_table(gap_vert=self.wcfg["bar_gap"])
 
         # Config font
         font = self.config_font(
@@ -85,7 +85,7 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_position"],
                 plr_bg_color=self.wcfg["background_color_player_position"],
             )
-            self.bars_pos = self.set_rawtext(
+            self.bars_pos = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -93,8 +93,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pos[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pos,
                 column=self.wcfg["display_order_position"],
             )
@@ -118,7 +117,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_change"],
                 ),
             )
-            self.bars_pgl = self.set_rawtext(
+            self.bars_pgl = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -126,8 +125,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pgl[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pgl,
                 column=self.wcfg["display_order_position_change"],
             )
@@ -139,7 +137,7 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_driver_name"],
                 plr_bg_color=self.wcfg["background_color_player_driver_name"],
             )
-            self.bars_drv = self.set_rawtext(
+            self.bars_drv = self.set_tabletext(
                 width=self.drv_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -147,8 +145,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_drv[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_drv,
                 column=self.wcfg["display_order_driver"],
             )
@@ -160,7 +157,7 @@ class Realtime(Overlay):
                 plr_fg_color=self.wcfg["font_color_player_vehicle_name"],
                 plr_bg_color=self.wcfg["background_color_player_vehicle_name"],
             )
-            self.bars_veh = self.set_rawtext(
+            self.bars_veh = self.set_tabletext(
                 width=self.veh_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -168,8 +165,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_veh[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_veh,
                 column=self.wcfg["display_order_vehicle"],
             )
@@ -179,14 +175,13 @@ class Realtime(Overlay):
                 self.wcfg["background_color_brand_logo"],
                 self.wcfg["background_color_player_brand_logo"],
             )
-            self.bars_brd = self.set_rawimage(
+            self.bars_brd = self.set_tableimage(
                 width=self.brd_width,
                 fixed_height=font_m.height,
                 bg_color=self.bar_style_brd[0],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_brd,
                 column=self.wcfg["display_order_brand_logo"],
             )
@@ -210,16 +205,16 @@ class Realtime(Overlay):
                 -max(self.wcfg["nearest_time_gap_threshold_behind"], 0),
                 max(self.wcfg["nearest_time_gap_threshold_front"], 0),
             )
-            self.bars_gap = self.set_rawtext(
+            self.bars_gap = self.set_tabletext(
                 width=self.gap_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_gap[0][0],
                 bg_color=self.bar_style_gap[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_gap,
                 column=self.wcfg["display_order_time_gap"],
             )
@@ -243,16 +238,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_fastest_last_laptime"],
                 ),
             )
-            self.bars_lpt = self.set_rawtext(
+            self.bars_lpt = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_lpt[0][0],
                 bg_color=self.bar_style_lpt[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lpt,
                 column=self.wcfg["display_order_laptime"],
             )
@@ -268,7 +263,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_best_laptime"],
                 ),
             )
-            self.bars_blp = self.set_rawtext(
+            self.bars_blp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -276,8 +271,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_blp[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_blp,
                 column=self.wcfg["display_order_best_laptime"],
             )
@@ -293,7 +287,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_average_laptime"],
                 ),
             )
-            self.bars_alp = self.set_rawtext(
+            self.bars_alp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -301,8 +295,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_alp[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_alp,
                 column=self.wcfg["display_order_average_laptime"],
             )
@@ -318,7 +311,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_in_class"],
                 ),
             )
-            self.bars_pic = self.set_rawtext(
+            self.bars_pic = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -326,14 +319,13 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pic[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pic,
                 column=self.wcfg["display_order_position_in_class"],
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            self.bars_cls = self.set_rawtext(
+            self.bars_cls = self.set_tabletext(
                 width=self.cls_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -341,8 +333,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_class"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_cls,
                 column=self.wcfg["display_order_class"],
             )
@@ -374,7 +365,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_finish"],
                 ),
             )
-            self.bars_pit = self.set_rawtext(
+            self.bars_pit = self.set_tabletext(
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -382,8 +373,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pit[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pit,
                 column=self.wcfg["display_order_pit_status"],
             )
@@ -401,8 +391,7 @@ class Realtime(Overlay):
                 ),
             )
             self.bars_tcp = tuple(
-                MultiCompounds(
-                    parent=self,
+                TableCompounds(
                     count=self.count_tcp,
                     spacing=max(self.wcfg["tyre_compound_spacing"], 0),
                     padding=bar_padx,
@@ -414,8 +403,7 @@ class Realtime(Overlay):
                 )
                 for _ in range(self.veh_range)
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_tcp,
                 column=self.wcfg["display_order_tyre_compound"],
             )
@@ -439,7 +427,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_penalty_count"],
                 ),
             )
-            self.bars_psc = self.set_rawtext(
+            self.bars_psc = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -447,8 +435,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_psc[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_psc,
                 column=self.wcfg["display_order_pitstop_count"],
             )
@@ -476,7 +463,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_energy_remaining"],
                 ),
             )
-            self.bars_nrg = self.set_rawtext(
+            self.bars_nrg = self.set_tabletext(
                 width=self.nrg_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -484,8 +471,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_nrg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_nrg,
                 column=self.wcfg["display_order_energy_remaining"],
             )
@@ -509,7 +495,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_integrity"],
                 ),
             )
-            self.bars_dmg = self.set_rawtext(
+            self.bars_dmg = self.set_tabletext(
                 width=1 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -517,8 +503,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_dmg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_dmg,
                 column=self.wcfg["display_order_vehicle_integrity"],
             )
@@ -542,7 +527,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_incidents"],
                 ),
             )
-            self.bars_icd = self.set_rawtext(
+            self.bars_icd = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -550,8 +535,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_icd[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_icd,
                 column=self.wcfg["display_order_incidents"],
             )
@@ -567,7 +551,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_stint_laps"],
                 ),
             )
-            self.bars_stl = self.set_rawtext(
+            self.bars_stl = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -575,8 +559,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_stl[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_stl,
                 column=self.wcfg["display_order_stint_laps"],
             )
@@ -593,16 +576,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_speed_trap"],
                 ),
             )
-            self.bars_spd = self.set_rawtext(
+            self.bars_spd = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_spd[0][0],
                 bg_color=self.bar_style_spd[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_spd,
                 column=self.wcfg["display_order_speed_trap"],
             )
@@ -622,7 +605,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_lift_and_coast_time"],
                 ),
             )
-            self.bars_lic = self.set_rawtext(
+            self.bars_lic = self.set_tabletext(
                 width=4 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -630,8 +613,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_lic[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lic,
                 column=self.wcfg["display_order_lift_and_coast_time"],
             )
@@ -639,9 +621,10 @@ class Realtime(Overlay):
     def timerEvent(self, event):
         """Update when vehicle on track"""
         player_idx = minfo.vehicles.playerIndex
+        relative_snapshot = minfo.relative.snapshot
         relative_list = relative_data(
-            minfo.relative.relativeAhead,
-            minfo.relative.relativeBehind,
+            relative_snapshot.relativeAhead,
+            relative_snapshot.relativeBehind,
             player_idx,
             self.max_veh_front,
             self.max_veh_behind,
@@ -1164,15 +1147,18 @@ class Realtime(Overlay):
         )
 
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_image(
+        """Set brand logo, keep loaded logo in widget (shared cache may evict)"""
+        pixmap = self.pixmap_brandlogo.get(brand_name)
+        if pixmap is None:  # load & cache logo
+            pixmap = self.pixmap_brandlogo[brand_name] = image_cache.get(
+                ("brand_logo", brand_name, self.brd_width, self.brd_height),
+                load_brand_logo_image,
                 filepath=self.cfg.path.brand_logo,
                 filename=brand_name,
                 max_width=self.brd_width,
                 max_height=self.brd_height,
             )
-        return self.pixmap_brandlogo[brand_name]
+        return pixmap
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
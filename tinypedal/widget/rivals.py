@@ -29,7 +29,8 @@ from ..module_info import minfo
 from ..userfile.custom_image import load_brand_logo_image
 from ..userfile.heatmap import select_compound_color, select_compound_symbol
 from ._base import Overlay
-from ._painter import DeltaLapTime, MultiCompounds
+from ._cache import image_cache
+from ._painter import TableCompounds, TableDeltaLapTime
 
 
 class Realtime(Overlay):
@@ -38,8 +39,7 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
-        self.set_primary_layout(layout=layout)
+        self.table = self.set_table(gap_vert=self.wcfg["bar_gap"])
 
         # Config font
         font = self.config_font(
@@ -72,7 +72,7 @@ class Realtime(Overlay):
 
         # Driver position
         if self.wcfg["show_position"]:
-            self.bars_pos = self.set_rawtext(
+            self.bars_pos = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -80,8 +80,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_position"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pos,
                 column=self.wcfg["display_order_position"],
                 hide_start=1,
@@ -102,7 +101,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_position_loss"],
                 ),
             )
-            self.bars_pgl = self.set_rawtext(
+            self.bars_pgl = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -110,15 +109,14 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pgl[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pgl,
                 column=self.wcfg["display_order_position_change"],
                 hide_start=1,
             )
         # Driver name
         if self.wcfg["show_driver_name"]:
-            self.bars_drv = self.set_rawtext(
+            self.bars_drv = self.set_tabletext(
                 width=self.drv_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -126,15 +124,14 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_driver_name"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_drv,
                 column=self.wcfg["display_order_driver"],
                 hide_start=1,
             )
         # Vehicle name
         if self.wcfg["show_vehicle_name"]:
-            self.bars_veh = self.set_rawtext(
+            self.bars_veh = self.set_tabletext(
                 width=self.veh_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -142,22 +139,20 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_vehicle_name"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_veh,
                 column=self.wcfg["display_order_vehicle"],
                 hide_start=1,
             )
         # Brand logo
         if self.wcfg["show_brand_logo"]:
-            self.bars_brd = self.set_rawimage(
+            self.bars_brd = self.set_tableimage(
                 width=self.brd_width,
                 fixed_height=font_m.height,
                 bg_color=self.wcfg["background_color_brand_logo"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_brd,
                 column=self.wcfg["display_order_brand_logo"],
                 hide_start=1,
@@ -174,39 +169,39 @@ class Realtime(Overlay):
                     self.wcfg["background_color_time_interval_ahead"],
                 ),
             )
-            self.bars_int = self.set_rawtext(
+            self.bars_int = self.set_tabletext(
                 width=self.int_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_int[0][0],
                 bg_color=self.bar_style_int[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_int,
                 column=self.wcfg["display_order_time_interval"],
                 hide_start=1,
             )
         # Vehicle laptime
         if self.wcfg["show_laptime"]:
-            self.bars_lpt = self.set_rawtext(
+            self.bars_lpt = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_laptime"],
                 bg_color=self.wcfg["background_color_laptime"],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lpt,
                 column=self.wcfg["display_order_laptime"],
                 hide_start=1,
             )
         # Vehicle best laptime
         if self.wcfg["show_best_laptime"]:
-            self.bars_blp = self.set_rawtext(
+            self.bars_blp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -214,15 +209,14 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_best_laptime"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_blp,
                 column=self.wcfg["display_order_best_laptime"],
                 hide_start=1,
             )
         # Vehicle average laptime
         if self.wcfg["show_average_laptime"]:
-            self.bars_alp = self.set_rawtext(
+            self.bars_alp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -230,8 +224,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_average_laptime"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_alp,
                 column=self.wcfg["display_order_average_laptime"],
                 hide_start=1,
@@ -239,8 +232,7 @@ class Realtime(Overlay):
         # Delta laptime
         if self.wcfg["show_delta_laptime"]:
             self.bars_dlt = tuple(
-                DeltaLapTime(
-                    parent=self,
+                TableDeltaLapTime(
                     count=self.max_delta,
                     padding=bar_padx,
                     width=font_m.width * 4,
@@ -254,8 +246,7 @@ class Realtime(Overlay):
                 )
                 for _ in range(self.veh_range)
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_dlt,
                 column=self.wcfg["display_order_delta_laptime"],
                 hide_start=1,
@@ -266,7 +257,7 @@ class Realtime(Overlay):
                 self.wcfg["font_color_position_in_class"],
                 self.wcfg["background_color_position_in_class"]
             )
-            self.bars_pic = self.set_rawtext(
+            self.bars_pic = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -274,15 +265,14 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pic[1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pic,
                 column=self.wcfg["display_order_position_in_class"],
                 hide_start=1,
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            self.bars_cls = self.set_rawtext(
+            self.bars_cls = self.set_tabletext(
                 width=self.cls_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -290,8 +280,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_class"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_cls,
                 column=self.wcfg["display_order_class"],
                 hide_start=1,
@@ -324,7 +313,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_finish"],
                 ),
             )
-            self.bars_pit = self.set_rawtext(
+            self.bars_pit = self.set_tabletext(
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -332,8 +321,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pit[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pit,
                 column=self.wcfg["display_order_pit_status"],
                 hide_start=1,
@@ -342,8 +330,7 @@ class Realtime(Overlay):
         if self.wcfg["show_tyre_compound"]:
             self.count_tcp = 4 if self.wcfg["show_compound_for_each_wheel"] else 1
             self.bars_tcp = tuple(
-                MultiCompounds(
-                    parent=self,
+                TableCompounds(
                     count=self.count_tcp,
                     spacing=max(self.wcfg["tyre_compound_spacing"], 0),
                     padding=bar_padx,
@@ -355,8 +342,7 @@ class Realtime(Overlay):
                 )
                 for _ in range(self.veh_range)
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_tcp,
                 column=self.wcfg["display_order_tyre_compound"],
                 hide_start=1,
@@ -377,7 +363,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_penalty_count"],
                 ),
             )
-            self.bars_psc = self.set_rawtext(
+            self.bars_psc = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -385,8 +371,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_psc[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_psc,
                 column=self.wcfg["display_order_pitstop_count"],
                 hide_start=1,
@@ -411,7 +396,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_energy_remaining"],
                 ),
             )
-            self.bars_nrg = self.set_rawtext(
+            self.bars_nrg = self.set_tabletext(
                 width=self.nrg_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -419,8 +404,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_nrg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_nrg,
                 column=self.wcfg["display_order_energy_remaining"],
                 hide_start=1,
@@ -441,7 +425,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_vehicle_integrity"],
                 ),
             )
-            self.bars_dmg = self.set_rawtext(
+            self.bars_dmg = self.set_tabletext(
                 width=1 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -449,8 +433,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_dmg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_dmg,
                 column=self.wcfg["display_order_vehicle_integrity"],
                 hide_start=1,
@@ -471,7 +454,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_incidents_extreme"],
                 ),
             )
-            self.bars_icd = self.set_rawtext(
+            self.bars_icd = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -479,15 +462,14 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_icd[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_icd,
                 column=self.wcfg["display_order_incidents"],
                 hide_start=1,
             )
         # Stint laps
         if self.wcfg["show_stint_laps"]:
-            self.bars_stl = self.set_rawtext(
+            self.bars_stl = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -495,8 +477,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_stint_laps"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_stl,
                 column=self.wcfg["display_order_stint_laps"],
                 hide_start=1,
@@ -504,16 +485,16 @@ class Realtime(Overlay):
         # Speed trap
         if self.wcfg["show_speed_trap"]:
             self.unit_speed = units.set_unit_speed(self.cfg.units["speed_unit"])
-            self.bars_spd = self.set_rawtext(
+            self.bars_spd = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.wcfg["font_color_speed_trap"],
                 bg_color=self.wcfg["background_color_speed_trap"],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_spd,
                 column=self.wcfg["display_order_speed_trap"],
                 hide_start=1,
@@ -530,7 +511,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_lift_and_coast_highlight"],
                 ),
             )
-            self.bars_lic = self.set_rawtext(
+            self.bars_lic = self.set_tabletext(
                 width=4 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -538,8 +519,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_lic[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lic,
                 column=self.wcfg["display_order_lift_and_coast_time"],
                 hide_start=1,
@@ -954,15 +934,18 @@ class Realtime(Overlay):
         target.setHidden(not state)
 
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_image(
+        """Set brand logo, keep loaded logo in widget (shared cache may evict)"""
+        pixmap = self.pixmap_brandlogo.get(brand_name)
+        if pixmap is None:  # load & cache logo
+            pixmap = self.pixmap_brandlogo[brand_name] = image_cache.get(
+                ("brand_logo", brand_name, self.brd_width, self.brd_height),
+                load_brand_logo_image,
                 filepath=self.cfg.path.brand_logo,
                 filename=brand_name,
                 max_width=self.brd_width,
                 max_height=self.brd_height,
             )
-        return self.pixmap_brandlogo[brand_name]
+        return pixmap
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
@@ -77,6 +77,11 @@ class Realtime(Overlay):
             bg_color=self.wcfg["background_color_roll_angle_front"],
             last=0,
         )
+        self.bind_style(
+            self.bar_rollf,
+            fg="font_color_roll_angle_front",
+            bg="background_color_roll_angle_front",
+        )
         self.set_primary_orient(
             target=self.bar_rollf,
             column=self.wcfg["display_order_roll_angle_front"],
@@ -93,6 +98,11 @@ class Realtime(Overlay):
             bg_color=self.wcfg["background_color_roll_angle_rear"],
             last=0,
         )
+        self.bind_style(
+            self.bar_rollr,
+            fg="font_color_roll_angle_rear",
+            bg="background_color_roll_angle_rear",
+        )
         self.set_primary_orient(
             target=self.bar_rollr,
             column=self.wcfg["display_order_roll_angle_rear"],
@@ -114,6 +124,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_roll_angle_difference"],
                 bg_color=self.wcfg["background_color_roll_angle_difference"],
             )
+            self.bind_style(
+                self.bar_rolld,
+                fg="font_color_roll_angle_difference",
+                bg="background_color_roll_angle_difference",
+            )
             self.set_primary_orient(
                 target=self.bar_rolld,
                 column=self.wcfg["display_order_roll_angle_difference"],
@@ -131,6 +146,11 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_roll_angle_ratio"],
                 last=0,
             )
+            self.bind_style(
+                self.bar_ratio,
+                fg="font_color_roll_angle_ratio",
+                bg="background_color_roll_angle_ratio",
+            )
             self.set_primary_orient(
                 target=self.bar_ratio,
                 column=self.wcfg["display_order_roll_angle_ratio"],
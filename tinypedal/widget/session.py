@@ -67,6 +67,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_session_name"],
                 bg_color=self.wcfg["background_color_session_name"],
             )
+            self.bind_style(
+                self.bar_session_name,
+                fg="font_color_session_name",
+                bg="background_color_session_name",
+            )
             self.set_primary_orient(
                 target=self.bar_session_name,
                 column=self.wcfg["display_order_session_name"],
@@ -83,6 +88,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_system_clock"],
                 bg_color=self.wcfg["background_color_system_clock"],
             )
+            self.bind_style(
+                self.bar_system_clock,
+                fg="font_color_system_clock",
+                bg="background_color_system_clock",
+            )
             self.set_primary_orient(
                 target=self.bar_system_clock,
                 column=self.wcfg["display_order_system_clock"],
@@ -99,6 +109,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_session_time"],
                 bg_color=self.wcfg["background_color_session_time"],
             )
+            self.bind_style(
+                self.bar_session_time,
+                fg="font_color_session_time",
+                bg="background_color_session_time",
+            )
             self.set_primary_orient(
                 target=self.bar_session_time,
                 column=self.wcfg["display_order_session_time"],
@@ -119,6 +134,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_estimated_laps"],
                 bg_color=self.wcfg["background_color_estimated_laps"],
             )
+            self.bind_style(
+                self.bar_estimated_laps,
+                fg="font_color_estimated_laps",
+                bg="background_color_estimated_laps",
+            )
             self.set_primary_orient(
                 target=self.bar_estimated_laps,
                 column=self.wcfg["display_order_estimated_laps"],
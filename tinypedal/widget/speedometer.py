@@ -63,6 +63,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_speed"],
                 bg_color=self.wcfg["background_color_speed"],
             )
+            self.bind_style(self.bar_speed_curr, fg="font_color_speed", bg="background_color_speed")
             self.set_primary_orient(
                 target=self.bar_speed_curr,
                 column=self.wcfg["display_order_speed"],
@@ -77,6 +78,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_speed_minimum"],
                 bg_color=self.wcfg["background_color_speed_minimum"],
             )
+            self.bind_style(
+                self.bar_speed_min,
+                fg="font_color_speed_minimum",
+                bg="background_color_speed_minimum",
+            )
             self.set_primary_orient(
                 target=self.bar_speed_min,
                 column=self.wcfg["display_order_speed_minimum"],
@@ -91,6 +97,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_speed_maximum"],
                 bg_color=self.wcfg["background_color_speed_maximum"],
             )
+            self.bind_style(
+                self.bar_speed_max,
+                fg="font_color_speed_maximum",
+                bg="background_color_speed_maximum",
+            )
             self.set_primary_orient(
                 target=self.bar_speed_max,
                 column=self.wcfg["display_order_speed_maximum"],
@@ -105,6 +116,11 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_speed_fastest"],
                 bg_color=self.wcfg["background_color_speed_fastest"],
             )
+            self.bind_style(
+                self.bar_speed_fast,
+                fg="font_color_speed_fastest",
+                bg="background_color_speed_fastest",
+            )
             self.set_primary_orient(
                 target=self.bar_speed_fast,
                 column=self.wcfg["display_order_speed_fastest"],
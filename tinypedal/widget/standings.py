@@ -29,7 +29,8 @@ from ..module_info import minfo
 from ..userfile.custom_image import load_brand_logo_image
 from ..userfile.heatmap import select_compound_color, select_compound_symbol
 from ._base import Overlay
-from ._painter import DeltaLapTime, MultiCompounds
+from ._cache import image_cache
+from ._painter import TableCompounds, TableDeltaLapTime
 
 
 class Realtime(Overlay):
@@ -38,8 +39,7 @@ class Realtime(Overlay):
     def __init__(self, config, widget_name):
         # Assign base setting
         super().__init__(config, widget_name)
-        layout = self.set_grid_layout(gap_vert=self.wcfg["bar_gap"])
-        self.set_primary_layout(layout=layout)
+        self.table = self.set_table(gap_vert=self.wcfg["bar_gap"])
 
         # Config font
         font = self.config_font(
@@ -96,7 +96,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position"],
                 ),
             )
-            self.bars_pos = self.set_rawtext(
+            self.bars_pos = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -104,8 +104,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pos[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pos,
                 column=self.wcfg["display_order_position"],
                 hide_start=1,
@@ -130,7 +129,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_change"],
                 ),
             )
-            self.bars_pgl = self.set_rawtext(
+            self.bars_pgl = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -138,8 +137,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pgl[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pgl,
                 column=self.wcfg["display_order_position_change"],
                 hide_start=1,
@@ -156,7 +154,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_driver_name"],
                 ),
             )
-            self.bars_drv = self.set_rawtext(
+            self.bars_drv = self.set_tabletext(
                 width=self.drv_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -164,8 +162,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_drv[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_drv,
                 column=self.wcfg["display_order_driver"],
                 hide_start=1,
@@ -182,7 +179,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_name"],
                 ),
             )
-            self.bars_veh = self.set_rawtext(
+            self.bars_veh = self.set_tabletext(
                 width=self.veh_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -190,8 +187,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_veh[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_veh,
                 column=self.wcfg["display_order_vehicle"],
                 hide_start=1,
@@ -202,14 +198,13 @@ class Realtime(Overlay):
                 self.wcfg["background_color_brand_logo"],
                 self.wcfg["background_color_player_brand_logo"],
             )
-            self.bars_brd = self.set_rawimage(
+            self.bars_brd = self.set_tableimage(
                 width=self.brd_width,
                 fixed_height=font_m.height,
                 bg_color=self.bar_style_brd[0],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_brd,
                 column=self.wcfg["display_order_brand_logo"],
                 hide_start=1,
@@ -226,16 +221,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_time_gap"],
                 ),
             )
-            self.bars_gap = self.set_rawtext(
+            self.bars_gap = self.set_tabletext(
                 width=self.gap_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_gap[0][0],
                 bg_color=self.bar_style_gap[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_gap,
                 column=self.wcfg["display_order_time_gap"],
                 hide_start=1,
@@ -252,16 +247,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_time_interval"],
                 ),
             )
-            self.bars_int = self.set_rawtext(
+            self.bars_int = self.set_tabletext(
                 width=self.int_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_int[0][0],
                 bg_color=self.bar_style_int[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_int,
                 column=self.wcfg["display_order_time_interval"],
                 hide_start=1,
@@ -286,16 +281,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_fastest_last_laptime"],
                 ),
             )
-            self.bars_lpt = self.set_rawtext(
+            self.bars_lpt = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_lpt[0][0],
                 bg_color=self.bar_style_lpt[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lpt,
                 column=self.wcfg["display_order_laptime"],
                 hide_start=1,
@@ -312,7 +307,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_best_laptime"],
                 ),
             )
-            self.bars_blp = self.set_rawtext(
+            self.bars_blp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -320,8 +315,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_blp[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_blp,
                 column=self.wcfg["display_order_best_laptime"],
                 hide_start=1,
@@ -338,7 +332,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_average_laptime"],
                 ),
             )
-            self.bars_alp = self.set_rawtext(
+            self.bars_alp = self.set_tabletext(
                 width=8 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -346,8 +340,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_alp[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_alp,
                 column=self.wcfg["display_order_average_laptime"],
                 hide_start=1,
@@ -359,8 +352,7 @@ class Realtime(Overlay):
                 self.wcfg["background_color_player_delta_laptime"],
             )
             self.bars_dlt = tuple(
-                DeltaLapTime(
-                    parent=self,
+                TableDeltaLapTime(
                     count=self.max_delta,
                     padding=bar_padx,
                     width=font_m.width * 4,
@@ -375,8 +367,7 @@ class Realtime(Overlay):
                 )
                 for _ in range(self.veh_range)
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_dlt,
                 column=self.wcfg["display_order_delta_laptime"],
                 hide_start=1,
@@ -393,7 +384,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_position_in_class"],
                 ),
             )
-            self.bars_pic = self.set_rawtext(
+            self.bars_pic = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -401,15 +392,14 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pic[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pic,
                 column=self.wcfg["display_order_position_in_class"],
                 hide_start=1,
             )
         # Vehicle class
         if self.wcfg["show_class"]:
-            self.bars_cls = self.set_rawtext(
+            self.bars_cls = self.set_tabletext(
                 width=self.cls_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -417,8 +407,7 @@ class Realtime(Overlay):
                 bg_color=self.wcfg["background_color_class"],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_cls,
                 column=self.wcfg["display_order_class"],
                 hide_start=1,
@@ -451,7 +440,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_finish"],
                 ),
             )
-            self.bars_pit = self.set_rawtext(
+            self.bars_pit = self.set_tabletext(
                 width=max(map(len, self.pit_status_text)) * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -459,8 +448,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_pit[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_pit,
                 column=self.wcfg["display_order_pit_status"],
                 hide_start=1,
@@ -479,8 +467,7 @@ class Realtime(Overlay):
                 ),
             )
             self.bars_tcp = tuple(
-                MultiCompounds(
-                    parent=self,
+                TableCompounds(
                     count=self.count_tcp,
                     spacing=max(self.wcfg["tyre_compound_spacing"], 0),
                     padding=bar_padx,
@@ -492,8 +479,7 @@ class Realtime(Overlay):
                 )
                 for _ in range(self.veh_range)
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_tcp,
                 column=self.wcfg["display_order_tyre_compound"],
                 hide_start=1,
@@ -518,7 +504,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_penalty_count"],
                 ),
             )
-            self.bars_psc = self.set_rawtext(
+            self.bars_psc = self.set_tabletext(
                 width=2 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -526,8 +512,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_psc[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_psc,
                 column=self.wcfg["display_order_pitstop_count"],
                 hide_start=1,
@@ -556,7 +541,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_energy_remaining"],
                 ),
             )
-            self.bars_nrg = self.set_rawtext(
+            self.bars_nrg = self.set_tabletext(
                 width=self.nrg_width * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -564,8 +549,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_nrg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_nrg,
                 column=self.wcfg["display_order_energy_remaining"],
                 hide_start=1,
@@ -590,7 +574,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_vehicle_integrity"],
                 ),
             )
-            self.bars_dmg = self.set_rawtext(
+            self.bars_dmg = self.set_tabletext(
                 width=1 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -598,8 +582,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_dmg[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_dmg,
                 column=self.wcfg["display_order_vehicle_integrity"],
                 hide_start=1,
@@ -624,7 +607,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_incidents"],
                 ),
             )
-            self.bars_icd = self.set_rawtext(
+            self.bars_icd = self.set_tabletext(
                 width=3 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -632,8 +615,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_icd[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_icd,
                 column=self.wcfg["display_order_incidents"],
                 hide_start=1,
@@ -650,7 +632,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_stint_laps"],
                 ),
             )
-            self.bars_stl = self.set_rawtext(
+            self.bars_stl = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -658,8 +640,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_stl[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_stl,
                 column=self.wcfg["display_order_stint_laps"],
                 hide_start=1,
@@ -677,16 +658,16 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_speed_trap"],
                 ),
             )
-            self.bars_spd = self.set_rawtext(
+            self.bars_spd = self.set_tabletext(
                 width=5 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
                 fg_color=self.bar_style_spd[0][0],
                 bg_color=self.bar_style_spd[0][1],
                 count=self.veh_range,
+                cached=False,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_spd,
                 column=self.wcfg["display_order_speed_trap"],
                 hide_start=1,
@@ -707,7 +688,7 @@ class Realtime(Overlay):
                     self.wcfg["background_color_player_lift_and_coast_time"],
                 ),
             )
-            self.bars_lic = self.set_rawtext(
+            self.bars_lic = self.set_tabletext(
                 width=4 * font_m.width + bar_padx,
                 fixed_height=font_m.height,
                 offset_y=font_m.voffset,
@@ -715,8 +696,7 @@ class Realtime(Overlay):
                 bg_color=self.bar_style_lic[0][1],
                 count=self.veh_range,
             )
-            self.set_grid_layout_table_column(
-                layout=layout,
+            self.table.add_column(
                 targets=self.bars_lic,
                 column=self.wcfg["display_order_lift_and_coast_time"],
                 hide_start=1,
@@ -724,7 +704,7 @@ class Realtime(Overlay):
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
-        standings_list = minfo.relative.standings
+        standings_list = minfo.relative.snapshot.standings
         total_std_idx = len(standings_list) - 1  # skip final -1 index
         player_idx = minfo.vehicles.playerIndex
         plr_veh_info = minfo.vehicles.dataSet[player_idx]
@@ -1206,15 +1186,18 @@ class Realtime(Overlay):
             target.setFixedHeight(self.height_def)
 
     def set_brand_logo(self, brand_name: str):
-        """Set brand logo"""
-        if brand_name not in self.pixmap_brandlogo:  # load & cache logo
-            self.pixmap_brandlogo[brand_name] = load_brand_logo_image(
+        """Set brand logo, keep loaded logo in widget (shared cache may evict)"""
+        pixmap = self.pixmap_brandlogo.get(brand_name)
+        if pixmap is None:  # load & cache logo
+            pixmap = self.pixmap_brandlogo[brand_name] = image_cache.get(
+                ("brand_logo", brand_name, self.brd_width, self.brd_height),
+                load_brand_logo_image,
                 filepath=self.cfg.path.brand_logo,
                 filename=brand_name,
                 max_width=self.brd_width,
                 max_height=self.brd_height,
             )
-        return self.pixmap_brandlogo[brand_name]
+        return pixmap
 
     def set_class_style(self, class_name: str):
         """Compare vehicle class name with user defined dictionary"""
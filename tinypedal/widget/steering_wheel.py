@@ -27,6 +27,7 @@ from ..api_control import api
 from ..const_file import ImageFile
 from ..userfile.custom_image import load_custom_image
 from ._base import Overlay
+from ._cache import image_cache
 
 
 class Realtime(Overlay):
@@ -63,7 +64,9 @@ class Realtime(Overlay):
         else:
             image_file = ""
 
-        self.pixmap_wheel = load_custom_image(
+        self.pixmap_wheel = image_cache.get(
+            (ImageFile.STEERING_WHEEL, image_file, image_size),
+            load_custom_image,
             user_file=image_file,
             default_file=ImageFile.STEERING_WHEEL,
             width=image_size,
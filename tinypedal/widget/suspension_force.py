@@ -70,6 +70,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_caption"],
                 bg_color=self.wcfg["background_color_caption"],
             )
+            self.bind_style(cap_bar, fg="font_color_caption", bg="background_color_caption")
             self.set_primary_orient(
                 target=cap_bar,
                 column=0,
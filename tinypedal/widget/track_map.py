@@ -26,7 +26,7 @@ from PySide2.QtGui import QBrush, QPainter, QPainterPath, QPen, QPixmap
 from .. import calculation as calc
 from ..api_control import api
 from ..formatter import random_color_class
-from ..module_info import minfo
+from ..module_info import DistanceSeries, MappingSnapshot, minfo
 from ..validator import vehicle_position_interp
 from ._base import Overlay
 
@@ -120,7 +120,9 @@ class Realtime(Overlay):
             self.gen_position_interp = vehicle_position_interp()
 
         # Last data
-        self.last_modified = 0
+        self.last_modified = None
+        self.map_sectors = None
+        self.map_dists = None
         self.last_veh_data_version = None
         self.circular_map = True
         self.map_scaled = None
@@ -129,13 +131,12 @@ class Realtime(Overlay):
         self.map_offset = (0, 0)
         self.map_orient = 0.0  # radians
 
-        self.update_map(-1)
+        self.update_map(MappingSnapshot())
 
     def timerEvent(self, event):
         """Update when vehicle on track"""
         # Map
-        modified = minfo.mapping.lastModified
-        self.update_map(modified)
+        self.update_map(minfo.mapping.snapshot)
 
         # Vehicles
         veh_data_version = minfo.vehicles.dataSetVersion
@@ -144,12 +145,14 @@ class Realtime(Overlay):
             self.update()
 
     # GUI update methods
-    def update_map(self, data):
+    def update_map(self, snapshot: MappingSnapshot):
         """Map update"""
-        if self.last_modified != data:
-            self.last_modified = data
-            raw_data = minfo.mapping.coordinates if data != -1 else None
-            map_sector_paths, map_full_path = self.create_map_path(raw_data)
+        if self.last_modified != snapshot.lastModified:
+            self.last_modified = snapshot.lastModified
+            self.map_sectors = snapshot.sectors
+            self.map_dists = snapshot.elevations
+            map_sector_paths, map_full_path = self.create_map_path(
+                snapshot.coordinates, snapshot.coordinatesLOD)
             self.draw_map_image(map_sector_paths, map_full_path, self.circular_map)
             if self.wcfg["show_proximity_circle"]:
                 self.update_proximity_rect()
@@ -162,13 +165,13 @@ class Realtime(Overlay):
 
         if self.map_scaled:
             self.draw_vehicle_on_map(
-                painter, minfo.vehicles.dataSet, minfo.relative.drawOrder
+                painter, minfo.vehicles.dataSet, minfo.relative.snapshot.drawOrder
             )
             if self.wcfg["show_safety_car"] and api.read.lap.safety_car_active():
                 self.draw_safetycar_on_map(painter, self.map_scaled)
         else:
             self.draw_vehicle_on_circle(
-                painter, minfo.vehicles.dataSet, minfo.relative.drawOrder
+                painter, minfo.vehicles.dataSet, minfo.relative.snapshot.drawOrder
             )
         if self.wcfg["show_pitout_prediction"]:
             self.draw_pitout_prediction(
@@ -177,10 +180,10 @@ class Realtime(Overlay):
                 minfo.vehicles.dataSet[minfo.vehicles.playerIndex],
             )
 
-    def create_map_path(self, raw_coords=None):
-        """Create map path"""
+    def create_map_path(self, raw_coords=None, map_lod=None):
+        """Create map path, use map LOD level that fits display scale"""
         map_sector_paths = []
-        sectors_index = minfo.mapping.sectors
+        sectors_index = self.map_sectors
         if raw_coords and isinstance(sectors_index, tuple):
             dist = calc.distance(raw_coords[0], raw_coords[-1])
             angle = max(int(self.wcfg["display_orientation"]), 0)
@@ -189,16 +192,17 @@ class Realtime(Overlay):
             (self.map_scaled, self.map_range, self.map_scale, self.map_offset
              ) = calc.scale_map(raw_coords, self.area_size, self.area_margin, angle)
 
-            total_nodes = len(self.map_scaled) - 1
-            skip_node = calc.skip_map_nodes(total_nodes, self.temp_map_size * 3, self.display_detail_level)
-            last_skip = 0
+            map_scaled = self.map_scaled
+            map_nodes = calc.select_map_lod(map_lod, self.map_scale, self.display_detail_level)
+            if map_nodes is None:  # full detail
+                map_nodes = range(len(map_scaled))
 
             sectors_indexes = (0, *sectors_index)
             map_sector_path = None
             # Map sector path
-            for index, coords in enumerate(self.map_scaled):
+            for index in map_nodes:
+                coords = map_scaled[index]
                 if index in sectors_indexes:
-                    last_skip = 0
                     if map_sector_path:  # close previous sector path
                         map_sector_path.lineTo(*coords)
                     # Create new sector path
@@ -206,28 +210,16 @@ class Realtime(Overlay):
                     map_sector_path.moveTo(*coords)
                     # Add to sector path list
                     map_sector_paths.append(map_sector_path)
-                elif index >= total_nodes:  # don't skip last node
-                    map_sector_path.lineTo(*coords)
-                elif last_skip >= skip_node:
+                else:
                     map_sector_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
 
             # Map full path
             map_full_path = QPainterPath()
-            for index, coords in enumerate(self.map_scaled):
-                if index in sectors_indexes:
-                    last_skip = 0
-                    if index == 0:
-                        map_full_path.moveTo(*coords)
-                    else:
-                        map_full_path.lineTo(*coords)
-                elif index >= total_nodes:  # don't skip last node
-                    map_full_path.lineTo(*coords)
-                elif last_skip >= skip_node:
-                    map_full_path.lineTo(*coords)
-                    last_skip = 0
-                last_skip += 1
+            for index in map_nodes:
+                if index == 0:
+                    map_full_path.moveTo(*map_scaled[index])
+                else:
+                    map_full_path.lineTo(*map_scaled[index])
 
             # Close map loop if start & end distance less than 500 meters
             if dist < 500:
@@ -311,7 +303,7 @@ class Realtime(Overlay):
                 painter.drawLine(pos_x1, pos_y1, pos_x2, pos_y2)
 
             # Sector lines
-            sectors_index = minfo.mapping.sectors
+            sectors_index = self.map_sectors
             if self.wcfg["show_sector_line"] and isinstance(sectors_index, tuple):
                 pen.setWidth(self.wcfg["sector_line_width"])
                 pen.setColor(self.wcfg["sector_line_color"])
@@ -422,7 +414,7 @@ class Realtime(Overlay):
         # Verify data set
         if not map_data:  # x, y coords
             return
-        dist_data = minfo.mapping.elevations
+        dist_data = self.map_dists
         if not dist_data:  # distance, z coords
             return
         dist_end_index = min(len(dist_data), len(map_data)) - 1
@@ -465,14 +457,14 @@ class Realtime(Overlay):
         # Verify data set
         if not map_data:  # x, y coords
             return
-        dist_data = minfo.mapping.elevations
+        dist_data = self.map_dists
         if not dist_data:  # distance, z coords
             return
         deltabest_data = minfo.delta.deltaBestData  # distance, seconds
-        deltabest_max_index = len(deltabest_data) - 1
+        deltabest_max_index = len(deltabest_data.distance) - 1
         if deltabest_max_index < 2:
             return
-        laptime_best = deltabest_data[-1][1]
+        laptime_best = deltabest_data.value[-1]
         laptime_pace = minfo.delta.lapTimePace
         if laptime_best < 1 or laptime_pace < 1:
             return
@@ -642,7 +634,7 @@ def target_pitstop_duration(pit_timer: float, min_pit_time: float, pit_time_incr
     return min_pit_time + pit_time_increment * overflow_increments
 
 
-def target_node_time(position: float, delta_data: tuple, max_index: int, laptime_scale: float) -> float:
+def target_node_time(position: float, delta_data: DistanceSeries, max_index: int, laptime_scale: float) -> float:
     """Calculate target node time from target position and deltabest dataset"""
-    pitin_node_index = calc.binary_search_higher_column(delta_data, position, 0, max_index, 0)
-    return delta_data[pitin_node_index][1] / laptime_scale
+    pitin_node_index = calc.binary_search_higher(delta_data.distance, position, 0, max_index)
+    return delta_data.value[pitin_node_index] / laptime_scale
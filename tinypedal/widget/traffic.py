@@ -155,8 +155,9 @@ class Realtime(Overlay):
         leader_overtake_index = minfo.vehicles.leaderIndex
 
         if player_laptime > 0:
-            relative_ahead = minfo.relative.relativeAhead
-            relative_behind = minfo.relative.relativeBehind
+            relative_snapshot = minfo.relative.snapshot
+            relative_ahead = relative_snapshot.relativeAhead
+            relative_behind = relative_snapshot.relativeBehind
             delta_time_interval_ahead = minfo.relative.relativeDeltaAhead
             delta_time_interval_behind = minfo.relative.relativeDeltaBehind
 
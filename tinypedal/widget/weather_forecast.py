@@ -37,6 +37,7 @@ from ..const_file import ImageFile
 from ..process.weather import WeatherNode
 from ..userfile.custom_image import split_pixmap_image
 from ._base import Overlay
+from ._cache import image_cache
 from ._painter import ProgressBar
 
 
@@ -70,7 +71,8 @@ class Realtime(Overlay):
         self.unit_temp = units.set_unit_temperature(self.cfg.units["temperature_unit"])
 
         # Config canvas
-        self.pixmap_weather = create_weather_icon_set(icon_size)
+        self.pixmap_weather = image_cache.get(
+            (ImageFile.WEATHER, icon_size), create_weather_icon_set, icon_size)
         self.pixmap_rainchance = QPixmap(self.bar_width, self.bar_rain_height)
 
         # Estimated time
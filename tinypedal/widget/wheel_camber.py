@@ -65,6 +65,7 @@ class Realtime(Overlay):
                 fg_color=self.wcfg["font_color_caption"],
                 bg_color=self.wcfg["background_color_caption"],
             )
+            self.bind_style(cap_camber, fg="font_color_caption", bg="background_color_caption")
             self.set_primary_orient(
                 target=cap_camber,
                 column=0,
@@ -86,6 +87,7 @@ class Realtime(Overlay):
             count=4,
             last=0,
         )
+        self.bind_style(self.bars_camber, fg="font_color_camber", bg="background_color_camber")
         self.set_grid_layout_quad(
             layout=layout_camber,
             targets=self.bars_camber,
@@ -112,6 +114,11 @@ class Realtime(Overlay):
                 count=2,
                 last=0,
             )
+            self.bind_style(
+                self.bars_cdiff,
+                fg="font_color_camber_difference",
+                bg="background_color_camber_difference",
+            )
             self.set_grid_layout_vert(
                 layout=layout_camber,
                 targets=self.bars_cdiff,